@@ -1,4 +1,7 @@
-import pprint
+import argparse
+import sys
+from typing import TextIO
+
 from building_scheduler.employee import Employee, EmployeeRole
 from building_scheduler.roster import Roster
 from building_scheduler.building_scheduler import BuildingScheduler
@@ -7,25 +10,43 @@ from building_scheduler.building import (
     SingleStoreyHome,
     TwoStoreyHome,
 )
+from building_scheduler.loaders import load_buildings, load_roster
+from building_scheduler.serializers import (
+    iter_assignment_records,
+    iter_remaining_records,
+    write_jsonl,
+)
 
-def schedule(buildings: list, employees: set):
-    roster = Roster(employees)
+def schedule(buildings, employees, output: TextIO = sys.stdout):
+    """
+    Schedule the week and stream it to `output` as JSON Lines: one line per
+    assignment as each building is staffed, then one line per remaining
+    building.
+
+    `buildings` may be a list or an already loaded `BuildingQueue`, and
+    `employees` a collection of employees or an already loaded `Roster`.
+    """
+    roster = employees if isinstance(employees, Roster) else Roster(employees)
     scheduler = BuildingScheduler(buildings, roster)
 
-    scheduler.generate_weekly_schedule()
+    write_jsonl(iter_assignment_records(scheduler.iter_weekly_schedule()), output)
+    write_jsonl(iter_remaining_records(scheduler.remaining_buildings), output)
 
-    print("******** Weekly Schedule ********")
-    print(scheduler.daily_schedules)
-    print("Remaining Buildings")
-    print(scheduler.remaining_buildings)
 
-    print("******** Prettier, slightly out of order output ********")
-    pp = pprint.PrettyPrinter(indent=4)
-    pp.pprint(scheduler.daily_schedules)
-    print("Remaining Buildings")
-    pp.pprint(scheduler.remaining_buildings)
+def schedule_files(buildings_path: str, employees_path: str, output: TextIO = sys.stdout) -> list:
+    """
+    Load buildings and employees from CSV/JSON Lines files and schedule them.
 
-if __name__ == "__main__":
+    Returns the `LoadError`s for rows that were skipped.
+    """
+    errors = []
+    queue = load_buildings(buildings_path, errors=errors)
+    roster = load_roster(employees_path, errors=errors)
+    schedule(queue, roster, output)
+    return errors
+
+
+def demo():
     buildings = [
         CommercialBuilding(),
         CommercialBuilding(),
@@ -38,7 +59,7 @@ if __name__ == "__main__":
         TwoStoreyHome(),
     ]
 
-    employees = {
+    employees = [
         Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli"),
         Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Chelly"),
         Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charles"),
@@ -47,6 +68,28 @@ if __name__ == "__main__":
         Employee(EmployeeRole.PENDING_INSTALLER, "Apprentice Arnold"),
         Employee(EmployeeRole.LABOURER, "Labourer Liam", ["Monday"]),
         Employee(EmployeeRole.LABOURER, "Labourer Lindsay"),
-    }
+    ]
 
-    schedule(buildings, employees)
\ No newline at end of file
+    schedule(buildings, employees)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Schedule installation crews for the week")
+    parser.add_argument("--buildings", help="CSV or JSON Lines file of buildings, in priority order")
+    parser.add_argument("--employees", help="CSV or JSON Lines file of employees")
+    args = parser.parse_args(argv)
+
+    if not args.buildings and not args.employees:
+        demo()
+        return 0
+    if not (args.buildings and args.employees):
+        parser.error("--buildings and --employees must be given together")
+
+    errors = schedule_files(args.buildings, args.employees)
+    for error in errors:
+        print(error, file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+""" Scheduler Benchmarks
+
+Times the scheduling hot paths on seeded synthetic rosters and building
+queues, writes the results as JSON, and can compare a run against a saved
+baseline.
+
+    python3 benchmarks/bench.py --output results.json
+    python3 benchmarks/bench.py --sizes 10 1000 --compare baseline.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from building_scheduler.building import CommercialBuilding  # noqa: E402
+from building_scheduler.building_scheduler import BuildingScheduler  # noqa: E402
+from building_scheduler.employee import EmployeeRole  # noqa: E402
+from building_scheduler.roster import Roster  # noqa: E402
+from building_scheduler.synthetic import (  # noqa: E402
+    generate_buildings,
+    generate_employees,
+)
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+
+
+# Shortest sample worth timing, as in `timeit.Timer.autorange`
+MIN_SAMPLE_SECONDS = 0.2
+
+
+def time_loop(number: int, setup, run) -> float:
+    """
+    Wall time of `number` calls of `run`, each on fresh state from `setup`,
+    which is built before the clock starts.  The garbage collector is off
+    while timing, as in `timeit`.
+    """
+    states = [setup() for _ in range(number)]
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for state in states:
+            run(state)
+        return time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def autorange(setup, run) -> int:
+    """
+    Calls per sample: the first of 1, 2, 5, 10, 20, 50, ... that takes at
+    least `MIN_SAMPLE_SECONDS`, so sub-millisecond calls are timed in a loop
+    instead of against the timer's resolution.
+    """
+    scale = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            number = scale * multiplier
+            if time_loop(number, setup, run) >= MIN_SAMPLE_SECONDS:
+                return number
+        scale *= 10
+
+
+def best_of(repeat: int, setup, run) -> float:
+    """
+    Best per-call wall time over `repeat` samples of `autorange()` calls
+    each; `setup` builds fresh state for each call and is not timed.
+    """
+    number = autorange(setup, run)
+    return min(time_loop(number, setup, run) for _ in range(repeat)) / number
+
+
+def bench_get_available_employees(size: int, repeat: int) -> float:
+    roster = Roster(generate_employees(size))
+    return best_of(
+        repeat,
+        lambda: roster,
+        lambda roster: roster.get_available_employees("Wednesday", EmployeeRole.ANY),
+    )
+
+
+def bench_meets_worker_requirements(size: int, repeat: int) -> float:
+    roster = Roster(generate_employees(size))
+    requirements = CommercialBuilding().worker_requirements
+    return best_of(
+        repeat,
+        lambda: roster,
+        lambda roster: roster.meets_worker_requirements("Wednesday", requirements),
+    )
+
+
+def bench_generate_daily_schedule(size: int, repeat: int) -> float:
+    employees = generate_employees(size)
+    buildings = generate_buildings(size)
+    return best_of(
+        repeat,
+        lambda: BuildingScheduler(buildings, Roster(employees)),
+        lambda scheduler: scheduler.generate_daily_schedule("Monday"),
+    )
+
+
+def bench_generate_weekly_schedule(size: int, repeat: int) -> float:
+    employees = generate_employees(size)
+    buildings = generate_buildings(size)
+    return best_of(
+        repeat,
+        lambda: BuildingScheduler(buildings, Roster(employees)),
+        lambda scheduler: scheduler.generate_weekly_schedule(),
+    )
+
+
+BENCHMARKS = {
+    "roster.get_available_employees": bench_get_available_employees,
+    "roster.meets_worker_requirements": bench_meets_worker_requirements,
+    "scheduler.generate_daily_schedule": bench_generate_daily_schedule,
+    "scheduler.generate_weekly_schedule": bench_generate_weekly_schedule,
+}
+
+
+def run(sizes: list[int], repeat: int, selected: list[str]) -> dict:
+    results = []
+    for name in selected:
+        for size in sizes:
+            seconds = BENCHMARKS[name](size, repeat)
+            results.append({"benchmark": name, "size": size, "seconds": seconds})
+            print(f"{name:40} {size:>8} {seconds * 1000:10.3f} ms", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Describe every result more than `threshold` (a fraction) slower than the
+    matching baseline result.
+    """
+    baseline_times = {
+        (result["benchmark"], result["size"]): result["seconds"]
+        for result in baseline["results"]
+    }
+    regressions = []
+    for result in current["results"]:
+        key = (result["benchmark"], result["size"])
+        if key not in baseline_times:
+            continue
+        before = baseline_times[key]
+        after = result["seconds"]
+        if before > 0 and after > before * (1 + threshold):
+            regressions.append(
+                f"{key[0]} size={key[1]}: {before * 1000:.3f} ms -> "
+                f"{after * 1000:.3f} ms ({after / before - 1:+.0%})"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--benchmark", action="append", choices=sorted(BENCHMARKS))
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="fractional slowdown counted as a regression (default 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    current = run(args.sizes, args.repeat, args.benchmark or list(BENCHMARKS))
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(current, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
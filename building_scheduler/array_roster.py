@@ -0,0 +1,120 @@
+""" Array Roster
+
+Optional NumPy backend for `Roster`.  Install with `pip install .[numpy]`.
+"""
+
+from typing import Iterable
+
+from building_scheduler.employee import Employee, ASSIGNABLE_EMPLOYEE_ROLES, DAY_BITS
+from building_scheduler.requirements import ALL_ROLES, compile_requirements, role_supply
+from building_scheduler.roster import Roster, WEEKDAYS
+from building_scheduler.stats import SchedulerStats
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+ROLE_CODES = {role: code for code, role in enumerate(ASSIGNABLE_EMPLOYEE_ROLES)}
+
+
+class ArrayRoster(Roster):
+    """
+    Roster holding availability as an employees x days boolean matrix and roles
+    as a vector of integer codes.
+
+    Free pools and counters are derived from the matrix with array operations,
+    and `feasible_many()` checks a whole batch of requirement vectors at once.
+    Pools keep the same order as `Roster`, so schedules are identical.
+    """
+
+    def __init__(
+        self,
+        employees: Iterable[Employee] = (),
+        stats: SchedulerStats = None,
+        selection=None,
+        calendar=None,
+    ):
+        if np is None:
+            raise ImportError("ArrayRoster requires numpy: pip install .[numpy]")
+        employees = list(employees)
+        days = WEEKDAYS if calendar is None else calendar.days
+        day_bits = DAY_BITS if calendar is None else calendar.day_bits
+        # One row per distinct employee: `Roster` pools hold an employee listed
+        # twice only once
+        self._row_employees = list(dict.fromkeys(employees))
+        self.role_codes = np.array(
+            [ROLE_CODES.get(emp.role, -1) for emp in self._row_employees], dtype=np.int8
+        )
+        masks = np.array([emp.days_off_mask for emp in self._row_employees], dtype=np.int64)
+        self._day_bit_vector = np.array([day_bits[day] for day in days], dtype=np.int64)
+        self.availability = (masks[:, None] & self._day_bit_vector[None, :]) == 0
+        self._rows = {emp: row for row, emp in enumerate(self._row_employees)}
+        self._day_index = {day: index for index, day in enumerate(days)}
+        super().__init__(employees, stats, selection, calendar)
+
+    def add_employee(self, employee: Employee):
+        if employee not in self._rows:
+            self.role_codes = np.append(
+                self.role_codes, np.int8(ROLE_CODES.get(employee.role, -1))
+            )
+            self.availability = np.vstack(
+                [self.availability, (employee.days_off_mask & self._day_bit_vector) == 0]
+            )
+            self._rows[employee] = len(self._row_employees)
+            self._row_employees.append(employee)
+        super().add_employee(employee)
+
+    def set_day_off(self, employee: Employee, day: str, off: bool = True):
+        super().set_day_off(employee, day, off)
+        self.availability[self._rows[employee], self._day_index[day]] = not self.is_off(
+            employee, day
+        )
+
+    def _build_pools(self, day: str):
+        free = self.availability[:, self._day_index[day]].copy()
+        busy = self.scheduled[day] | self.leave.get(day, set())
+        free[[self._rows[emp] for emp in busy if emp in self._rows]] = False
+        counts = {}
+        for role, code in ROLE_CODES.items():
+            rows = np.flatnonzero(free & (self.role_codes == code)).tolist()
+            self._free[(day, role)] = dict.fromkeys(self._row_employees[row] for row in rows)
+            counts[role] = len(rows)
+        self.free_counts[day] = counts
+        if self.stats is not None:
+            self.stats.employees_scanned += len(self.employees)
+
+    def role_count_matrix(self):
+        """
+        Days x roles matrix of employees still free, in day and
+        `ASSIGNABLE_EMPLOYEE_ROLES` order.
+        """
+        return np.array(
+            [
+                [self.free_counts[day][role] for role in ASSIGNABLE_EMPLOYEE_ROLES]
+                for day in self.scheduled
+            ],
+            dtype=np.int64,
+        ).reshape(len(self.scheduled), len(ASSIGNABLE_EMPLOYEE_ROLES))
+
+    def feasible_many(self, day: str, requirements_list: list):
+        """
+        Vectorized `fits()` over a batch of requirement vectors for `day`: the
+        whole Hall check is one requirements x role-masks comparison.
+        """
+        if self.stats is not None:
+            self.stats.availability_checks += len(requirements_list)
+        supply = np.array(role_supply(self.free_counts[day]), dtype=np.int64)
+        return (requirement_arrays(requirements_list) <= supply[None, :]).all(axis=1)
+
+
+def requirement_arrays(requirements_list: list):
+    """
+    Pack requirement vectors into a requirements x role-masks array of the
+    slots each set of roles has to cover, see `WorkerRequirements.demand`.
+    """
+    demand = np.zeros((len(requirements_list), ALL_ROLES + 1), dtype=np.int64)
+    for row, requirements in enumerate(requirements_list):
+        demand[row] = compile_requirements(requirements).demand
+    return demand
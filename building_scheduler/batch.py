@@ -0,0 +1,131 @@
+""" Batch Scheduling """
+
+import os
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, NamedTuple, Optional
+
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.roster import Roster
+
+
+class BatchResult(NamedTuple):
+    """
+    Outcome of one (buildings, employees) job.  On failure `daily_schedules`
+    and `remaining_buildings` are None and `error` holds the formatted
+    exception.
+    """
+
+    index: int
+    daily_schedules: Optional[dict]
+    remaining_buildings: Optional[list]
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def schedule_job(buildings, employees, engine=None) -> BuildingScheduler:
+    scheduler = BuildingScheduler(buildings, Roster(employees), engine=engine)
+    scheduler.generate_weekly_schedule()
+    return scheduler
+
+
+def _run_chunk(chunk: list, engine) -> list[BatchResult]:
+    results = []
+    for index, (buildings, employees) in chunk:
+        try:
+            scheduler = schedule_job(buildings, employees, engine)
+        except Exception:
+            results.append(BatchResult(index, None, None, traceback.format_exc()))
+        else:
+            results.append(
+                BatchResult(
+                    index,
+                    scheduler.daily_schedules,
+                    list(scheduler.remaining_buildings),
+                )
+            )
+    return results
+
+
+def _failed(chunk: list, error: str) -> list[BatchResult]:
+    return [BatchResult(index, None, None, error) for index, _ in chunk]
+
+
+def _collect(executor: Executor, chunks: dict, engine) -> tuple[dict, dict]:
+    """
+    Run numbered `chunks` on `executor`.  Returns chunk number -> results,
+    and chunk number -> error for the chunks cut short by a broken pool.
+    """
+    futures = {}
+    broken = {}
+    for number, chunk in chunks.items():
+        try:
+            futures[number] = executor.submit(_run_chunk, chunk, engine)
+        except BrokenProcessPool:
+            broken[number] = traceback.format_exc()
+    results = {}
+    for number, future in futures.items():
+        try:
+            results[number] = future.result()
+        except BrokenProcessPool:
+            broken[number] = traceback.format_exc()
+        except Exception:
+            results[number] = _failed(chunks[number], traceback.format_exc())
+    return results, broken
+
+
+def schedule_batch(
+    jobs: Iterable,
+    max_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    engine=None,
+    executor: Optional[Executor] = None,
+) -> list[BatchResult]:
+    """
+    Schedule many independent (buildings, employees) jobs across a process pool.
+
+    Jobs are sent in chunks so each worker round trip carries several jobs.
+    Results come back in job order regardless of which worker finished first.
+    A job that raises only fails itself.  A worker that dies breaks its
+    whole pool, failing every chunk still outstanding, so those chunks are
+    rerun in a fresh pool, and any that break that one too are rerun one at
+    a time; only a chunk that kills a worker of its own is marked failed.
+
+    Pass `executor` to reuse an existing pool; it is left running.  Reruns
+    always use new pools of their own.
+    """
+    indexed_jobs = list(enumerate(jobs))
+    if not indexed_jobs:
+        return []
+
+    max_workers = max_workers or os.cpu_count() or 1
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    if chunksize is None:
+        chunksize = max(1, len(indexed_jobs) // (max_workers * 4))
+
+    chunks = {
+        number: indexed_jobs[start:start + chunksize]
+        for number, start in enumerate(range(0, len(indexed_jobs), chunksize))
+    }
+    try:
+        results, broken = _collect(executor, chunks, engine)
+    finally:
+        if own_executor:
+            executor.shutdown()
+    if broken:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(broken))) as retry:
+            retried, broken = _collect(retry, {number: chunks[number] for number in broken}, engine)
+        results.update(retried)
+    for number, error in broken.items():
+        with ProcessPoolExecutor(max_workers=1) as alone:
+            retried, still_broken = _collect(alone, {number: chunks[number]}, engine)
+        results.update(retried)
+        if still_broken:
+            results[number] = _failed(chunks[number], still_broken[number])
+    return [result for number in range(len(chunks)) for result in results[number]]
@@ -1,50 +1,212 @@
 """ Building """
 
 from abc import ABCMeta, abstractmethod
+from array import array
+from typing import Iterable, NamedTuple
+
 from building_scheduler.roster import EmployeeRole
+from building_scheduler.requirements import WorkerRequirements, compile_requirements
+
+
+# Building class -> (last worker_requirements tuple seen, its compiled form)
+_COMPILED_REQUIREMENTS = {}
 
 
 class Building(metaclass=ABCMeta):
+    # Consecutive working days the same crew spends on the install
+    DURATION = 1
+
     @property
     @abstractmethod
     def worker_requirements(self):
         pass
 
+    @property
+    def duration(self) -> int:
+        return self.DURATION
+
+    @property
+    def requirements(self) -> WorkerRequirements:
+        """
+        `worker_requirements` compiled.  A class returning the same tuple every
+        time, like the predefined ones, is answered from a per-class cache;
+        anything else is compiled once per distinct list of slots.
+        """
+        worker_requirements = self.worker_requirements
+        cached = _COMPILED_REQUIREMENTS.get(type(self))
+        if cached is not None and cached[0] is worker_requirements:
+            return cached[1]
+        compiled = compile_requirements(worker_requirements)
+        if type(worker_requirements) is tuple:
+            _COMPILED_REQUIREMENTS[type(self)] = (worker_requirements, compiled)
+        return compiled
+
 
 class SingleStoreyHome(Building):
+    WORKER_REQUIREMENTS = (EmployeeRole.CERTIFIED_INSTALLER,)
+
     @property
     def worker_requirements(self):
-        return [EmployeeRole.CERTIFIED_INSTALLER]
+        return self.WORKER_REQUIREMENTS
 
     def __repr__(self):
         return "Single Storey Home"
 
 
 class TwoStoreyHome(Building):
+    WORKER_REQUIREMENTS = (
+        EmployeeRole.CERTIFIED_INSTALLER,
+        (EmployeeRole.LABOURER, EmployeeRole.PENDING_INSTALLER),
+    )
+
     @property
     def worker_requirements(self):
-        return [
-            EmployeeRole.CERTIFIED_INSTALLER,
-            (EmployeeRole.LABOURER, EmployeeRole.PENDING_INSTALLER),
-        ]
+        return self.WORKER_REQUIREMENTS
 
     def __repr__(self):
         return "Two Storey Home"
 
 
 class CommercialBuilding(Building):
+    WORKER_REQUIREMENTS = (
+        EmployeeRole.CERTIFIED_INSTALLER,
+        EmployeeRole.CERTIFIED_INSTALLER,
+        EmployeeRole.PENDING_INSTALLER,
+        EmployeeRole.PENDING_INSTALLER,
+        EmployeeRole.ANY,
+        EmployeeRole.ANY,
+        EmployeeRole.ANY,
+        EmployeeRole.ANY,
+    )
+
     @property
     def worker_requirements(self):
-        return [
-            EmployeeRole.CERTIFIED_INSTALLER,
-            EmployeeRole.CERTIFIED_INSTALLER,
-            EmployeeRole.PENDING_INSTALLER,
-            EmployeeRole.PENDING_INSTALLER,
-            EmployeeRole.ANY,
-            EmployeeRole.ANY,
-            EmployeeRole.ANY,
-            EmployeeRole.ANY,
-        ]
+        return self.WORKER_REQUIREMENTS
 
     def __repr__(self):
         return "Commercial Building"
+
+
+# Building type codes used by file loaders and the service protocol
+BUILDING_TYPES = {
+    "single_storey": SingleStoreyHome,
+    "two_storey": TwoStoreyHome,
+    "commercial": CommercialBuilding,
+}
+
+
+class BuildingType(NamedTuple):
+    """
+    A registered kind of building.  `id` is its small integer type code.
+    """
+
+    id: int
+    code: str
+    name: str
+    requirements: WorkerRequirements
+    duration: int = 1
+
+
+class RegisteredBuilding(Building):
+    """
+    The one shared `Building` standing in for every building of a type
+    declared directly on a `BuildingRegistry`.
+    """
+
+    def __init__(self, building_type: BuildingType):
+        self.building_type = building_type
+
+    @property
+    def worker_requirements(self):
+        return self.building_type.requirements.slots
+
+    @property
+    def requirements(self) -> WorkerRequirements:
+        return self.building_type.requirements
+
+    @property
+    def duration(self) -> int:
+        return self.building_type.duration
+
+    def __repr__(self):
+        return self.building_type.name
+
+
+class BuildingRegistry:
+    """
+    Building types by code, declared with their requirements or adapted from
+    `Building` subclasses.
+
+    Each type gets a small integer id, so a backlog can be stored as an array
+    of ids (see `BuildingQueue.from_type_ids`) instead of one object per
+    building.  Every type has one shared `Building` instance to stand in for
+    its buildings in schedules.
+    """
+
+    def __init__(self):
+        self.types = []
+        self.buildings = []
+        self._codes = {}
+        self._classes = {}
+
+    def register(
+        self,
+        code: str,
+        worker_requirements,
+        duration: int = 1,
+        name: str = None,
+    ) -> BuildingType:
+        building_type = self._add(code, name or code, worker_requirements, duration)
+        self.buildings.append(RegisteredBuilding(building_type))
+        return building_type
+
+    def adapt(self, building_class: type, code: str = None) -> BuildingType:
+        """
+        Register an existing `Building` subclass, which must construct without
+        arguments.  Its shared instance is a real `building_class` instance.
+        """
+        building = building_class()
+        building_type = self._add(
+            code or building_class.__name__,
+            type(building).__name__,
+            building.requirements,
+            building.duration,
+        )
+        self.buildings.append(building)
+        self._classes[building_class] = building_type
+        return building_type
+
+    def _add(self, code: str, name: str, worker_requirements, duration: int) -> BuildingType:
+        if code in self._codes:
+            raise ValueError(f"Building type {code!r} is already registered")
+        building_type = BuildingType(
+            len(self.types), code, name, compile_requirements(worker_requirements), duration
+        )
+        self.types.append(building_type)
+        self._codes[code] = building_type
+        return building_type
+
+    def __getitem__(self, code: str) -> BuildingType:
+        return self._codes[code]
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._codes
+
+    def type_of(self, building: Building) -> BuildingType:
+        if type(building) is RegisteredBuilding:
+            return building.building_type
+        building_type = self._classes.get(type(building))
+        if building_type is None:
+            raise KeyError(f"{type(building).__name__} is not registered")
+        return building_type
+
+    def type_ids(self, codes: Iterable[str]) -> array:
+        """
+        Compact array of type ids for a sequence of type codes.
+        """
+        return array("H", (self._codes[code].id for code in codes))
+
+
+BUILDING_REGISTRY = BuildingRegistry()
+for _code, _building_class in BUILDING_TYPES.items():
+    BUILDING_REGISTRY.adapt(_building_class, _code)
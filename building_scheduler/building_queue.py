@@ -0,0 +1,343 @@
+""" Building Queue """
+
+from array import array
+from typing import Iterable, Iterator
+
+from building_scheduler.building import (
+    BUILDING_REGISTRY,
+    Building,
+    BuildingRegistry,
+    RegisteredBuilding,
+)
+
+
+# Link value marking the end of the pending list
+_END = -1
+
+
+class BuildingQueue:
+    """
+    Buildings waiting to be scheduled, kept in priority (input) order.
+
+    Pending positions form a doubly linked list threaded through two flat
+    arrays, so marking a building as scheduled is an O(1) unlink and walking
+    the queue only visits buildings that are still pending.  Buildings can be
+    appended one at a time, e.g. while streaming them in from a file.
+
+    A second list of back links records the priority order of every position,
+    scheduled or not, so a building bumped off the schedule can be restored to
+    its original place in the queue.
+
+    Each position also carries a small integer requirement signature: buildings
+    with identical compiled requirements and duration share a signature, and
+    the queue keeps a count of pending buildings per signature.
+    """
+
+    def __init__(self, buildings: Iterable[Building] = (), registry: BuildingRegistry = None):
+        # Building objects, or type ids viewed as the registry's shared
+        # buildings when the queue is backed by a `BuildingRegistry`
+        self.buildings = [] if registry is None else TypedBuildings(registry)
+        # Optional caller ids per position, e.g. job numbers
+        self.external_ids = None
+        self._type_signatures = {}
+        self.signatures = []
+        self.signature_durations = []
+        # Names of the building types seen with each signature, and those
+        # names joined into one label, e.g. "Bungalow / SingleStoreyHome"
+        self._signature_type_names = []
+        self.signature_labels = []
+        self.signature_of = []
+        self.pending_by_signature = {}
+        self._signature_ids = {}
+        self._next = array("q")
+        self._prev = array("q")
+        self._pending = bytearray()
+        # Positions dropped with `remove()`, as opposed to scheduled
+        self._removed = bytearray()
+        self._head = _END
+        self._tail = _END
+        # Priority order of every position, pending or not
+        self._order_prev = array("q")
+        self._order_head = _END
+        self._order_tail = _END
+        # Position of each Building object, for queues of objects
+        self.position_of = {}
+        # Position of each external id, for queues given them
+        self.position_of_external_id = {}
+        # Priority rank per position, lower is more urgent
+        self.priority = array("q")
+        self._lowest_rank = 0
+        self._highest_rank = 0
+        self._length = 0
+        for building in buildings:
+            self.append(building)
+
+    @classmethod
+    def from_type_ids(
+        cls,
+        type_ids: Iterable[int],
+        registry: BuildingRegistry = BUILDING_REGISTRY,
+        external_ids: Iterable = None,
+    ) -> "BuildingQueue":
+        """
+        A queue over an array of registry type ids, in priority order, with
+        no building object per position.
+        """
+        queue = cls(registry=registry)
+        if external_ids is None:
+            for type_id in type_ids:
+                queue.append_type(type_id)
+        else:
+            type_ids, external_ids = list(type_ids), list(external_ids)
+            if len(type_ids) != len(external_ids):
+                raise ValueError("type_ids and external_ids differ in length")
+            for type_id, external_id in zip(type_ids, external_ids):
+                queue.append_type(type_id, external_id)
+        return queue
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Building]:
+        for position in self.positions():
+            yield self.buildings[position]
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, building: Building) -> int:
+        """
+        Queue `building` at the lowest priority and return its position.
+        """
+        position = self._add(building)
+        self._lowest_rank += 1
+        self.priority[position] = self._lowest_rank
+        self._order_prev[position] = self._order_tail
+        if self._order_head == _END:
+            self._order_head = position
+        self._order_tail = position
+        self._link_after(self._tail, position)
+        return position
+
+    def append_type(self, type_id: int, external_id=None) -> int:
+        """
+        Queue one building of registry type `type_id` at the lowest priority
+        and return its position.  Only for registry-backed queues.
+        """
+        signature = self._type_signatures.get(type_id)
+        if signature is None:
+            building = self.buildings.registry.buildings[type_id]
+            signature = self._type_signatures[type_id] = self._signature(building)
+        position = len(self.buildings)
+        self.buildings.type_ids.append(type_id)
+        self._add_position(position, signature, external_id)
+        self._lowest_rank += 1
+        self.priority[position] = self._lowest_rank
+        self._order_prev[position] = self._order_tail
+        if self._order_head == _END:
+            self._order_head = position
+        self._order_tail = position
+        self._link_after(self._tail, position)
+        return position
+
+    def prepend(self, building: Building) -> int:
+        """
+        Queue `building` ahead of everything else and return its position.
+        """
+        position = self._add(building)
+        self._highest_rank -= 1
+        self.priority[position] = self._highest_rank
+        if self._order_head == _END:
+            self._order_tail = position
+        else:
+            self._order_prev[self._order_head] = position
+        self._order_head = position
+        self._link_after(_END, position)
+        return position
+
+    def _add(self, building: Building) -> int:
+        position = len(self.buildings)
+        self.buildings.append(building)
+        if type(self.buildings) is list:
+            # Registry-backed queues share one building per type
+            self.position_of.setdefault(building, position)
+        self._add_position(position, self._signature(building), None)
+        return position
+
+    def _signature(self, building: Building) -> int:
+        requirements = building.requirements
+        key = (requirements, building.duration)
+        if type(building) is RegisteredBuilding:
+            type_name = building.building_type.name
+        else:
+            type_name = type(building).__name__
+        signature = self._signature_ids.get(key)
+        if signature is None:
+            signature = self._signature_ids[key] = len(self.signatures)
+            self.signatures.append(requirements)
+            self.signature_durations.append(building.duration)
+            self._signature_type_names.append((type_name,))
+            self.signature_labels.append(type_name)
+        elif type_name not in self._signature_type_names[signature]:
+            # Tuples, so a `copy()` of the queue never shares a growing list
+            type_names = self._signature_type_names[signature] + (type_name,)
+            self._signature_type_names[signature] = type_names
+            self.signature_labels[signature] = " / ".join(type_names)
+        return signature
+
+    def _add_position(self, position: int, signature: int, external_id):
+        if external_id is not None and self.external_ids is None:
+            self.external_ids = [None] * position
+        if self.external_ids is not None:
+            self.external_ids.append(external_id)
+            if external_id is not None:
+                self.position_of_external_id[external_id] = position
+        self.signature_of.append(signature)
+
+        self._next.append(_END)
+        self._prev.append(_END)
+        self._pending.append(0)
+        self._removed.append(0)
+        self._order_prev.append(_END)
+        self.priority.append(0)
+
+    def _link_after(self, prev_position: int, position: int):
+        """
+        Link `position` into the pending list after `prev_position`, or at the
+        head when `prev_position` is `_END`.
+        """
+        next_position = self._head if prev_position == _END else self._next[prev_position]
+        self._prev[position] = prev_position
+        self._next[position] = next_position
+        if prev_position == _END:
+            self._head = position
+        else:
+            self._next[prev_position] = position
+        if next_position == _END:
+            self._tail = position
+        else:
+            self._prev[next_position] = position
+
+        self._pending[position] = 1
+        self._length += 1
+        signature = self.signature_of[position]
+        self.pending_by_signature[signature] = (
+            self.pending_by_signature.get(signature, 0) + 1
+        )
+
+    def positions(self) -> Iterator[int]:
+        """
+        Yield pending positions in priority order.
+
+        The current position may be marked scheduled while iterating.
+        """
+        position = self._head
+        while position != _END:
+            yield position
+            position = self._next[position]
+
+    def reversed_priority_order(self) -> Iterator[int]:
+        """
+        Yield every position, pending or not, from lowest to highest priority.
+        """
+        position = self._order_tail
+        while position != _END:
+            yield position
+            position = self._order_prev[position]
+
+    def is_pending(self, position: int) -> bool:
+        return bool(self._pending[position])
+
+    def mark_scheduled(self, position: int):
+        if not self._pending[position]:
+            return
+        next_position = self._next[position]
+        prev_position = self._prev[position]
+        if prev_position == _END:
+            self._head = next_position
+        else:
+            self._next[prev_position] = next_position
+        if next_position == _END:
+            self._tail = prev_position
+        else:
+            self._prev[next_position] = prev_position
+        self._pending[position] = 0
+        self._length -= 1
+        signature = self.signature_of[position]
+        self.pending_by_signature[signature] -= 1
+        if not self.pending_by_signature[signature]:
+            del self.pending_by_signature[signature]
+
+    def remove(self, position: int):
+        """
+        Drop `position` for good.  It leaves the pending list like a scheduled
+        building, but is remembered as removed rather than scheduled.
+        """
+        self.mark_scheduled(position)
+        self._removed[position] = 1
+
+    def is_removed(self, position: int) -> bool:
+        return bool(self._removed[position])
+
+    def restore(self, position: int):
+        """
+        Put a scheduled `position` back in the queue at its original priority.
+
+        Costs one step per non-pending position between it and the nearest
+        pending building ahead of it.
+        """
+        if self._pending[position]:
+            return
+        prev_position = self._order_prev[position]
+        while prev_position != _END and not self._pending[prev_position]:
+            prev_position = self._order_prev[prev_position]
+        self._link_after(prev_position, position)
+
+    def copy(self) -> "BuildingQueue":
+        """
+        An independent queue in the same state.  Buildings and compiled
+        requirements are shared; only the bookkeeping is copied, which is a
+        handful of flat array copies.
+        """
+        queue = BuildingQueue.__new__(BuildingQueue)
+        for name, value in vars(self).items():
+            if isinstance(value, (dict, TypedBuildings)):
+                value = value.copy()
+            elif isinstance(value, (list, array, bytearray)):
+                value = value[:]
+            setattr(queue, name, value)
+        return queue
+
+    def requirements(self, position: int):
+        return self.signatures[self.signature_of[position]]
+
+
+class TypedBuildings:
+    """
+    Registry type ids per queue position, read as the registry's shared
+    buildings.
+    """
+
+    def __init__(self, registry: BuildingRegistry, type_ids: Iterable[int] = ()):
+        self.registry = registry
+        self.type_ids = array("H", type_ids)
+
+    def __len__(self) -> int:
+        return len(self.type_ids)
+
+    def __getitem__(self, position):
+        buildings = self.registry.buildings
+        if isinstance(position, slice):
+            return [buildings[type_id] for type_id in self.type_ids[position]]
+        return buildings[self.type_ids[position]]
+
+    def __iter__(self) -> Iterator[Building]:
+        buildings = self.registry.buildings
+        for type_id in self.type_ids:
+            yield buildings[type_id]
+
+    def append(self, building: Building):
+        self.type_ids.append(self.registry.type_of(building).id)
+
+    def copy(self) -> "TypedBuildings":
+        return TypedBuildings(self.registry, self.type_ids)
@@ -1,33 +1,72 @@
 """ Building Scheduler """
 
+from time import perf_counter
+from typing import Iterator
+
 from building_scheduler.building import Building
+from building_scheduler.building_queue import BuildingQueue
 from building_scheduler.roster import (
     Employee,
+    NoEmployeeAvailable,
     Roster,
 )
+from building_scheduler.requirements import fits
+from building_scheduler.stats import SchedulerStats
 
 
 class DailyBuildingSchedule:
-    def __init__(self, building: Building, employees: list[Employee]):
+    def __init__(
+        self,
+        building: Building,
+        employees: list[Employee],
+        position: int = None,
+        days: tuple = None,
+    ):
         self.building = building
         self.employees = employees
+        # Index of the building in the scheduler's priority-ordered input
+        self.position = position
+        # Every day the crew works on a multi-day install, else None
+        self.days = days
 
     def __repr__(self):
         return f"{self.building}: {', '.join(e.name for e in self.employees)}"
 
 
 class BuildingScheduler:
-    def __init__(self, buildings: list[Building], employee_roster: Roster):
-        self.buildings = buildings
+    def __init__(
+        self,
+        buildings: list[Building],
+        employee_roster: Roster,
+        engine=None,
+        stats: SchedulerStats = None,
+        track_placements: bool = False,
+    ):
+        if isinstance(buildings, BuildingQueue):
+            self.queue = buildings
+        else:
+            self.queue = BuildingQueue(buildings)
+        self.buildings = self.queue.buildings
         self.roster = employee_roster
-        self.daily_schedules = {
-            "Monday": [],
-            "Tuesday": [],
-            "Wednesday": [],
-            "Thursday": [],
-            "Friday": [],
-        }
+        self.daily_schedules = {day: [] for day in employee_roster.scheduled}
+        self._days = list(self.daily_schedules)
+        self._day_index = {day: index for index, day in enumerate(self._days)}
+        # Whether `place()` records each staffed building in
+        # `scheduled_buildings` and in the index the repair methods use.  Off
+        # while streaming so memory stays flat however many buildings are
+        # yielded; the `generate_*` methods turn it on.
+        self.track_placements = track_placements
         self.scheduled_buildings = []
+        # Position -> (day, DailyBuildingSchedule) and (day, employee) -> position
+        # for everything placed while tracking, so changes can be repaired in place
+        self._placements = {}
+        self._bookings = {}
+        # Optional alternative engine, e.g. `RoleCountSolver`, that produces the
+        # week through its own `iter_weekly_schedule(scheduler)`
+        self.engine = engine
+        self.stats = stats
+        if stats is not None and employee_roster.stats is None:
+            employee_roster.stats = stats
 
     def generate_weekly_schedule(self):
         """
@@ -39,32 +78,387 @@ class BuildingScheduler:
 
         This class will be used externally by an application which will fit with
         the original spec function signature.
+
+        Turns on `track_placements`, so the week can be repaired afterwards.
+        """
+        self.track_placements = True
+        for day in self.daily_schedules:
+            self.daily_schedules[day] = []
+        for day, building_schedule in self.iter_weekly_schedule():
+            self.daily_schedules[day].append(building_schedule)
+
+    def iter_weekly_schedule(self) -> Iterator[tuple[str, DailyBuildingSchedule]]:
         """
-        for day in self.daily_schedules.keys():
-            daily_schedule = self.generate_daily_schedule(day)
-            self.daily_schedules[day] = daily_schedule
+        Yield (day, DailyBuildingSchedule) pairs as soon as each building is
+        staffed, without keeping them in `daily_schedules`, or anywhere else
+        unless `track_placements` is set.
+        """
+        if self.engine is not None:
+            yield from self.engine.iter_weekly_schedule(self)
+            return
+        for day in self.daily_schedules:
+            for building_schedule in self.iter_daily_schedule(day):
+                yield day, building_schedule
 
     def generate_daily_schedule(self, day: str) -> list[DailyBuildingSchedule]:
-        building_schedules = []
-        for building in self.remaining_buildings:
-            can_schedule_building = self.roster.meets_worker_requirements(
-                day, building.worker_requirements
-            )
-            if can_schedule_building:
-                scheduled_employees = []
-                for role in building.worker_requirements:
-                    scheduled_employees.append(self.roster.schedule_employee(day, role))
-                building_schedules.append(
-                    DailyBuildingSchedule(building, scheduled_employees)
-                )
-                self.scheduled_buildings.append(building)
-        return building_schedules
+        self.track_placements = True
+        return list(self.iter_daily_schedule(day))
+
+    def iter_daily_schedule(self, day: str) -> Iterator[DailyBuildingSchedule]:
+        """
+        Schedule as many pending buildings as possible on `day`, in priority order.
+
+        A building with a `duration` of several days starts on `day` and keeps
+        the same crew for its following working days; it is listed under
+        `day` only.
+
+        The day's pool only shrinks as buildings are staffed, so signatures
+        the full day's pool cannot staff are rejected up front in one batch,
+        every later building sharing a rejected signature is skipped, and the
+        pass stops as soon as every pending signature has been rejected.
+        """
+        queue = self.queue
+        stats = self.stats
+        if stats is not None:
+            stats.emit("day_started", day=day)
+            started = perf_counter()
+        feasible = self.roster.feasible_many(day, queue.signatures)
+        rejected = set()
+        for signature in queue.pending_by_signature:
+            if not feasible[signature]:
+                rejected.add(signature)
+                if stats is not None:
+                    stats.record_rejection(day, queue.signature_labels[signature])
+        for position in queue.positions():
+            if len(rejected) == len(queue.pending_by_signature):
+                break
+            signature = queue.signature_of[position]
+            if signature in rejected:
+                continue
+            requirements = queue.signatures[signature]
+            duration = queue.signature_durations[signature]
+            if duration == 1:
+                days = None
+                staffed = self.roster.can_staff(day, requirements)
+            else:
+                days = self._span(day, duration)
+                staffed = days is not None and self.roster.can_staff_span(days, requirements)
+            if staffed:
+                if days is None:
+                    scheduled_employees = self.roster.staff(day, requirements)
+                else:
+                    scheduled_employees = self.roster.staff_span(days, requirements)
+                building_schedule = self.place(day, position, scheduled_employees, days)
+                if stats is not None:
+                    # Time spent by the consumer between yields is not counted
+                    stats.record_day_time(day, perf_counter() - started)
+                    stats.emit("building_scheduled", day=day, position=position)
+                yield building_schedule
+                if stats is not None:
+                    started = perf_counter()
+            else:
+                rejected.add(signature)
+                if stats is not None:
+                    stats.record_rejection(day, queue.signature_labels[signature])
+        if stats is not None:
+            stats.record_day_time(day, perf_counter() - started)
+            stats.emit("day_finished", day=day)
 
     @property
-    def remaining_buildings(self):
-        return list(
-            filter(
-                lambda building: building not in self.scheduled_buildings,
-                self.buildings,
-            )
+    def remaining_buildings(self) -> BuildingQueue:
+        return self.queue
+
+    def _span(self, day, duration: int):
+        """
+        `duration` working days starting with `day`, or None when they run
+        past the end of the schedule.
+        """
+        start = self._day_index[day]
+        days = self._days[start:start + duration]
+        return days if len(days) == duration else None
+
+    def _can_start(self, day, building: Building) -> bool:
+        if building.duration == 1:
+            return self.roster.can_staff(day, building.requirements)
+        days = self._span(day, building.duration)
+        return days is not None and self.roster.can_staff_span(days, building.requirements)
+
+    def place(
+        self,
+        day: str,
+        position: int,
+        employees: list[Employee],
+        days: list = None,
+    ) -> DailyBuildingSchedule:
+        """
+        Record the building at queue `position` as staffed by `employees` on
+        `day`, or on every one of `days` for a multi-day install.  The
+        employees must already be booked on the roster.
+        """
+        building = self.queue.buildings[position]
+        self.queue.mark_scheduled(position)
+        days = tuple(days) if days is not None else None
+        building_schedule = DailyBuildingSchedule(building, employees, position, days)
+        if self.track_placements:
+            self.scheduled_buildings.append(building)
+            self._placements[position] = (day, building_schedule)
+            for booked_day in days or (day,):
+                for employee in employees:
+                    self._bookings[(booked_day, employee)] = position
+        return building_schedule
+
+    def _unplace(self, position: int) -> str:
+        day, building_schedule = self._placements.pop(position)
+        for booked_day in building_schedule.days or (day,):
+            for employee in building_schedule.employees:
+                self._bookings.pop((booked_day, employee), None)
+                self.roster.release(booked_day, employee)
+        self.daily_schedules[day].remove(building_schedule)
+        self.scheduled_buildings.remove(building_schedule.building)
+        return day
+
+    # Incremental rescheduling.
+    #
+    # These repair a week built with `generate_weekly_schedule()` after a
+    # change, touching only the days the change affects.  Each returns the
+    # days whose schedules changed, in calendar order.
+
+    def add_day_off(self, employee: Employee, day: str) -> list[str]:
+        """
+        Give `employee` `day` off.  If they were booked, the same slot is
+        re-staffed from that day's free pool; failing that, the building is
+        bumped back into the queue and placed again on `day` or a later day.
+        """
+        self.roster.set_day_off(employee, day)
+        position = self._bookings.pop((day, employee), None)
+        if position is None:
+            return []
+        self.roster.release(day, employee)
+
+        start_day, building_schedule = self._placements[position]
+        if building_schedule.days is not None:
+            # The same crew has to work every day, so the install moves
+            self._unplace(position)
+            self.queue.restore(position)
+            changed = self._fill_until_placed(start_day, [position])
+            changed |= self._fill_days(building_schedule.days)
+            return self._ordered_days(set(building_schedule.days) | changed)
+        slot = building_schedule.employees.index(employee)
+        requirement = building_schedule.building.requirements.slots[slot]
+        try:
+            replacement = self.roster.schedule_employee(day, requirement)
+        except NoEmployeeAvailable:
+            self._unplace(position)
+            self.queue.restore(position)
+            return self._ordered_days({day} | self._fill_until_placed(day, [position]))
+        building_schedule.employees[slot] = replacement
+        self._bookings[(day, replacement)] = position
+        return [day]
+
+    def remove_day_off(self, employee: Employee, day: str) -> list[str]:
+        """
+        Make `employee` available on `day` again and use them to staff pending
+        buildings that now fit on that day.
+        """
+        self.roster.set_day_off(employee, day, off=False)
+        return self._ordered_days(self._fill_days([day]))
+
+    def add_building(self, building: Building, urgent: bool = False) -> list[str]:
+        """
+        Queue a new building and place it on the earliest day with room.
+
+        An urgent building jumps the queue and goes on the earliest day that
+        has room for it or can make room by bumping lower-priority buildings
+        to later days.  A multi-day install only bumps one of its own kind,
+        whose crew is already booked for the whole span.
+        """
+        if urgent:
+            position = self.queue.prepend(building)
+        else:
+            position = self.queue.append(building)
+
+        for day in self._days:
+            if self._can_start(day, building):
+                return self._ordered_days(self._fill_until_placed(day, [position]))
+            if not urgent:
+                continue
+            if building.duration > 1:
+                victim = self._lowest_same_signature(day, position)
+                victims = None if victim is None else [victim]
+            else:
+                victims = self._bump_candidates(day, position)
+            if victims is None:
+                continue
+            changed = {day}
+            for victim in victims:
+                changed.update(self._placements[victim][1].days or (day,))
+                self._unplace(victim)
+                self.queue.restore(victim)
+            changed |= self._fill_until_placed(day, [position] + victims)
+            return self._ordered_days(changed)
+        return []
+
+    def remove_building(self, building: Building) -> list[str]:
+        """
+        Drop `building` from the queue or the schedule.  A freed crew is used to
+        staff pending buildings on the same day.
+
+        Registry-backed queues share one building per type, so drop their
+        buildings with `remove_position()` or `remove_external_id()` instead.
+        """
+        position = self.queue.position_of.get(building)
+        if position is None:
+            raise ValueError(f"{building!r} is not in this schedule")
+        return self.remove_position(position)
+
+    def remove_external_id(self, external_id) -> list[str]:
+        """
+        Drop the building queued with `external_id`, like `remove_building()`.
+        """
+        position = self.queue.position_of_external_id.get(external_id)
+        if position is None:
+            raise ValueError(f"no building with id {external_id!r} in this schedule")
+        return self.remove_position(position)
+
+    def remove_position(self, position: int) -> list[str]:
+        """
+        Drop the building at queue `position`, like `remove_building()`.
+        """
+        if not 0 <= position < len(self.queue.buildings):
+            raise ValueError(f"no building at position {position} in this schedule")
+        if self.queue.is_pending(position):
+            self.queue.remove(position)
+            return []
+        if position not in self._placements:
+            return []
+        building_schedule = self._placements[position][1]
+        days = building_schedule.days or (self._placements[position][0],)
+        self._unplace(position)
+        self.queue.remove(position)
+        return self._ordered_days(set(days) | self._fill_days(days))
+
+    def _bump_candidates(self, day: str, position: int):
+        """
+        Lowest-priority buildings on `day` whose crews, together with the free
+        pool, are enough to staff `position`, or None when bumping every
+        lower-priority building would still not be enough.
+        """
+        requirements = self.queue.requirements(position)
+        priority = self.queue.priority
+        free = self.roster.free_counts[day].copy()
+        lower = sorted(
+            (
+                building_schedule
+                for building_schedule in self.daily_schedules[day]
+                if priority[building_schedule.position] > priority[position]
+            ),
+            key=lambda building_schedule: priority[building_schedule.position],
+            reverse=True,
         )
+        victims = []
+        for building_schedule in lower:
+            victims.append(building_schedule.position)
+            for employee in building_schedule.employees:
+                free[employee.role] += 1
+            if fits(requirements, free):
+                return victims
+        return None
+
+    def _fill_days(self, days) -> set:
+        changed = set()
+        for day in days:
+            added = list(self.iter_daily_schedule(day))
+            if added:
+                self.daily_schedules[day].extend(added)
+                changed.add(day)
+            for building_schedule in added:
+                changed |= self._pull_forward(day, building_schedule)
+        return changed
+
+    def _pull_forward(self, day: str, building_schedule: DailyBuildingSchedule) -> set:
+        """
+        Give the crew just booked on `day` for `building_schedule` to the most
+        urgent building of the same signature placed on a later day, and so on
+        down the week, so buildings of one kind keep their priority order.
+
+        Buildings with one signature take the same crew, so only buildings
+        move between the booked crews.  Returns the days that changed.
+        """
+        queue = self.queue
+        priority = queue.priority
+        signature = queue.signature_of[building_schedule.position]
+        slots = [(day, building_schedule)]
+        for later_day in self._days[self._day_index[day] + 1:]:
+            for other in self.daily_schedules[later_day]:
+                if (
+                    queue.signature_of[other.position] == signature
+                    and priority[other.position] < priority[building_schedule.position]
+                ):
+                    slots.append((later_day, other))
+        if len(slots) == 1:
+            return set()
+        positions = sorted((other.position for _, other in slots), key=priority.__getitem__)
+        changed = set()
+        for (slot_day, other), position in zip(slots, positions):
+            if other.position == position:
+                continue
+            other.position = position
+            other.building = queue.buildings[position]
+            self._placements[position] = (slot_day, other)
+            for booked_day in other.days or (slot_day,):
+                for employee in other.employees:
+                    self._bookings[(booked_day, employee)] = position
+            changed.add(slot_day)
+        return changed
+
+    def _fill_until_placed(self, start_day: str, positions: list[int]) -> set:
+        """
+        Fill `start_day` and each later day until every one of `positions` has
+        been placed or the week runs out.
+
+        Where one of `positions` does not fit on a day, lower-priority buildings
+        with the same signature placed on that day are bumped, lowest first,
+        until it is placed; each joins `positions`, so bumped work never ends
+        up behind lower-priority buildings of the same kind.  A freed crew can
+        go to a more urgent building of another kind, which is why one bump
+        may not be enough.
+        """
+        queue = self.queue
+        positions = list(positions)
+        changed = set()
+        for day in self._days[self._day_index[start_day]:]:
+            changed |= self._fill_days([day])
+            for position in sorted(positions, key=queue.priority.__getitem__):
+                while queue.is_pending(position):
+                    victim = self._lowest_same_signature(day, position)
+                    if victim is None:
+                        break
+                    victim_days = self._placements[victim][1].days or (day,)
+                    self._unplace(victim)
+                    queue.restore(victim)
+                    positions.append(victim)
+                    changed |= set(victim_days) | self._fill_days(victim_days)
+            if not any(queue.is_pending(position) for position in positions):
+                break
+        return changed
+
+    def _lowest_same_signature(self, day: str, position: int):
+        """
+        The lowest-priority building starting on `day` that shares the
+        signature of `position` and has a lower priority, or None.
+        """
+        signature_of = self.queue.signature_of
+        priority = self.queue.priority
+        lowest = None
+        for building_schedule in self.daily_schedules[day]:
+            other = building_schedule.position
+            if (
+                signature_of[other] == signature_of[position]
+                and priority[other] > priority[position]
+                and (lowest is None or priority[other] > priority[lowest])
+            ):
+                lowest = other
+        return lowest
+
+    def _ordered_days(self, days: set) -> list[str]:
+        return [day for day in self.daily_schedules if day in days]
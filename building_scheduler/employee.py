@@ -1,4 +1,6 @@
+from array import array
 from enum import Enum
+from typing import Iterable, Iterator
 
 
 class NoEmployeeAvailable(Exception):
@@ -18,18 +20,68 @@ ASSIGNABLE_EMPLOYEE_ROLES = [
     EmployeeRole.LABOURER,
 ]
 
+DAYS_OF_WEEK = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+# Day name -> bit in an employee's days-off mask
+DAY_BITS = {day: 1 << index for index, day in enumerate(DAYS_OF_WEEK)}
+
+
+def days_off_mask(days_off: Iterable[str]) -> int:
+    mask = 0
+    for day in days_off:
+        if day not in DAY_BITS:
+            raise ValueError(f"Unknown day off: {day!r}")
+        mask |= DAY_BITS[day]
+    return mask
+
 
 class Employee:
-    def __init__(self, role: EmployeeRole, name: str, days_off: list[str] = []):
+    """
+    A single employee.
+
+    Uses `__slots__` and stores days off as a bitmask over `DAYS_OF_WEEK`, so
+    an availability check is a single AND.
+    """
+
+    __slots__ = ("role", "name", "days_off_mask")
+
+    def __init__(self, role: EmployeeRole, name: str, days_off: Iterable[str] = ()):
         self.role = role
         self.name = name
-        self.days_off = days_off
+        self.days_off_mask = days_off_mask(days_off)
+
+    @property
+    def role_code(self) -> int:
+        return self.role.value
+
+    @property
+    def days_off(self) -> tuple:
+        """
+        Days off in week order.  A tuple, as editing it in place would not
+        reach the mask; assign a new collection to change the days off.
+        """
+        return tuple(day for day in DAYS_OF_WEEK if self.days_off_mask & DAY_BITS[day])
+
+    @days_off.setter
+    def days_off(self, days_off: Iterable[str]):
+        self.days_off_mask = days_off_mask(days_off)
 
     def __repr__(self):
         return f"{self.role}|{self.name}"
 
+    def is_day_off(self, day) -> bool:
+        return bool(self.days_off_mask & DAY_BITS.get(day, 0))
+
     def is_available(self, day, role_requirement):
-        if self.fits_role(role_requirement) and day not in self.days_off:
+        if self.fits_role(role_requirement) and not self.is_day_off(day):
             return True
         return False
 
@@ -41,3 +93,48 @@ class Employee:
         elif type(role_requirement) == tuple and self.role in role_requirement:
             return True
         return False
+
+
+class EmployeeTable:
+    """
+    Columnar employee storage for bulk loads: role codes, names and days-off
+    masks in parallel arrays, with no per-employee object until one is asked
+    for.
+
+    `to_employees()` materializes the rows once, e.g. to build a `Roster`.
+    """
+
+    def __init__(self):
+        self.role_codes = array("B")
+        self.names = []
+        self.days_off_masks = array("Q")
+
+    @classmethod
+    def from_rows(cls, rows: Iterable) -> "EmployeeTable":
+        """
+        Build a table from (role, name, days_off) rows.
+        """
+        table = cls()
+        for role, name, days_off in rows:
+            table.append(role, name, days_off)
+        return table
+
+    def append(self, role: EmployeeRole, name: str, days_off: Iterable[str] = ()):
+        self.role_codes.append(role.value)
+        self.names.append(name)
+        self.days_off_masks.append(days_off_mask(days_off))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> Employee:
+        employee = Employee(EmployeeRole(self.role_codes[index]), self.names[index])
+        employee.days_off_mask = self.days_off_masks[index]
+        return employee
+
+    def __iter__(self) -> Iterator[Employee]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_employees(self) -> list[Employee]:
+        return list(self)
@@ -0,0 +1,173 @@
+""" Throughput Estimator
+
+Instant answers to "how many of these buildings can this crew finish in a
+week" from per-day role counts alone, without running a schedule.
+"""
+
+from typing import Iterable
+
+from building_scheduler.building import BUILDING_REGISTRY, BUILDING_TYPES, BuildingType
+from building_scheduler.employee import Employee, ASSIGNABLE_EMPLOYEE_ROLES, DAY_BITS
+from building_scheduler.requirements import ALL_ROLES, role_supply
+from building_scheduler.roster import Roster, WEEKDAYS
+
+
+class ThroughputEstimator:
+    """
+    Weekly capacity of a crew, given as day -> role -> available employees.
+
+    Counting the crew is done once; every estimate after that costs a few
+    integer operations per day and role set, whatever the size of the roster
+    or the backlog.
+
+    Building types can be given as `Building` subclasses, registered
+    `BuildingType`s or their `BUILDING_REGISTRY` codes.
+    """
+
+    def __init__(self, day_counts: dict):
+        self.day_counts = day_counts
+        self._supply = [role_supply(counts) for counts in day_counts.values()]
+
+    @classmethod
+    def from_employees(cls, employees: Iterable[Employee], days=WEEKDAYS) -> "ThroughputEstimator":
+        """
+        Count who is available on each of `days` from their days off.
+        """
+        day_counts = {day: dict.fromkeys(ASSIGNABLE_EMPLOYEE_ROLES, 0) for day in days}
+        for employee in employees:
+            if employee.role not in ASSIGNABLE_EMPLOYEE_ROLES:
+                continue
+            for day, counts in day_counts.items():
+                if not employee.days_off_mask & DAY_BITS[day]:
+                    counts[employee.role] += 1
+        return cls(day_counts)
+
+    @classmethod
+    def from_roster(cls, roster: Roster) -> "ThroughputEstimator":
+        """
+        Count the roster's employees by their days off and leave, ignoring
+        bookings.
+        """
+        day_counts = {day: dict.fromkeys(ASSIGNABLE_EMPLOYEE_ROLES, 0) for day in roster.scheduled}
+        for employee in roster.employees:
+            if employee.role not in ASSIGNABLE_EMPLOYEE_ROLES:
+                continue
+            for day, counts in day_counts.items():
+                if not roster.is_off(employee, day):
+                    counts[employee.role] += 1
+        return cls(day_counts)
+
+    def weekly_bound(self, building_type) -> int:
+        """
+        Most buildings of one type the crew could complete in the week.
+
+        Each day fits as many crews as the scarcest set of roles allows.  For
+        a single-day type that is exact; an install lasting several days
+        needs that many crew-days, so the total is divided by its duration,
+        which is only an upper bound since the counts cannot show whether the
+        same people are free on consecutive days.
+        """
+        requirements, duration = _shape(building_type)
+        return sum(_copies(requirements.demand, supply) for supply in self._supply) // duration
+
+    def bounds(self, building_types: dict = BUILDING_TYPES) -> dict:
+        """
+        `weekly_bound()` for every type in `building_types` (code -> class).
+        """
+        return {code: self.weekly_bound(building_type) for code, building_type in building_types.items()}
+
+    def mix_lower_bound(self, mix: dict) -> int:
+        """
+        A number of buildings of `mix` (building type -> count) the crew can
+        certainly complete in the week.
+
+        Each day takes as many of the smallest crews as still fit alongside
+        the ones already taken, then moves on to larger crews.  Some schedule
+        always achieves the count, but the best one may complete more: the
+        exact maximum for a mix is an integer program, so it cannot be
+        found in a fixed number of operations.  The count is never more than
+        `mix_upper_bound()`.
+
+        Multi-day types count for nothing here, since the counts cannot show
+        whether the same people are free on consecutive days.
+        """
+        shapes = ((_shape(building_type), count) for building_type, count in mix.items())
+        remaining = sorted(
+            (
+                [requirements, count]
+                for (requirements, duration), count in shapes
+                if count > 0 and duration == 1
+            ),
+            key=lambda entry: len(entry[0]),
+        )
+        completed = 0
+        for supply in self._supply:
+            spare = list(supply)
+            for entry in remaining:
+                requirements, count = entry
+                if not count:
+                    continue
+                taken = min(count, _copies(requirements.demand, spare))
+                if not taken:
+                    continue
+                for mask in range(1, ALL_ROLES + 1):
+                    spare[mask] -= taken * requirements.demand[mask]
+                entry[1] -= taken
+                completed += taken
+        return completed
+
+    def mix_upper_bound(self, mix: dict) -> int:
+        """
+        A number of buildings of `mix` (building type -> count) the crew can
+        certainly not beat in the week.
+
+        Each type is capped at its `weekly_bound()`.  Then, for every set of
+        roles, the week's crew-days in those roles are spent on the buildings
+        needing the fewest of them, which is the most buildings that one
+        constraint alone allows; the bound is the tightest of these.  Costs
+        a few integer operations per type and role set.
+        """
+        types = []
+        for building_type, count in mix.items():
+            requirements, duration = _shape(building_type)
+            cap = min(count, self.weekly_bound(building_type))
+            if cap > 0:
+                types.append((requirements.demand, duration, cap))
+        bound = sum(cap for _, _, cap in types)
+        for mask in range(1, ALL_ROLES + 1):
+            budget = sum(supply[mask] for supply in self._supply)
+            taken = 0
+            needs = sorted((demand[mask] * duration, cap) for demand, duration, cap in types)
+            for need, cap in needs:
+                fit = cap if not need else min(cap, budget // need)
+                taken += fit
+                budget -= fit * need
+                if fit < cap:
+                    break
+            bound = min(bound, taken)
+        return bound
+
+
+def _shape(building_type) -> tuple:
+    """
+    (compiled requirements, duration) of a class, `BuildingType` or code.
+    """
+    if isinstance(building_type, str):
+        building_type = BUILDING_REGISTRY[building_type]
+    if isinstance(building_type, BuildingType):
+        return building_type.requirements, building_type.duration
+    building = building_type()
+    return building.requirements, building.duration
+
+
+def _copies(demand, supply) -> int:
+    """
+    Most copies of a crew with `demand` that `supply` can staff together.
+    """
+    copies = None
+    for mask in range(1, ALL_ROLES + 1):
+        if demand[mask]:
+            fit = supply[mask] // demand[mask]
+            if copies is None or fit < copies:
+                copies = fit
+    return 0 if copies is None else copies
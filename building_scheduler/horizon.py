@@ -0,0 +1,159 @@
+""" Planning Horizon
+
+Multi-week planning horizons with integer day indices.  Day `i` is the date
+`start + i`; only working days (by weekday, minus holidays) are scheduled.
+"""
+
+from array import array
+from datetime import date, timedelta
+from typing import Iterable, Iterator, NamedTuple
+
+from building_scheduler.building import Building
+from building_scheduler.building_queue import BuildingQueue
+from building_scheduler.building_scheduler import BuildingScheduler, DailyBuildingSchedule
+from building_scheduler.employee import Employee, DAY_BITS, DAYS_OF_WEEK
+from building_scheduler.roster import Roster, WEEKDAYS
+
+
+class CalendarWeek(NamedTuple):
+    """
+    The working days of one week of a `Calendar`, in the shape `Roster`
+    takes as `calendar=`:
+
+    - `days`: working day indices
+    - `day_bits`: day index -> weekday bit, for employees' recurring days off
+    - `leave`: day index -> employees on leave that day
+    """
+
+    days: tuple
+    day_bits: dict
+    leave: dict
+
+
+class Calendar:
+    """
+    A horizon of `weeks` weeks from `start`.
+
+    `workdays` are the weekday names worked (weekends can be added) and
+    `holidays` are dates nobody works.  Leave is kept as date ranges per
+    employee and only expanded one week at a time.
+    """
+
+    def __init__(
+        self,
+        start: date,
+        weeks: int = 1,
+        workdays: Iterable[str] = WEEKDAYS,
+        holidays: Iterable[date] = (),
+    ):
+        self.start = start
+        self.length = weeks * 7
+        workdays = set(workdays)
+        for day in workdays:
+            if day not in DAY_BITS:
+                raise ValueError(f"Unknown workday: {day!r}")
+        holidays = set(holidays)
+        # Day index -> weekday bit, and whether the day is worked
+        self.day_bits = array("q")
+        self.working = bytearray()
+        for index in range(self.length):
+            when = start + timedelta(index)
+            name = DAYS_OF_WEEK[when.weekday()]
+            self.day_bits.append(DAY_BITS[name])
+            self.working.append(name in workdays and when not in holidays)
+        self._leave = []
+
+    def date(self, day: int) -> date:
+        return self.start + timedelta(day)
+
+    def day_index(self, when: date) -> int:
+        return (when - self.start).days
+
+    def day_name(self, day: int) -> str:
+        return DAYS_OF_WEEK[self.date(day).weekday()]
+
+    @property
+    def days(self) -> list[int]:
+        return [day for day in range(self.length) if self.working[day]]
+
+    def add_leave(self, employee: Employee, first: date, last: date = None):
+        """
+        Take `employee` off from `first` to `last` inclusive (one day when
+        `last` is omitted).
+        """
+        last = first if last is None else last
+        if last < first:
+            raise ValueError(f"Leave ends before it starts: {first} to {last}")
+        self._leave.append((employee, self.day_index(first), self.day_index(last)))
+
+    def week(self, number: int) -> CalendarWeek:
+        """
+        Working days of week `number` (0-based) of the horizon.
+        """
+        first, end = number * 7, min(number * 7 + 7, self.length)
+        days = tuple(day for day in range(first, end) if self.working[day])
+        leave = {}
+        for employee, leave_first, leave_last in self._leave:
+            for day in range(max(leave_first, first), min(leave_last + 1, end)):
+                if self.working[day]:
+                    leave.setdefault(day, set()).add(employee)
+        return CalendarWeek(days, {day: self.day_bits[day] for day in days}, leave)
+
+    def weeks(self) -> Iterator[CalendarWeek]:
+        for number in range(-(-self.length // 7)):
+            yield self.week(number)
+
+
+class RollingScheduler:
+    """
+    Schedule a `Calendar` week after week, carrying buildings left over from
+    one week into the next.
+
+    Each week gets a fresh `Roster` over its own working days, so a plan of
+    eight weeks costs about eight times one week.  Results are kept per day
+    index in flat lists and arrays.
+    """
+
+    def __init__(
+        self,
+        buildings: Iterable[Building],
+        employees: Iterable[Employee],
+        calendar: Calendar,
+        engine=None,
+        roster_class=Roster,
+    ):
+        if isinstance(buildings, BuildingQueue):
+            self.queue = buildings
+        else:
+            self.queue = BuildingQueue(buildings)
+        self.employees = list(employees)
+        self.calendar = calendar
+        self.engine = engine
+        self.roster_class = roster_class
+        # Day index -> staffed buildings, and buildings completed per day
+        self.daily_schedules = [[] for _ in range(calendar.length)]
+        self.completed = array("l", [0]) * calendar.length
+
+    def iter_schedule(self) -> Iterator[tuple[int, DailyBuildingSchedule]]:
+        """
+        Yield (day index, DailyBuildingSchedule) pairs across the horizon.
+        """
+        for week in self.calendar.weeks():
+            if not week.days:
+                continue
+            roster = self.roster_class(self.employees, calendar=week)
+            scheduler = BuildingScheduler(self.queue, roster, engine=self.engine)
+            for day, building_schedule in scheduler.iter_weekly_schedule():
+                self.daily_schedules[day].append(building_schedule)
+                self.completed[day] += 1
+                yield day, building_schedule
+            if not len(self.queue):
+                break
+
+    def generate(self):
+        for _ in self.iter_schedule():
+            pass
+
+    @property
+    def remaining_buildings(self) -> BuildingQueue:
+        return self.queue
@@ -0,0 +1,189 @@
+""" Loaders
+
+Stream buildings and employees from CSV or JSON Lines files.
+
+Buildings, in priority order:
+
+- CSV with a `type` column and an optional `id` column
+- JSON Lines objects with a `type` key and an optional `id`
+
+`type` is a code from `BUILDING_TYPES`, e.g. `commercial`.  `load_buildings`
+keeps them as registry type ids with `id` as each building's external id.
+
+Employees:
+
+- CSV with `role`, `name` and `days_off` columns, days separated by `;`
+- JSON Lines objects with `role`, `name` and an optional `days_off` list
+
+`role` is an `EmployeeRole` name, e.g. `CERTIFIED_INSTALLER`.
+
+Malformed rows are reported as `LoadError`s and skipped, the rest of the
+file keeps loading.
+"""
+
+import csv
+import json
+import os
+from typing import Callable, Iterator, NamedTuple, Optional, TextIO
+
+from building_scheduler.building import (
+    BUILDING_REGISTRY,
+    BUILDING_TYPES,
+    Building,
+    BuildingRegistry,
+)
+from building_scheduler.building_queue import BuildingQueue, TypedBuildings
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.roster import Roster
+
+
+class LoadError(NamedTuple):
+    source: str
+    line: int
+    message: str
+
+    def __str__(self):
+        return f"{self.source}:{self.line}: {self.message}"
+
+
+def file_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Unsupported file type: {path!r}, expected .csv or .jsonl")
+
+
+def _iter_rows(stream: TextIO, fmt: str) -> Iterator[tuple[int, object]]:
+    """
+    Yield (line number, row) pairs; a row is a dict, or the exception raised
+    while decoding that line.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as error:
+                yield line_number, error
+            else:
+                yield line_number, row
+    else:
+        raise ValueError(f"Unknown format: {fmt!r}")
+
+
+def parse_building(row: dict) -> Building:
+    code = row.get("type")
+    if code not in BUILDING_TYPES:
+        raise ValueError(f"unknown building type {code!r}")
+    return BUILDING_TYPES[code]()
+
+
+def parse_building_type(row: dict, registry: BuildingRegistry = BUILDING_REGISTRY) -> tuple:
+    """
+    (registry type id, external id or None) for one building row.
+    """
+    code = row.get("type")
+    if not isinstance(code, str) or code not in registry:
+        raise ValueError(f"unknown building type {code!r}")
+    external_id = row.get("id")
+    if external_id == "":
+        external_id = None
+    elif external_id is not None and (
+        type(external_id) is bool or not isinstance(external_id, (str, int))
+    ):
+        raise ValueError(f"id {external_id!r} is not a string or an integer")
+    return registry[code].id, external_id
+
+
+def parse_employee(row: dict) -> Employee:
+    role_name = row.get("role")
+    if not isinstance(role_name, str) or role_name.upper() not in EmployeeRole.__members__:
+        raise ValueError(f"unknown role {role_name!r}")
+    role = EmployeeRole[role_name.upper()]
+    if role is EmployeeRole.ANY:
+        raise ValueError("ANY is not an employee role")
+    name = row.get("name")
+    if not name:
+        raise ValueError("missing name")
+    days_off = row.get("days_off") or []
+    if isinstance(days_off, str):
+        days_off = [day.strip() for day in days_off.split(";") if day.strip()]
+    return Employee(role, name, days_off)
+
+
+def _iter_parsed(
+    stream: TextIO,
+    fmt: str,
+    parse: Callable,
+    source: str,
+    errors: Optional[list],
+) -> Iterator:
+    for line_number, row in _iter_rows(stream, fmt):
+        try:
+            if isinstance(row, Exception):
+                raise row
+            if not isinstance(row, dict):
+                raise ValueError("expected an object")
+            parsed = parse(row)
+        except (ValueError, TypeError) as error:
+            if errors is not None:
+                errors.append(LoadError(source, line_number, str(error)))
+            continue
+        yield parsed
+
+
+def iter_buildings(
+    stream: TextIO, fmt: str, source: str = "<buildings>", errors: list = None
+) -> Iterator[Building]:
+    """
+    Lazily parse buildings from `stream`, appending bad rows to `errors`.
+    """
+    return _iter_parsed(stream, fmt, parse_building, source, errors)
+
+
+def iter_employees(
+    stream: TextIO, fmt: str, source: str = "<employees>", errors: list = None
+) -> Iterator[Employee]:
+    """
+    Lazily parse employees from `stream`, appending bad rows to `errors`.
+    """
+    return _iter_parsed(stream, fmt, parse_employee, source, errors)
+
+
+def load_buildings(path: str, queue: BuildingQueue = None, errors: list = None) -> BuildingQueue:
+    """
+    Stream buildings from `path` straight into a `BuildingQueue`, by default
+    a registry-backed one holding type ids rather than building objects.
+    """
+    queue = BuildingQueue(registry=BUILDING_REGISTRY) if queue is None else queue
+    with open(path, newline="") as stream:
+        fmt = file_format(path)
+        if isinstance(queue.buildings, TypedBuildings):
+            registry = queue.buildings.registry
+            rows = _iter_parsed(
+                stream, fmt, lambda row: parse_building_type(row, registry), path, errors
+            )
+            for type_id, external_id in rows:
+                queue.append_type(type_id, external_id)
+        else:
+            for building in iter_buildings(stream, fmt, path, errors):
+                queue.append(building)
+    return queue
+
+
+def load_roster(path: str, roster: Roster = None, errors: list = None) -> Roster:
+    """
+    Stream employees from `path` straight into a `Roster`.
+    """
+    roster = Roster() if roster is None else roster
+    with open(path, newline="") as stream:
+        for employee in iter_employees(stream, file_format(path), path, errors):
+            roster.add_employee(employee)
+    return roster
@@ -0,0 +1,247 @@
+""" Worker Requirements """
+
+from typing import NamedTuple
+
+from building_scheduler.employee import EmployeeRole, ASSIGNABLE_EMPLOYEE_ROLES
+
+
+# Assignable roles as bits, so any set of roles is a small integer mask
+ROLE_BITS = {role: 1 << index for index, role in enumerate(ASSIGNABLE_EMPLOYEE_ROLES)}
+ALL_ROLES = (1 << len(ASSIGNABLE_EMPLOYEE_ROLES)) - 1
+MASK_ROLES = tuple(
+    tuple(role for role in ASSIGNABLE_EMPLOYEE_ROLES if ROLE_BITS[role] & mask)
+    for mask in range(ALL_ROLES + 1)
+)
+
+
+class WorkerRequirements(NamedTuple):
+    """
+    A requirement list compiled once into the shape the roster works with.
+
+    - `fixed`: (role, count) pairs for slots that need one specific role
+    - `logical_or`: one tuple of acceptable roles per OR slot
+    - `any_count`: number of slots any assignable role can fill
+    - `slots`: the original slots, so staffed crews line up with them
+    - `fill_order`: slot indices in fixed -> OR -> ANY order
+    - `slot_masks`: the roles each slot accepts, as a `ROLE_BITS` mask
+    - `demand`: for every role mask, how many slots only those roles can fill
+    - `checks`: (roles, count) pairs of `demand` that `fits()` has to test
+
+    Being a tuple, it is immutable and hashable, so it doubles as a
+    requirement signature.
+    """
+
+    fixed: tuple
+    logical_or: tuple
+    any_count: int
+    slots: tuple
+    fill_order: tuple
+    slot_masks: tuple
+    demand: tuple
+    checks: tuple
+
+    def __len__(self):
+        return len(self.slots)
+
+
+# Compiled requirements by slot tuple, so a raw list is only compiled once
+_COMPILED = {}
+
+
+def compile_requirements(worker_requirements) -> WorkerRequirements:
+    """
+    `worker_requirements` compiled, or the already compiled requirements for
+    an equal list of slots.
+    """
+    if type(worker_requirements) is WorkerRequirements:
+        return worker_requirements
+    slots = tuple(worker_requirements)
+    compiled = _COMPILED.get(slots)
+    if compiled is None:
+        compiled = _COMPILED[slots] = _compile(slots)
+    return compiled
+
+
+def _compile(slots: tuple) -> WorkerRequirements:
+    fixed_counts = {}
+    fixed, logical_or, any_role = [], [], []
+    slot_masks = []
+    for index, requirement in enumerate(slots):
+        if requirement is EmployeeRole.ANY:
+            any_role.append(index)
+            slot_masks.append(ALL_ROLES)
+        elif type(requirement) is tuple:
+            logical_or.append(index)
+            slot_masks.append(role_mask(requirement))
+        else:
+            fixed.append(index)
+            fixed_counts[requirement] = fixed_counts.get(requirement, 0) + 1
+            slot_masks.append(ROLE_BITS[requirement])
+
+    demand = [0] * (ALL_ROLES + 1)
+    for slot_mask in slot_masks:
+        _add_demand(demand, slot_mask, 1)
+
+    return WorkerRequirements(
+        fixed=tuple(sorted(fixed_counts.items(), key=lambda item: item[0].value)),
+        logical_or=tuple(slots[index] for index in logical_or),
+        any_count=len(any_role),
+        slots=slots,
+        fill_order=tuple(fixed + logical_or + any_role),
+        slot_masks=tuple(slot_masks),
+        demand=tuple(demand),
+        checks=_hall_checks(demand),
+    )
+
+
+def role_mask(roles) -> int:
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS[role]
+    return mask
+
+
+def _add_demand(demand: list, slot_mask: int, count: int):
+    # A slot counts towards every set of roles that covers all it accepts
+    for mask in range(1, ALL_ROLES + 1):
+        if slot_mask & ~mask == 0:
+            demand[mask] += count
+
+
+def _hall_checks(demand) -> tuple:
+    """
+    The entries of `demand` worth testing.  A role set whose demand is no more
+    than one of its subsets' is implied by that subset, since adding roles only
+    adds supply.
+    """
+    checks = []
+    for mask in range(1, ALL_ROLES + 1):
+        if not demand[mask]:
+            continue
+        subsets = (sub for sub in range(1, mask) if sub & ~mask == 0)
+        if all(demand[sub] < demand[mask] for sub in subsets):
+            checks.append((MASK_ROLES[mask], demand[mask]))
+    return tuple(checks)
+
+
+def role_supply(free: dict) -> list:
+    """
+    Free workers per role mask, the supply side of `demand`.
+    """
+    supply = [0] * (ALL_ROLES + 1)
+    for mask in range(1, ALL_ROLES + 1):
+        low = mask & -mask
+        supply[mask] = supply[mask ^ low] + free[ASSIGNABLE_EMPLOYEE_ROLES[low.bit_length() - 1]]
+    return supply
+
+
+def fits(requirements: WorkerRequirements, free: dict) -> bool:
+    """
+    Answer whether `requirements` can be staffed from `free` (role -> count).
+
+    Exact: by Hall's theorem the slots can all be matched to free workers if,
+    for every set of roles, the slots only those roles can fill are no more
+    than the workers free in those roles.  With three roles that is at most
+    seven comparisons, precompiled in `requirements.checks`.  `free` is left
+    untouched.
+    """
+    for roles, count in requirements.checks:
+        supply = 0
+        for role in roles:
+            supply += free[role]
+        if supply < count:
+            return False
+    return True
+
+
+def allocate(requirements: WorkerRequirements, free: dict):
+    """
+    Resolve every slot of `requirements` to a concrete role, taking the counts
+    out of `free`.
+
+    Returns a tuple of roles lined up with `requirements.slots`, or None (with
+    `free` untouched) when the requirements do not fit.  Flexible slots take
+    the least scarce role they accept, the one with the most free workers
+    beyond what the remaining fixed slots need, as long as the rest of the
+    crew can still be staffed.
+    """
+    if not fits(requirements, free):
+        return None
+    roles = [None] * len(requirements.slots)
+    demand = list(requirements.demand)
+    for index in requirements.fill_order:
+        slot_mask = requirements.slot_masks[index]
+        _add_demand(demand, slot_mask, -1)
+        options = MASK_ROLES[slot_mask]
+        if len(options) > 1:
+            if type(requirements.slots[index]) is tuple:
+                # Keep the slot's own order between equally scarce roles
+                options = requirements.slots[index]
+            options = sorted(
+                options, key=lambda role: demand[ROLE_BITS[role]] - free[role]
+            )
+        for role in options:
+            if free[role] <= 0:
+                continue
+            free[role] -= 1
+            if len(options) == 1 or _covers(role_supply(free), demand):
+                roles[index] = role
+                break
+            free[role] += 1
+    return tuple(roles)
+
+
+def _covers(supply: list, demand) -> bool:
+    for mask in range(1, ALL_ROLES + 1):
+        if demand[mask] > supply[mask]:
+            return False
+    return True
+
+
+class DayDemand:
+    """
+    Combined demand of the buildings accepted for one day.
+
+    A building is only accepted if every accepted building, itself included,
+    can still be staffed together from the day's free workers.  Roles are
+    resolved for the whole set at the end, so an earlier building never
+    strands a role a later one needs.  Taking buildings in priority order this
+    way accepts every building that can join the ones ahead of it.
+    """
+
+    def __init__(self, free: dict):
+        self.free = free
+        self.supply = role_supply(free)
+        self.demand = [0] * (ALL_ROLES + 1)
+        self.accepted = []
+
+    def fits(self, requirements: WorkerRequirements) -> bool:
+        for mask in range(1, ALL_ROLES + 1):
+            if self.demand[mask] + requirements.demand[mask] > self.supply[mask]:
+                return False
+        return True
+
+    def add(self, requirements: WorkerRequirements) -> bool:
+        if not self.fits(requirements):
+            return False
+        for mask in range(1, ALL_ROLES + 1):
+            self.demand[mask] += requirements.demand[mask]
+        self.accepted.append(requirements)
+        return True
+
+    def allocate(self) -> list:
+        """
+        Resolve roles for every accepted building, taking them out of `free`.
+        Returns one tuple of slot roles per accepted building, in order.
+        """
+        # Not memoised: every day's combination of buildings is different
+        combined = _compile(
+            tuple(slot for requirements in self.accepted for slot in requirements.slots)
+        )
+        roles = allocate(combined, self.free)
+        allocated = []
+        start = 0
+        for requirements in self.accepted:
+            allocated.append(roles[start:start + len(requirements)])
+            start += len(requirements)
+        return allocated
@@ -0,0 +1,124 @@
+""" Role Count Solver """
+
+from time import perf_counter
+from typing import Iterator
+
+from building_scheduler.building_queue import BuildingQueue
+from building_scheduler.building_scheduler import DailyBuildingSchedule
+from building_scheduler.requirements import DayDemand, allocate
+
+
+ALLOCATION_MODES = ("building", "day")
+
+
+class RoleCountSolver:
+    """
+    Scheduling engine that plans the whole week on per-day role counts.
+
+    Employees sharing a role are interchangeable for feasibility, so planning
+    only works with a few integers per day and its cost depends on buildings x
+    days, not on the size of the roster.  Actual employees are bound to slots
+    once the plan is settled.
+
+    Plug it in with `BuildingScheduler(buildings, roster, engine=RoleCountSolver())`.
+
+    `mode` is "building" (each building's roles are settled as it is taken,
+    matching the default engine) or "day" (roles are settled once per day for
+    every building taken, which can fit more buildings into a day).
+    """
+
+    def __init__(self, mode: str = "building"):
+        if mode not in ALLOCATION_MODES:
+            raise ValueError(f"Unknown allocation mode {mode!r}, expected one of {ALLOCATION_MODES}")
+        self.mode = mode
+
+    def plan(self, queue: BuildingQueue, day_counts: dict) -> dict:
+        """
+        Plan every day in `day_counts` (day -> role -> free count) in order.
+
+        Returns day -> list of (queue position, slot roles).  Planned positions
+        are marked scheduled on `queue` and the counts are consumed.
+        """
+        return {day: plan_day(queue, free, self.mode) for day, free in day_counts.items()}
+
+    def iter_weekly_schedule(self, scheduler):
+        """
+        Plan each day on role counts, then bind and yield its buildings before
+        planning the next day.
+        """
+        roster = scheduler.roster
+        stats = scheduler.stats
+        for day in scheduler.daily_schedules:
+            if stats is not None:
+                stats.emit("day_started", day=day)
+                started = perf_counter()
+            planned = plan_day(scheduler.queue, roster.free_counts[day].copy(), self.mode)
+            if stats is not None:
+                stats.record_day_time(day, perf_counter() - started)
+            for building_schedule in bind_day(scheduler, day, planned):
+                yield day, building_schedule
+            if stats is not None:
+                stats.emit("day_finished", day=day)
+
+
+def plan_day(queue: BuildingQueue, free: dict, mode: str = "building") -> list:
+    """
+    Take pending buildings from `queue` in priority order while `free` can
+    staff them, with the same signature skipping and early exit as
+    `BuildingScheduler.generate_daily_schedule`.
+
+    In "day" mode a building is taken whenever it can be staffed together with
+    the ones already taken, and roles are settled for all of them at the end.
+
+    Multi-day installs need the same people on several days, which role
+    counts cannot tell apart, so they are left to the default engine.
+    """
+    if any(duration > 1 for duration in queue.signature_durations):
+        raise ValueError("Multi-day installs need the default scheduling engine")
+    if mode == "day":
+        return _plan_day_jointly(queue, free)
+    planned = []
+    rejected = set()
+    for position in queue.positions():
+        signature = queue.signature_of[position]
+        if signature in rejected:
+            continue
+        slot_roles = allocate(queue.signatures[signature], free)
+        if slot_roles is None:
+            rejected.add(signature)
+            if len(rejected) == len(queue.pending_by_signature):
+                break
+        else:
+            planned.append((position, slot_roles))
+            queue.mark_scheduled(position)
+    return planned
+
+
+def _plan_day_jointly(queue: BuildingQueue, free: dict) -> list:
+    day = DayDemand(free)
+    positions = []
+    rejected = set()
+    for position in queue.positions():
+        signature = queue.signature_of[position]
+        if signature in rejected:
+            continue
+        if day.add(queue.signatures[signature]):
+            positions.append(position)
+        else:
+            # Demand only grows through the day, so the signature stays out
+            rejected.add(signature)
+            if len(rejected) == len(queue.pending_by_signature):
+                break
+    for position in positions:
+        queue.mark_scheduled(position)
+    return list(zip(positions, day.allocate()))
+
+
+def bind_day(scheduler, day: str, planned: list) -> Iterator[DailyBuildingSchedule]:
+    """
+    Book real employees from the scheduler's roster onto a planned day.
+    """
+    roster = scheduler.roster
+    for position, slot_roles in planned:
+        employees = [roster.schedule_employee(day, role) for role in slot_roles]
+        yield scheduler.place(day, position, employees)
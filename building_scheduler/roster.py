@@ -1,81 +1,322 @@
-from typing import Set
+from typing import Iterable, Set
 from building_scheduler.employee import (
     Employee,
     EmployeeRole,
     ASSIGNABLE_EMPLOYEE_ROLES,
+    DAY_BITS,
+    DAYS_OF_WEEK,
 )
+from building_scheduler.requirements import allocate, compile_requirements, fits
+from building_scheduler.stats import SchedulerStats
+
+
+WEEKDAYS = DAYS_OF_WEEK[:5]
 
 
 class NoEmployeeAvailable(Exception):
     pass
 
 
+class ScheduledDays(dict):
+    """
+    Day -> set of scheduled employees.
+
+    Replacing a whole day (`roster.scheduled["Monday"] = {...}`) rebuilds the
+    roster's free pools for that day so they never drift from this mapping.
+    """
+
+    def __init__(self, roster: "Roster", days: list[str]):
+        super().__init__((day, set()) for day in days)
+        self._roster = roster
+
+    def __setitem__(self, day, employees):
+        super().__setitem__(day, employees)
+        self._roster._rebuild_day(day)
+        if self._roster.selection is not None:
+            # Bookings moved, so every day's selection order may have changed
+            for other_day in self:
+                self._roster.selection.reset(other_day)
+
+
 class Roster:
-    def __init__(self, employees: Set[Employee]):
-        self.employees = employees
-        self.scheduled = {
-            "Monday": set(),
-            "Tuesday": set(),
-            "Wednesday": set(),
-            "Thursday": set(),
-            "Friday": set(),
+    def __init__(
+        self,
+        employees: Iterable[Employee] = (),
+        stats: SchedulerStats = None,
+        selection=None,
+        calendar=None,
+    ):
+        self.employees = list(employees)
+        self.stats = stats
+        # Days to schedule, weekday bits for recurring days off and one-off
+        # leave, from a `horizon.CalendarWeek` or the plain working week
+        if calendar is None:
+            days, self.day_bits, self.leave = WEEKDAYS, DAY_BITS, {}
+        else:
+            days, self.day_bits, self.leave = calendar.days, calendar.day_bits, calendar.leave
+        # Optional policy choosing which free employee to book, see `selection`
+        self.selection = selection
+        if selection is not None:
+            selection.attach(self)
+        # Free pools keyed by (day, role).  Dicts are used as insertion-ordered
+        # sets so taking an employee is an O(1) `popitem()`.
+        self._free = {}
+        # Day -> role -> number of free employees, kept in step with the pools
+        self.free_counts = {}
+        # Employee -> bitset of the days they are in a free pool, one bit per
+        # day in schedule order, so a crew free across several days is a mask
+        self.free_days = {}
+        self._day_masks = {day: 1 << index for index, day in enumerate(days)}
+        self.scheduled = ScheduledDays(self, days)
+        for day in self.scheduled:
+            self._rebuild_day(day)
+            if selection is not None:
+                selection.reset(day)
+
+    def _rebuild_day(self, day):
+        self._build_pools(day)
+        day_mask = self._day_masks[day]
+        free_days = self.free_days
+        for emp in self.employees:
+            free_days[emp] = free_days.get(emp, 0) & ~day_mask
+        for role in ASSIGNABLE_EMPLOYEE_ROLES:
+            for emp in self._free[(day, role)]:
+                free_days[emp] |= day_mask
+
+    def _build_pools(self, day: str):
+        scheduled = self.scheduled[day]
+        day_bit = self.day_bits.get(day, 0)
+        leave = self.leave.get(day, ())
+        for role in ASSIGNABLE_EMPLOYEE_ROLES:
+            self._free[(day, role)] = {}
+        for emp in self.employees:
+            if emp.days_off_mask & day_bit or emp in scheduled or emp in leave:
+                continue
+            if emp.role in ASSIGNABLE_EMPLOYEE_ROLES:
+                self._free[(day, emp.role)][emp] = None
+        self.free_counts[day] = {
+            role: len(self._free[(day, role)]) for role in ASSIGNABLE_EMPLOYEE_ROLES
         }
+        if self.stats is not None:
+            self.stats.employees_scanned += len(self.employees)
+
+    def add_employee(self, employee: Employee):
+        """
+        Add one employee to the roster, updating every day's pools in place.
+        """
+        self.employees.append(employee)
+        if self.selection is not None:
+            self.selection.add_employee(employee)
+        if employee.role not in ASSIGNABLE_EMPLOYEE_ROLES:
+            return
+        self.free_days[employee] = 0
+        for day in self.scheduled:
+            if not self.is_off(employee, day):
+                self._free[(day, employee.role)][employee] = None
+                self.free_counts[day][employee.role] += 1
+                self.free_days[employee] |= self._day_masks[day]
+                if self.selection is not None:
+                    self.selection.push(day, employee)
+
+    def release(self, day: str, employee: Employee):
+        """
+        Un-schedule `employee` on `day`, returning them to the free pool unless
+        it is one of their days off.
+        """
+        scheduled = self.scheduled[day]
+        if employee not in scheduled:
+            return
+        scheduled.discard(employee)
+        if employee.role in ASSIGNABLE_EMPLOYEE_ROLES and not self.is_off(employee, day):
+            self._free[(day, employee.role)][employee] = None
+            self.free_counts[day][employee.role] += 1
+            self.free_days[employee] |= self._day_masks[day]
+            if self.selection is not None:
+                self.selection.refresh(employee)
+
+    def is_off(self, employee: Employee, day) -> bool:
+        return bool(
+            employee.days_off_mask & self.day_bits.get(day, 0)
+            or employee in self.leave.get(day, ())
+        )
+
+    def set_day_off(self, employee: Employee, day: str, off: bool = True):
+        """
+        Give `employee` `day` off (or take it back), keeping that day's pool in
+        step.  Does not touch an existing booking, see `release()`.
+
+        The day off is recorded as one day of leave on this roster, so the
+        shared `Employee` is left alone, and taking it back never clears one
+        of the employee's recurring days off.
+        """
+        if off:
+            self.leave.setdefault(day, set()).add(employee)
+        else:
+            self.leave.get(day, set()).discard(employee)
+        if employee.role not in ASSIGNABLE_EMPLOYEE_ROLES:
+            return
+        pool = self._free[(day, employee.role)]
+        if off and employee in pool:
+            del pool[employee]
+            self.free_counts[day][employee.role] -= 1
+            self.free_days[employee] &= ~self._day_masks[day]
+        elif (
+            not off
+            and employee not in pool
+            and employee not in self.scheduled[day]
+            and not self.is_off(employee, day)
+        ):
+            pool[employee] = None
+            self.free_counts[day][employee.role] += 1
+            self.free_days[employee] |= self._day_masks[day]
+            if self.selection is not None:
+                self.selection.push(day, employee)
+
+    def _pool_roles(self, role) -> list:
+        if role is EmployeeRole.ANY:
+            return ASSIGNABLE_EMPLOYEE_ROLES
+        elif type(role) is tuple:
+            return role
+        return [role]
 
     def schedule_employee(self, day: str, role=EmployeeRole.ANY) -> Employee:
-        available = self.get_available_employees(day, role)
-        if len(available) == 0:
-            raise NoEmployeeAvailable
+        scheduled = self.scheduled[day]
+        for pool_role in self._pool_roles(role):
+            pool = self._free[(day, pool_role)]
+            if pool:
+                if self.selection is None:
+                    first_available, _ = pool.popitem()
+                else:
+                    first_available = self.selection.pick(day, pool_role, pool)
+                    del pool[first_available]
+                self.free_counts[day][pool_role] -= 1
+                self.free_days[first_available] &= ~self._day_masks[day]
+                scheduled.add(first_available)
+                if self.stats is not None:
+                    self.stats.record_slot(day, pool_role)
+                return first_available
+        raise NoEmployeeAvailable
 
-        first_available = next(iter(available))
-        self.scheduled[day].add(first_available)
-        return first_available
+    def _book(self, day, employee: Employee):
+        del self._free[(day, employee.role)][employee]
+        self.free_counts[day][employee.role] -= 1
+        self.free_days[employee] &= ~self._day_masks[day]
+        self.scheduled[day].add(employee)
+        if self.selection is not None:
+            self.selection.picked(day, employee)
+        if self.stats is not None:
+            self.stats.record_slot(day, employee.role)
 
     def get_available_employees(self, day, role) -> Set:
-        available_employees = {
-            emp for emp in self.employees if emp.is_available(day, role)
-        }
-        if role in ASSIGNABLE_EMPLOYEE_ROLES:
-            return available_employees - {
-                emp for emp in self.scheduled[day] if emp.role == role
-            }
-        return available_employees - {emp for emp in self.scheduled[day]}
+        available_employees = set()
+        for pool_role in self._pool_roles(role):
+            available_employees.update(self._free[(day, pool_role)])
+        if self.stats is not None:
+            self.stats.employees_scanned += len(available_employees)
+        return available_employees
 
     def meets_worker_requirements(self, day: str, required_workers: list) -> bool:
-        requirements_met = True
-        available = {}
-        available[EmployeeRole.CERTIFIED_INSTALLER] = self.get_available_employees(
-            day, EmployeeRole.CERTIFIED_INSTALLER
-        )
-        available[EmployeeRole.PENDING_INSTALLER] = self.get_available_employees(
-            day, EmployeeRole.PENDING_INSTALLER
-        )
-        available[EmployeeRole.LABOURER] = self.get_available_employees(
-            day, EmployeeRole.LABOURER
+        return self.can_staff(day, required_workers)
+
+    def can_staff(self, day: str, required_workers) -> bool:
+        """
+        Answer whether `required_workers` can be staffed on `day` using only the
+        per-role free counters.
+
+        Accepts a raw requirement list or a compiled `WorkerRequirements`.
+        The check is exact, see `requirements.fits()`.
+        """
+        if self.stats is not None:
+            self.stats.availability_checks += 1
+        return fits(compile_requirements(required_workers), self.free_counts[day])
+
+    def feasible_many(self, day: str, requirements_list: list) -> list[bool]:
+        """
+        `can_staff()` for a batch of requirement vectors on `day`.
+        """
+        if self.stats is not None:
+            self.stats.availability_checks += len(requirements_list)
+        free = self.free_counts[day]
+        return [fits(compile_requirements(req), free) for req in requirements_list]
+
+    def span_mask(self, days) -> int:
+        mask = 0
+        for day in days:
+            mask |= self._day_masks[day]
+        return mask
+
+    def free_across(self, days, role) -> list[Employee]:
+        """
+        Employees of `role` free on every one of `days`, in the order
+        `schedule_employee()` would take them on the first day.
+
+        One AND per employee in the first day's pool, however many days, plus
+        a sort when a selection policy orders them.
+        """
+        mask = self.span_mask(days)
+        free_days = self.free_days
+        pool = self._free[(days[0], role)]
+        if self.selection is not None:
+            return self.selection.order(emp for emp in pool if free_days[emp] & mask == mask)
+        return [emp for emp in reversed(pool) if free_days[emp] & mask == mask]
+
+    def span_counts(self, days) -> dict:
+        """
+        Role -> employees free on every one of `days`.
+        """
+        if len(days) == 1:
+            return self.free_counts[days[0]]
+        mask = self.span_mask(days)
+        free_days = self.free_days
+        counts = {}
+        for role in ASSIGNABLE_EMPLOYEE_ROLES:
+            count = 0
+            for emp in self._free[(days[0], role)]:
+                if free_days[emp] & mask == mask:
+                    count += 1
+            counts[role] = count
+        return counts
+
+    def can_staff_span(self, days, required_workers) -> bool:
+        """
+        `can_staff()` for one crew working every one of `days`.
+        """
+        if self.stats is not None:
+            self.stats.availability_checks += 1
+        return fits(compile_requirements(required_workers), self.span_counts(days))
+
+    def staff_span(self, days, required_workers) -> list[Employee]:
+        """
+        Book one crew for `required_workers` on every one of `days`.  Returns
+        the crew lined up with the requirement slots.
+        """
+        if len(days) == 1:
+            return self.staff(days[0], required_workers)
+        requirements = compile_requirements(required_workers)
+        candidates = {role: self.free_across(days, role) for role in ASSIGNABLE_EMPLOYEE_ROLES}
+        roles = allocate(
+            requirements, {role: len(employees) for role, employees in candidates.items()}
         )
+        if roles is None:
+            raise NoEmployeeAvailable
+        taking = {role: iter(employees) for role, employees in candidates.items()}
+        crew = [next(taking[role]) for role in roles]
+        for day in days:
+            for employee in crew:
+                self._book(day, employee)
+        return crew
 
-        for requirement in required_workers:
-            # TODO typechecking here indicates that I need a new abstraction
-            # to handle a "worker requirement slot" but that can be post-MVP
-            if requirement is EmployeeRole.ANY:
-                any_requirement_met = False
-                for role in ASSIGNABLE_EMPLOYEE_ROLES:
-                    if len(available[role]) > 0:
-                        available[role].pop()
-                        any_requirement_met = True
-                        break
-                requirements_met = requirements_met and any_requirement_met
-            elif type(requirement) is EmployeeRole:
-                if len(available[requirement]) > 0:
-                    available[requirement].pop()
-                else:
-                    requirements_met = False
-            elif type(requirement) is tuple:
-                or_requirement_met = False
-                for or_requirement in requirement:
-                    if len(available[or_requirement]) > 0:
-                        available[or_requirement].pop()
-                        or_requirement_met = True
-                        break
-                requirements_met = requirements_met and or_requirement_met
-
-        return requirements_met
+    def staff(self, day: str, required_workers) -> list[Employee]:
+        """
+        Schedule one employee per slot of `required_workers` on `day`.
+
+        Each slot's role is settled by `requirements.allocate()` before anyone
+        is booked, so flexible slots take the least scarce role that still
+        leaves the rest of the crew staffable.  The returned list lines up with
+        the requirement slots.
+        """
+        requirements = compile_requirements(required_workers)
+        roles = allocate(requirements, self.free_counts[day].copy())
+        if roles is None:
+            raise NoEmployeeAvailable
+        return [self.schedule_employee(day, role) for role in roles]
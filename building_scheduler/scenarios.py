@@ -0,0 +1,174 @@
+""" What-if Scenarios
+
+Compare how much of the backlog gets done under roster or calendar changes,
+e.g. one more labourer, or two certified installers off on Friday, without
+building a roster per variant.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+from building_scheduler.building_queue import BuildingQueue
+from building_scheduler.employee import EmployeeRole
+from building_scheduler.role_count_solver import RoleCountSolver
+from building_scheduler.roster import Roster
+
+
+class AddEmployees(NamedTuple):
+    """
+    `count` more employees of `role`, each off on `days_off`.
+    """
+
+    role: EmployeeRole
+    count: int = 1
+    days_off: tuple = ()
+
+    def apply(self, day_counts: dict):
+        for day, counts in day_counts.items():
+            if day not in self.days_off:
+                counts[self.role] += self.count
+
+
+class DaysOff(NamedTuple):
+    """
+    `count` employees of `role` off on each of `days`, every scheduled day by
+    default, which amounts to taking them off the roster.
+    """
+
+    role: EmployeeRole
+    count: int = 1
+    days: Optional[tuple] = None
+
+    def apply(self, day_counts: dict):
+        for day in day_counts if self.days is None else self.days:
+            counts = day_counts[day]
+            counts[self.role] = max(0, counts[self.role] - self.count)
+
+
+class Scenario(NamedTuple):
+    name: str
+    changes: tuple = ()
+
+
+class ScenarioResult(NamedTuple):
+    name: str
+    buildings_completed: int
+    buildings_remaining: int
+    idle_employee_days: int
+
+
+class ScenarioBase(NamedTuple):
+    """
+    State shared by every variant of one problem: the pending queue and the
+    free count of each role on each day.
+
+    Scenarios are planned on role counts, which cannot keep one crew across
+    several days, so a queue with multi-day installs is rejected.
+    """
+
+    queue: BuildingQueue
+    day_counts: dict
+
+    @classmethod
+    def from_problem(cls, buildings, roster: Roster) -> "ScenarioBase":
+        queue = buildings if isinstance(buildings, BuildingQueue) else BuildingQueue(buildings)
+        if any(duration > 1 for duration in queue.signature_durations):
+            raise ValueError(
+                "What-if scenarios cannot include multi-day installs; "
+                "schedule them with BuildingScheduler instead"
+            )
+        return cls(queue, {day: roster.free_counts[day].copy() for day in roster.scheduled})
+
+
+def evaluate(base: ScenarioBase, scenario: Scenario, mode: str = "building") -> ScenarioResult:
+    """
+    Plan the week for one variant of `base` on role counts.
+
+    Only the queue's bookkeeping and the day counts are copied; buildings and
+    compiled requirements stay shared with `base`.
+    """
+    queue = base.queue.copy()
+    day_counts = {day: counts.copy() for day, counts in base.day_counts.items()}
+    for change in scenario.changes:
+        change.apply(day_counts)
+    plan = RoleCountSolver(mode).plan(queue, day_counts)
+    return ScenarioResult(
+        name=scenario.name,
+        buildings_completed=sum(len(planned) for planned in plan.values()),
+        buildings_remaining=len(queue),
+        idle_employee_days=sum(sum(counts.values()) for counts in day_counts.values()),
+    )
+
+
+def _evaluate_chunk(base: ScenarioBase, scenarios: list, mode: str) -> list[ScenarioResult]:
+    return [evaluate(base, scenario, mode) for scenario in scenarios]
+
+
+def compare_scenarios(
+    buildings,
+    roster: Roster,
+    scenarios: Iterable[Scenario],
+    mode: str = "building",
+    include_base: bool = True,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> list[ScenarioResult]:
+    """
+    Evaluate every scenario against the same buildings and roster, one row
+    per scenario in input order, led by an unchanged "base" row.
+
+    The base queue and day counts are computed once.  Scenarios are split into
+    one chunk per worker, so each worker receives the base state once and
+    reuses it for its whole chunk.  Pass `executor` to reuse an existing pool;
+    it is left running.
+    """
+    scenarios = list(scenarios)
+    if include_base:
+        scenarios.insert(0, Scenario("base"))
+    if not scenarios:
+        return []
+    base = ScenarioBase.from_problem(buildings, roster)
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(scenarios))
+    chunksize = -(-len(scenarios) // max_workers)
+    chunks = [
+        scenarios[start:start + chunksize]
+        for start in range(0, len(scenarios), chunksize)
+    ]
+    if len(chunks) == 1 and executor is None:
+        return _evaluate_chunk(base, chunks[0], mode)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [executor.submit(_evaluate_chunk, base, chunk, mode) for chunk in chunks]
+        return [result for future in futures for result in future.result()]
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+
+def format_table(results: list[ScenarioResult]) -> str:
+    """
+    Render results as a plain text table.
+    """
+    header = ("scenario", "completed", "remaining", "idle employee-days")
+    rows = [header] + [
+        (
+            result.name,
+            str(result.buildings_completed),
+            str(result.buildings_remaining),
+            str(result.idle_employee_days),
+        )
+        for result in results
+    ]
+    widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if column == 0 else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    )
@@ -0,0 +1,120 @@
+""" Schedule Cache """
+
+from collections import OrderedDict
+
+from building_scheduler.employee import ASSIGNABLE_EMPLOYEE_ROLES
+from building_scheduler.role_count_solver import RoleCountSolver, bind_day
+
+
+EVICTION_POLICIES = ("lru", "fifo")
+
+
+class ScheduleCache:
+    """
+    Bounded cache of role-count schedules, usable as a `BuildingScheduler`
+    engine: `BuildingScheduler(buildings, roster, engine=cache)`.
+
+    Problems are keyed by their canonical shape: the requirement signatures of
+    the pending buildings in priority order, plus the free count of each role on
+    each day.  Employees sharing a role are interchangeable for the role-count
+    solver, so any two problems with the same shape have the same plan, and a
+    hit only binds that roster's employees onto the cached slots.
+
+    `policy` is "lru" (a hit refreshes an entry) or "fifo" (entries leave in
+    insertion order).
+    """
+
+    def __init__(self, maxsize: int = 1024, policy: str = "lru", solver: RoleCountSolver = None):
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy {policy!r}, expected one of {EVICTION_POLICIES}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.solver = solver or RoleCountSolver()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: tuple):
+        plan = self._entries.get(key)
+        if plan is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == "lru":
+            self._entries.move_to_end(key)
+        return plan
+
+    def put(self, key: tuple, plan: tuple):
+        if key in self._entries:
+            self._entries[key] = plan
+            return
+        while len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        self._entries[key] = plan
+
+    def iter_weekly_schedule(self, scheduler):
+        queue = scheduler.queue
+        pending = list(queue.positions())
+        key = shape_key(scheduler, pending)
+        plan = self.get(key)
+        if plan is None:
+            plan = self._solve(scheduler, pending)
+            self.put(key, plan)
+        else:
+            # Mark the whole plan scheduled up front, as a fresh solve would
+            for day_plan in plan:
+                for rank, _ in day_plan:
+                    queue.mark_scheduled(pending[rank])
+
+        for day, day_plan in zip(scheduler.daily_schedules, plan):
+            planned = [(pending[rank], slot_roles) for rank, slot_roles in day_plan]
+            for building_schedule in bind_day(scheduler, day, planned):
+                yield day, building_schedule
+
+    def _solve(self, scheduler, pending: list[int]) -> tuple:
+        """
+        Plan the week and express it in pending-queue ranks rather than
+        positions, so it applies to any problem of the same shape.
+        """
+        rank_of = {position: rank for rank, position in enumerate(pending)}
+        day_counts = {
+            day: scheduler.roster.free_counts[day].copy()
+            for day in scheduler.daily_schedules
+        }
+        week_plan = self.solver.plan(scheduler.queue, day_counts)
+        return tuple(
+            tuple((rank_of[position], slot_roles) for position, slot_roles in week_plan[day])
+            for day in scheduler.daily_schedules
+        )
+
+
+def shape_key(scheduler, pending: list[int] = None) -> tuple:
+    """
+    Canonical, hashable shape of a scheduler's remaining problem.
+    """
+    queue = scheduler.queue
+    if pending is None:
+        pending = list(queue.positions())
+    buildings = tuple(queue.requirements(position) for position in pending)
+    free_counts = scheduler.roster.free_counts
+    days = tuple(
+        (day, tuple(free_counts[day][role] for role in ASSIGNABLE_EMPLOYEE_ROLES))
+        for day in scheduler.daily_schedules
+    )
+    return buildings, days
@@ -0,0 +1,139 @@
+""" Columnar Schedule Result """
+
+from array import array
+from collections.abc import Mapping
+from typing import Iterable, Iterator
+
+from building_scheduler.building_scheduler import DailyBuildingSchedule
+from building_scheduler.employee import Employee
+
+
+class ScheduleResult:
+    """
+    A week's assignments as parallel integer columns, one row per staffed
+    slot:
+
+    - `day`: index into `days`
+    - `building`: the building's queue position, an index into `buildings`
+    - `slot`: the slot within the building's requirements
+    - `employee`: index into `employees`
+
+    `placement_start` holds the first row of each staffed building, in the
+    order they were staffed, and `day_placements` lists each day's
+    placements so a day is looked up without scanning the week.  Names and
+    `DailyBuildingSchedule` objects are only built when asked for;
+    `daily_schedules` is a read-only view in the shape of
+    `BuildingScheduler.daily_schedules`.  Columns export without copying
+    through the buffer protocol, e.g. `memoryview(result.day)` or
+    `numpy.frombuffer(result.employee, dtype=result.employee.typecode)`.
+    """
+
+    def __init__(self, days: Iterable, buildings: list, employees: Iterable[Employee]):
+        self.days = list(days)
+        self.buildings = buildings
+        self.employees = list(employees)
+        self._day_ids = {day: index for index, day in enumerate(self.days)}
+        self._employee_ids = {employee: index for index, employee in enumerate(self.employees)}
+        self.day = array("l")
+        self.building = array("l")
+        self.slot = array("l")
+        self.employee = array("l")
+        self.placement_start = array("l")
+        self.day_placements = [array("l") for _ in self.days]
+
+    @classmethod
+    def from_scheduler(cls, scheduler) -> "ScheduleResult":
+        """
+        Schedule the week straight into columns, streaming it from
+        `iter_weekly_schedule()`.  The scheduler's `daily_schedules` stays
+        empty.
+        """
+        result = cls(scheduler.daily_schedules, scheduler.queue.buildings, scheduler.roster.employees)
+        for day, building_schedule in scheduler.iter_weekly_schedule():
+            result.append(day, building_schedule)
+        return result
+
+    def append(self, day, building_schedule: DailyBuildingSchedule):
+        day_id = self._day_ids[day]
+        employee_ids = self._employee_ids
+        self.day_placements[day_id].append(len(self.placement_start))
+        self.placement_start.append(len(self.day))
+        for slot, employee in enumerate(building_schedule.employees):
+            self.day.append(day_id)
+            self.building.append(building_schedule.position)
+            self.slot.append(slot)
+            self.employee.append(employee_ids[employee])
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    def columns(self) -> dict:
+        """
+        Column name -> zero-copy `memoryview` of the column.
+        """
+        return {
+            "day": memoryview(self.day),
+            "building": memoryview(self.building),
+            "slot": memoryview(self.slot),
+            "employee": memoryview(self.employee),
+        }
+
+    def employee_name(self, row: int) -> str:
+        return self.employees[self.employee[row]].name
+
+    def schedule_at(self, placement: int) -> tuple:
+        """
+        (day, DailyBuildingSchedule) for the `placement`-th staffed building.
+        """
+        start = self.placement_start[placement]
+        end = (
+            self.placement_start[placement + 1]
+            if placement + 1 < len(self.placement_start)
+            else len(self.day)
+        )
+        day_id = self.day[start]
+        position = self.building[start]
+        building = self.buildings[position]
+        days = None
+        if building.duration > 1:
+            days = tuple(self.days[day_id:day_id + building.duration])
+        employees = [self.employees[self.employee[row]] for row in range(start, end)]
+        return self.days[day_id], DailyBuildingSchedule(building, employees, position, days)
+
+    def iter_schedules(self) -> Iterator[tuple]:
+        """
+        (day, DailyBuildingSchedule) pairs in the order buildings were staffed,
+        the same stream `BuildingScheduler.iter_weekly_schedule()` yields.
+        """
+        for placement in range(len(self.placement_start)):
+            yield self.schedule_at(placement)
+
+    @property
+    def daily_schedules(self) -> "DailySchedulesView":
+        return DailySchedulesView(self)
+
+
+class DailySchedulesView(Mapping):
+    """
+    Day -> list of DailyBuildingSchedule, built from the columns each time a
+    day is looked up.
+    """
+
+    def __init__(self, result: ScheduleResult):
+        self._result = result
+
+    def __getitem__(self, day) -> list[DailyBuildingSchedule]:
+        result = self._result
+        return [
+            result.schedule_at(placement)[1]
+            for placement in result.day_placements[result._day_ids[day]]
+        ]
+
+    def __iter__(self):
+        return iter(self._result.days)
+
+    def __len__(self) -> int:
+        return len(self._result.days)
+
+    def __repr__(self):
+        return repr(dict(self))
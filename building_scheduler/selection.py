@@ -0,0 +1,142 @@
+""" Employee Selection Policies
+
+Which free employee of a role `Roster.schedule_employee` books.  Without a
+policy the roster takes the most recently pooled employee; a policy spreads
+the work instead:
+
+- `LeastBooked`: the employee with the fewest bookings this week
+- `RoundRobin`: the employee of that role picked least recently
+
+Both break ties by position in `Roster.employees`, so a roster built from
+the same list always produces the same schedule.  Pass one instance per
+roster, e.g. `Roster(employees, selection=LeastBooked())`.
+"""
+
+from abc import ABCMeta, abstractmethod
+from heapq import heapify, heappop, heappush, heapreplace
+
+from building_scheduler.employee import Employee, ASSIGNABLE_EMPLOYEE_ROLES
+
+
+class HeapSelection(metaclass=ABCMeta):
+    """
+    Base for policies that pick the free employee with the smallest key.
+
+    Each (day, role) pool has a heap of (key, sequence) entries.  Keys only
+    grow while an employee sits in a pool, so entries are updated lazily: an
+    outdated entry is re-keyed when it reaches the top and an entry for an
+    employee no longer in the pool is dropped.  The roster calls `refresh()`
+    when a key may have dropped instead.  A pick is O(log n) amortised.
+    """
+
+    def __init__(self):
+        self.roster = None
+        self._sequence = {}
+        self._heaps = {}
+
+    def attach(self, roster):
+        if self.roster is not None and self.roster is not roster:
+            raise ValueError("A selection policy can only serve one roster")
+        self.roster = roster
+        self._sequence = {employee: index for index, employee in enumerate(roster.employees)}
+
+    @abstractmethod
+    def key(self, employee: Employee) -> int:
+        pass
+
+    def add_employee(self, employee: Employee):
+        self._sequence[employee] = len(self._sequence)
+
+    def reset(self, day: str):
+        """
+        Rebuild the heaps for `day` from the roster's pools.
+        """
+        for role in ASSIGNABLE_EMPLOYEE_ROLES:
+            heap = [
+                (self.key(employee), self._sequence[employee])
+                for employee in self.roster._free[(day, role)]
+            ]
+            heapify(heap)
+            self._heaps[(day, role)] = heap
+
+    def push(self, day: str, employee: Employee):
+        """
+        Note that `employee` has (re)joined their pool on `day`.
+        """
+        heappush(
+            self._heaps[(day, employee.role)],
+            (self.key(employee), self._sequence[employee]),
+        )
+
+    def refresh(self, employee: Employee):
+        """
+        Re-key `employee` in every pool they are in, for when their key may
+        have dropped (a booking was released).
+        """
+        for day in self.roster.scheduled:
+            if employee in self.roster._free[(day, employee.role)]:
+                self.push(day, employee)
+
+    def pick(self, day: str, role, pool: dict) -> Employee:
+        """
+        The employee in the non-empty `pool` to book next.  Does not remove
+        them from `pool`.
+        """
+        heap = self._heaps[(day, role)]
+        employees = self.roster.employees
+        while True:
+            key, sequence = heap[0]
+            employee = employees[sequence]
+            if employee not in pool:
+                heappop(heap)
+                continue
+            current = self.key(employee)
+            if current != key:
+                heapreplace(heap, (current, sequence))
+                continue
+            heappop(heap)
+            self.picked(day, employee)
+            return employee
+
+    def order(self, employees) -> list[Employee]:
+        """
+        `employees` in the order `pick()` would book them, for crews booked
+        across several days at once.
+        """
+        sequence = self._sequence
+        return sorted(employees, key=lambda employee: (self.key(employee), sequence[employee]))
+
+    def picked(self, day: str, employee: Employee):
+        pass
+
+
+class LeastBooked(HeapSelection):
+    """
+    Book the employee with the fewest bookings across the week so far.
+    """
+
+    def key(self, employee: Employee) -> int:
+        booked = 0
+        for scheduled in self.roster.scheduled.values():
+            if employee in scheduled:
+                booked += 1
+        return booked
+
+
+class RoundRobin(HeapSelection):
+    """
+    Book the employees of each role in turn, starting again from the first
+    once everyone has had a booking.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._turn = 0
+        self._last_picked = {}
+
+    def key(self, employee: Employee) -> int:
+        return self._last_picked.get(employee, -1)
+
+    def picked(self, day: str, employee: Employee):
+        self._last_picked[employee] = self._turn
+        self._turn += 1
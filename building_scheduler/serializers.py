@@ -0,0 +1,51 @@
+""" Schedule Serializers """
+
+import json
+from typing import Iterable, Iterator, TextIO
+
+from building_scheduler.building_queue import BuildingQueue
+
+
+def iter_assignment_records(schedule_stream: Iterable) -> Iterator[dict]:
+    """
+    Flatten (day, DailyBuildingSchedule) pairs into one record per staffed slot.
+    """
+    for day, building_schedule in schedule_stream:
+        building = str(building_schedule.building)
+        for slot, employee in enumerate(building_schedule.employees):
+            yield {
+                "day": day,
+                "building_index": building_schedule.position,
+                "building": building,
+                "slot": slot,
+                "role": employee.role.name,
+                "employee": employee.name,
+            }
+
+
+def iter_remaining_records(queue: BuildingQueue) -> Iterator[dict]:
+    """
+    One record per building left unscheduled, with the same keys as an
+    assignment and no day, slot or employee.
+    """
+    for position in queue.positions():
+        yield {
+            "day": None,
+            "building_index": position,
+            "building": str(queue.buildings[position]),
+            "slot": None,
+            "role": None,
+            "employee": None,
+        }
+
+
+def write_jsonl(records: Iterable[dict], stream: TextIO) -> int:
+    """
+    Write records as JSON Lines as they arrive, returning how many were written.
+    """
+    written = 0
+    for record in records:
+        stream.write(json.dumps(record))
+        stream.write("\n")
+        written += 1
+    return written
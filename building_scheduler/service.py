@@ -0,0 +1,255 @@
+""" Scheduling Service
+
+An asyncio server that accepts scheduling jobs as JSON Lines over a local
+TCP or Unix socket.
+
+Request, one JSON object per line:
+
+    {"id": 1, "buildings": ["commercial", "single_storey"],
+     "employees": [{"role": "CERTIFIED_INSTALLER", "name": "Charli", "days_off": ["Monday"]}]}
+
+Response, one line per request, in request order on each connection:
+
+    {"id": 1, "schedule": [<assignment records>], "remaining": [<remaining records>]}
+    {"id": 1, "error": "..."}
+
+Records are the ones `serializers` writes.  Scheduling runs in an executor.
+Identical in-flight requests share one computation, and a bounded job queue
+stops reading from clients while it is full.
+
+    python3 -m building_scheduler.service --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee
+from building_scheduler.loaders import parse_building, parse_employee
+from building_scheduler.roster import Roster
+from building_scheduler.serializers import iter_assignment_records, iter_remaining_records
+
+
+def run_job(payload: dict) -> dict:
+    """
+    Schedule one decoded request.  Runs inside the executor.
+    """
+    buildings = [
+        parse_building(row if isinstance(row, dict) else {"type": row})
+        for row in payload.get("buildings", [])
+    ]
+    roster = Roster(parse_employee(row) for row in payload.get("employees", []))
+    scheduler = BuildingScheduler(buildings, roster)
+    return {
+        "schedule": list(iter_assignment_records(scheduler.iter_weekly_schedule())),
+        "remaining": list(iter_remaining_records(scheduler.remaining_buildings)),
+    }
+
+
+class SchedulingService:
+    """
+    Serve scheduling jobs on `host`/`port`, or on the Unix socket `path`.
+
+    - `max_queue`: jobs waiting for a worker before clients are throttled
+    - `workers`: jobs handed to the executor at once
+    - `executor`: defaults to a process pool owned by the service
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: Optional[str] = None,
+        max_queue: int = 64,
+        workers: int = 4,
+        executor: Optional[Executor] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.workers = workers
+        self.max_queue = max_queue
+        self._own_executor = executor is None
+        self._executor = executor
+        self._server = None
+        self._jobs = None
+        self._worker_tasks = []
+        self._handlers = set()
+        self._inflight = {}
+        self.computations = 0
+        self.coalesced = 0
+
+    async def __aenter__(self) -> "SchedulingService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._jobs = asyncio.Queue(maxsize=self.max_queue)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        tasks = self._worker_tasks + list(self._handlers)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown()
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def submit(self, payload: dict) -> dict:
+        """
+        Schedule `payload`, sharing the result with any identical request
+        already in flight.
+        """
+        request_id = payload.pop("id", None)
+        key = json.dumps(payload, sort_keys=True)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            self.computations += 1
+            # Blocks while the queue is full, which stops this client's reads
+            await self._jobs.put((key, payload, future))
+        else:
+            self.coalesced += 1
+        result = await asyncio.shield(future)
+        return {"id": request_id, **result}
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            key, payload, future = await self._jobs.get()
+            try:
+                result = await loop.run_in_executor(self._executor, run_job, payload)
+            except Exception as error:
+                result = {"error": f"{type(error).__name__}: {error}"}
+            finally:
+                self._inflight.pop(key, None)
+                self._jobs.task_done()
+            future.set_result(result)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    payload = json.loads(line)
+                    if not isinstance(payload, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as error:
+                    response = {"id": None, "error": f"Bad request: {error}"}
+                else:
+                    response = await self.submit(payload)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # Client went away, or the service is closing
+            pass
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+
+
+class ScheduleClient:
+    """
+    Minimal client for `SchedulingService`, one request at a time per client.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.path = path
+        self._reader = None
+        self._writer = None
+        self._next_id = 0
+
+    async def __aenter__(self) -> "ScheduleClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def connect(self):
+        if self.path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+    async def schedule(self, buildings: list, employees: list) -> dict:
+        """
+        Schedule building type codes against employees, given either as
+        `Employee`s or as {"role", "name", "days_off"} dicts.
+        """
+        self._next_id += 1
+        request = {
+            "id": self._next_id,
+            "buildings": list(buildings),
+            "employees": [_employee_row(employee) for employee in employees],
+        }
+        self._writer.write(json.dumps(request).encode() + b"\n")
+        await self._writer.drain()
+        return json.loads(await self._reader.readline())
+
+
+def _employee_row(employee) -> dict:
+    if isinstance(employee, Employee):
+        return {
+            "role": employee.role.name,
+            "name": employee.name,
+            "days_off": employee.days_off,
+        }
+    return employee
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve scheduling jobs over a local socket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead")
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    async def serve():
+        service = SchedulingService(
+            args.host, args.port, args.unix, args.max_queue, args.workers
+        )
+        async with service:
+            await service.serve_forever()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+""" Scheduler Statistics """
+
+from typing import Callable, Optional
+
+
+class SchedulerStats:
+    """
+    Counters and timers collected by `Roster` and `BuildingScheduler`.
+
+    Pass one instance as `stats=` to either; when none is given the hot paths
+    only pay for an `is not None` check.
+
+    - `employees_scanned`: employees visited building pools or availability sets
+    - `availability_checks`: feasibility checks run against the roster
+    - `rejections`: requirement signature label -> feasibility rejections.
+      Building types with the same requirements and duration share a
+      signature, and its label names all of them, e.g.
+      "Bungalow / SingleStoreyHome".
+    - `slots_filled`: day -> role name -> slots filled
+    - `day_seconds`: day -> wall time spent scheduling that day
+
+    `on_event(event, fields)` is called for every `day_started`,
+    `building_scheduled`, `building_rejected` and `day_finished` event.
+    """
+
+    def __init__(self, on_event: Optional[Callable[[str, dict], None]] = None):
+        self.employees_scanned = 0
+        self.availability_checks = 0
+        self.rejections = {}
+        self.slots_filled = {}
+        self.day_seconds = {}
+        self.on_event = on_event
+
+    def emit(self, event: str, **fields):
+        if self.on_event is not None:
+            self.on_event(event, fields)
+
+    def record_slot(self, day: str, role):
+        filled = self.slots_filled.setdefault(day, {})
+        filled[role.name] = filled.get(role.name, 0) + 1
+
+    def record_rejection(self, day: str, building_type: str):
+        self.rejections[building_type] = self.rejections.get(building_type, 0) + 1
+        self.emit("building_rejected", day=day, building_type=building_type)
+
+    def record_day_time(self, day: str, seconds: float):
+        self.day_seconds[day] = self.day_seconds.get(day, 0.0) + seconds
+
+    def as_dict(self) -> dict:
+        return {
+            "employees_scanned": self.employees_scanned,
+            "availability_checks": self.availability_checks,
+            "rejections": dict(self.rejections),
+            "slots_filled": {day: dict(roles) for day, roles in self.slots_filled.items()},
+            "day_seconds": dict(self.day_seconds),
+        }
@@ -0,0 +1,60 @@
+""" Synthetic Data
+
+Seeded generators for rosters and building queues, used by the benchmarks
+and for capacity experiments.
+"""
+
+import random
+from typing import Optional
+
+from building_scheduler.building import BUILDING_TYPES, Building
+from building_scheduler.employee import ASSIGNABLE_EMPLOYEE_ROLES, Employee, EmployeeRole
+from building_scheduler.roster import WEEKDAYS
+
+
+DEFAULT_ROLE_MIX = {
+    EmployeeRole.CERTIFIED_INSTALLER: 0.3,
+    EmployeeRole.PENDING_INSTALLER: 0.3,
+    EmployeeRole.LABOURER: 0.4,
+}
+
+DEFAULT_BUILDING_MIX = {
+    "single_storey": 0.5,
+    "two_storey": 0.3,
+    "commercial": 0.2,
+}
+
+
+def generate_employees(
+    size: int,
+    role_mix: Optional[dict] = None,
+    days_off_density: float = 0.1,
+    seed: int = 0,
+) -> list[Employee]:
+    """
+    `size` employees with roles drawn from `role_mix` (role -> weight), each
+    taking any given weekday off with probability `days_off_density`.
+    """
+    role_mix = role_mix or DEFAULT_ROLE_MIX
+    rng = random.Random(seed)
+    roles = [role for role in ASSIGNABLE_EMPLOYEE_ROLES if role in role_mix]
+    weights = [role_mix[role] for role in roles]
+    employees = []
+    for index, role in enumerate(rng.choices(roles, weights, k=size)):
+        days_off = [day for day in WEEKDAYS if rng.random() < days_off_density]
+        employees.append(Employee(role, f"{role.name.title()} {index}", days_off))
+    return employees
+
+
+def generate_buildings(
+    size: int, building_mix: Optional[dict] = None, seed: int = 0
+) -> list[Building]:
+    """
+    `size` buildings in priority order, types drawn from `building_mix`
+    (`BUILDING_TYPES` code -> weight).
+    """
+    building_mix = building_mix or DEFAULT_BUILDING_MIX
+    rng = random.Random(seed)
+    codes = list(building_mix)
+    weights = [building_mix[code] for code in codes]
+    return [BUILDING_TYPES[code]() for code in rng.choices(codes, weights, k=size)]
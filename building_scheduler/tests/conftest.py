@@ -0,0 +1,33 @@
+import pytest
+
+from building_scheduler.employee import Employee, EmployeeRole
+
+
+CREW_NAMES = {
+    EmployeeRole.CERTIFIED_INSTALLER: ["Certified Charli", "Certified Chelly", "Certified Charles"],
+    EmployeeRole.PENDING_INSTALLER: ["Apprentice Agnes", "Apprentice Arnold"],
+    EmployeeRole.LABOURER: ["Labourer Liam", "Labourer Lindsay", "Labourer Logan", "Labourer Lucy"],
+}
+
+
+@pytest.fixture
+def crew():
+    """
+    Builds a mixed roster from the first `certified`, `pending` and
+    `labourers` names of each role, with `days_off` (name -> days).
+    """
+
+    def build(certified=2, pending=2, labourers=4, days_off=None):
+        days_off = days_off or {}
+        counts = {
+            EmployeeRole.CERTIFIED_INSTALLER: certified,
+            EmployeeRole.PENDING_INSTALLER: pending,
+            EmployeeRole.LABOURER: labourers,
+        }
+        return [
+            Employee(role, name, days_off.get(name, []))
+            for role, count in counts.items()
+            for name in CREW_NAMES[role][:count]
+        ]
+
+    return build
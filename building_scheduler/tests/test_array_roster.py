@@ -0,0 +1,114 @@
+from datetime import date
+
+import pytest
+
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.horizon import Calendar
+from building_scheduler.roster import Roster
+
+np = pytest.importorskip("numpy")
+
+from building_scheduler.array_roster import ArrayRoster  # noqa: E402
+
+
+@pytest.fixture
+def employees(crew):
+    return crew(
+        certified=3,
+        labourers=2,
+        days_off={
+            "Certified Chelly": ["Monday"],
+            "Apprentice Arnold": ["Tuesday"],
+            "Labourer Lindsay": ["Monday", "Friday"],
+        },
+    )
+
+
+def test_role_count_matrix(employees):
+    roster = ArrayRoster(employees)
+
+    counts = roster.role_count_matrix()
+
+    assert counts.shape == (5, 3)
+    assert counts[0].tolist() == [2, 2, 1]
+    assert counts[1].tolist() == [3, 1, 2]
+
+
+def test_available_employees_match_roster(employees):
+    array_roster = ArrayRoster(employees)
+    roster = Roster(employees)
+
+    for day in roster.scheduled:
+        for role in EmployeeRole:
+            assert array_roster.get_available_employees(day, role) == (
+                roster.get_available_employees(day, role)
+            )
+
+
+def test_feasible_many_matches_can_staff(employees):
+    roster = ArrayRoster(employees)
+    requirements = [
+        SingleStoreyHome().requirements,
+        TwoStoreyHome().requirements,
+        CommercialBuilding().requirements,
+        [EmployeeRole.PENDING_INSTALLER, EmployeeRole.PENDING_INSTALLER],
+        [(EmployeeRole.LABOURER, EmployeeRole.PENDING_INSTALLER)] * 3,
+    ]
+
+    for day in roster.scheduled:
+        got = roster.feasible_many(day, requirements).tolist()
+        assert got == [roster.can_staff(day, req) for req in requirements]
+
+
+def test_schedules_are_identical(employees):
+    buildings = [
+        CommercialBuilding(),
+        TwoStoreyHome(),
+        SingleStoreyHome(),
+        TwoStoreyHome(),
+        CommercialBuilding(),
+        SingleStoreyHome(),
+    ]
+    default = BuildingScheduler(buildings, Roster(employees))
+    vectorized = BuildingScheduler(buildings, ArrayRoster(employees))
+
+    default.generate_weekly_schedule()
+    vectorized.generate_weekly_schedule()
+
+    assert repr(vectorized.daily_schedules) == repr(default.daily_schedules)
+
+
+def test_employee_listed_twice_matches_roster():
+    charli = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")
+    buildings = [SingleStoreyHome(), SingleStoreyHome()]
+    default = BuildingScheduler(buildings, Roster([charli, charli]))
+    vectorized = BuildingScheduler(buildings, ArrayRoster([charli, charli]))
+
+    default.generate_weekly_schedule()
+    vectorized.generate_weekly_schedule()
+
+    assert vectorized.roster.free_counts == default.roster.free_counts
+    assert repr(vectorized.daily_schedules) == repr(default.daily_schedules)
+
+
+def test_add_employee_extends_matrix():
+    roster = ArrayRoster([])
+
+    roster.add_employee(Employee(EmployeeRole.LABOURER, "Labourer Lou", ["Monday"]))
+
+    assert roster.availability.shape == (1, 5)
+    assert roster.role_codes.dtype == np.int8
+    assert roster.role_count_matrix()[:, 2].tolist() == [0, 1, 1, 1, 1]
+
+
+def test_calendar_week_matches_roster(employees):
+    calendar = Calendar(date(2024, 1, 1), workdays=["Monday", "Tuesday", "Saturday"])
+    calendar.add_leave(employees[0], date(2024, 1, 6))
+
+    default = Roster(employees, calendar=calendar.week(0))
+    vectorized = ArrayRoster(employees, calendar=calendar.week(0))
+
+    assert vectorized.free_counts == default.free_counts
+    assert vectorized.role_count_matrix().shape == (3, 3)
@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from building_scheduler.batch import schedule_batch
+from building_scheduler.building import Building, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.role_count_solver import RoleCountSolver
+
+
+def job(homes: int):
+    buildings = [SingleStoreyHome() for _ in range(homes)]
+    employees = [Employee(EmployeeRole.CERTIFIED_INSTALLER, f"Installer {homes}")]
+    return buildings, employees
+
+
+def test_batch_keeps_job_order():
+    jobs = [job(homes) for homes in range(1, 8)]
+
+    results = schedule_batch(jobs, max_workers=2, chunksize=3)
+
+    assert [result.index for result in results] == list(range(7))
+    assert all(result.ok for result in results)
+    assert [len(result.remaining_buildings) for result in results] == [
+        0, 0, 0, 0, 0, 1, 2,
+    ]
+    assert results[2].daily_schedules["Wednesday"][0].employees[0].name == "Installer 3"
+
+
+def test_failed_job_is_isolated():
+    jobs = [job(1), ([object()], []), job(2)]
+
+    with ThreadPoolExecutor(2) as executor:
+        results = schedule_batch(jobs, executor=executor, chunksize=3)
+
+    assert results[0].ok and results[2].ok
+    assert not results[1].ok
+    assert "AttributeError" in results[1].error
+    assert results[1].daily_schedules is None
+
+
+class WorkerKiller(Building):
+    @property
+    def worker_requirements(self):
+        os._exit(1)
+
+
+def test_dead_worker_only_fails_its_own_chunk():
+    jobs = [job(1), ([WorkerKiller()], []), job(2), job(3), job(4), job(5)]
+
+    results = schedule_batch(jobs, max_workers=2, chunksize=1)
+
+    assert [result.ok for result in results] == [True, False, True, True, True, True]
+    assert "BrokenProcessPool" in results[1].error
+
+
+def test_batch_with_alternative_engine():
+    jobs = [([TwoStoreyHome()], [
+        Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli"),
+        Employee(EmployeeRole.LABOURER, "Labourer Liam"),
+    ])]
+
+    results = schedule_batch(jobs, max_workers=1, engine=RoleCountSolver())
+
+    assert len(results[0].daily_schedules["Monday"]) == 1
+
+
+def test_empty_batch():
+    assert schedule_batch([]) == []
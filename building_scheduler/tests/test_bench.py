@@ -0,0 +1,43 @@
+import importlib.util
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location(
+    "bench", Path(__file__).resolve().parents[2] / "benchmarks" / "bench.py"
+)
+bench = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bench)
+
+
+def results(**seconds):
+    return {
+        "results": [
+            {"benchmark": name, "size": 10, "seconds": value}
+            for name, value in seconds.items()
+        ]
+    }
+
+
+def test_compare_reports_only_slowdowns_past_the_threshold():
+    baseline = results(fast=0.010, steady=0.010, slow=0.010)
+    current = results(fast=0.005, steady=0.0119, slow=0.0125)
+
+    regressions = bench.compare(current, baseline, threshold=0.2)
+
+    assert regressions == ["slow size=10: 10.000 ms -> 12.500 ms (+25%)"]
+
+
+def test_compare_skips_results_missing_from_the_baseline():
+    baseline = results(old=0.010, empty=0.0)
+    current = results(old=0.010, new=1.0, empty=1.0)
+
+    assert bench.compare(current, baseline, threshold=0.2) == []
+
+
+def test_fast_calls_are_timed_in_a_loop(monkeypatch):
+    monkeypatch.setattr(bench, "MIN_SAMPLE_SECONDS", 0.01)
+    calls = []
+
+    seconds = bench.best_of(3, lambda: None, calls.append)
+
+    assert len(calls) > 100
+    assert 0 < seconds < 0.01
@@ -0,0 +1,114 @@
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.building_queue import BuildingQueue
+
+
+def test_queue_keeps_priority_order():
+    first = TwoStoreyHome()
+    second = SingleStoreyHome()
+    queue = BuildingQueue([first, second])
+
+    assert list(queue) == [first, second]
+    assert len(queue) == 2
+
+
+def test_mark_scheduled_removes_building():
+    buildings = [SingleStoreyHome(), TwoStoreyHome(), SingleStoreyHome()]
+    queue = BuildingQueue(buildings)
+
+    queue.mark_scheduled(1)
+
+    assert list(queue) == [buildings[0], buildings[2]]
+    assert not queue.is_pending(1)
+    assert len(queue) == 2
+
+
+def test_mark_scheduled_while_iterating():
+    buildings = [SingleStoreyHome(), SingleStoreyHome(), SingleStoreyHome()]
+    queue = BuildingQueue(buildings)
+
+    visited = []
+    for position in queue.positions():
+        visited.append(position)
+        queue.mark_scheduled(position)
+
+    assert visited == [0, 1, 2]
+    assert len(queue) == 0
+    assert list(queue) == []
+
+
+def test_empty_queue():
+    queue = BuildingQueue([])
+
+    assert list(queue.positions()) == []
+    assert repr(queue) == "[]"
+
+
+def test_append_after_scheduling_everything():
+    queue = BuildingQueue([SingleStoreyHome()])
+    queue.mark_scheduled(0)
+    building = TwoStoreyHome()
+
+    position = queue.append(building)
+
+    assert position == 1
+    assert list(queue) == [building]
+    assert queue.pending_by_signature == {1: 1}
+
+
+def test_prepend_jumps_the_queue():
+    first = SingleStoreyHome()
+    urgent = TwoStoreyHome()
+    queue = BuildingQueue([first])
+
+    position = queue.prepend(urgent)
+
+    assert position == 1
+    assert list(queue) == [urgent, first]
+
+
+def test_restore_returns_building_to_its_priority():
+    buildings = [SingleStoreyHome() for _ in range(4)]
+    queue = BuildingQueue(buildings)
+    for position in (0, 1, 2):
+        queue.mark_scheduled(position)
+
+    queue.restore(1)
+
+    assert list(queue) == [buildings[1], buildings[3]]
+    assert queue.pending_by_signature == {0: 2}
+
+
+def test_restore_after_prepend_keeps_priority_order():
+    buildings = [SingleStoreyHome(), SingleStoreyHome()]
+    queue = BuildingQueue(buildings)
+    urgent = TwoStoreyHome()
+    queue.prepend(urgent)
+    queue.mark_scheduled(2)
+    queue.mark_scheduled(0)
+
+    queue.restore(0)
+    queue.restore(2)
+
+    assert list(queue) == [urgent, buildings[0], buildings[1]]
+
+
+def test_removed_building_is_not_pending():
+    buildings = [SingleStoreyHome(), TwoStoreyHome()]
+    queue = BuildingQueue(buildings)
+
+    queue.remove(queue.position_of[buildings[0]])
+
+    assert list(queue) == [buildings[1]]
+
+
+def test_copy_is_independent():
+    queue = BuildingQueue([SingleStoreyHome(), TwoStoreyHome(), SingleStoreyHome()])
+    queue.mark_scheduled(0)
+
+    copied = queue.copy()
+    copied.mark_scheduled(1)
+    copied.append(CommercialBuilding())
+
+    assert list(queue.positions()) == [1, 2]
+    assert list(copied.positions()) == [2, 3]
+    assert copied.buildings[:3] == queue.buildings
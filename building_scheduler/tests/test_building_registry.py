@@ -0,0 +1,89 @@
+import pytest
+
+from building_scheduler.building import (
+    BUILDING_REGISTRY,
+    BuildingRegistry,
+    CommercialBuilding,
+    SingleStoreyHome,
+    TwoStoreyHome,
+)
+from building_scheduler.building_queue import BuildingQueue
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.roster import Roster
+from building_scheduler.validation import validate_scheduler
+
+
+def test_default_registry_adapts_building_classes():
+    commercial = BUILDING_REGISTRY["commercial"]
+
+    assert commercial.requirements is CommercialBuilding().requirements
+    assert type(BUILDING_REGISTRY.buildings[commercial.id]) is CommercialBuilding
+    assert BUILDING_REGISTRY.type_of(TwoStoreyHome()).code == "two_storey"
+
+
+def test_declared_types():
+    registry = BuildingRegistry()
+    shed = registry.register("shed", [EmployeeRole.LABOURER], name="Garden Shed")
+
+    building = registry.buildings[shed.id]
+
+    assert repr(building) == "Garden Shed"
+    assert building.requirements.slots == (EmployeeRole.LABOURER,)
+    with pytest.raises(ValueError):
+        registry.register("shed", [EmployeeRole.ANY])
+
+
+def test_type_id_queue_schedules_like_objects(crew):
+    employees = crew(days_off={"Certified Chelly": ["Monday"]})
+    codes = ["commercial", "two_storey", "single_storey", "two_storey", "commercial"]
+    objects = BuildingScheduler(
+        [CommercialBuilding(), TwoStoreyHome(), SingleStoreyHome(), TwoStoreyHome(), CommercialBuilding()],
+        Roster(employees),
+    )
+    queue = BuildingQueue.from_type_ids(BUILDING_REGISTRY.type_ids(codes), external_ids=range(100, 105))
+    typed = BuildingScheduler(queue, Roster(employees))
+
+    objects.generate_weekly_schedule()
+    typed.generate_weekly_schedule()
+
+    assert repr(typed.daily_schedules) == repr(objects.daily_schedules)
+    assert repr(typed.remaining_buildings) == repr(objects.remaining_buildings)
+    assert validate_scheduler(typed) == []
+    assert queue.buildings.type_ids.itemsize == 2
+    assert queue.external_ids[queue.position_of_external_id[103]] == 103
+
+
+def test_type_id_queue_removes_by_external_id_and_position():
+    queue = BuildingQueue.from_type_ids(
+        BUILDING_REGISTRY.type_ids(["single_storey"] * 7), external_ids=range(100, 107)
+    )
+    scheduler = BuildingScheduler(queue, Roster([Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")]))
+    scheduler.generate_weekly_schedule()
+
+    assert scheduler.remove_external_id(102) == ["Wednesday", "Thursday", "Friday"]
+    assert [s.position for s in scheduler.daily_schedules["Wednesday"]] == [3]
+    assert [s.position for s in scheduler.daily_schedules["Friday"]] == [5]
+    assert scheduler.remove_position(6) == []
+    assert len(scheduler.remaining_buildings) == 0
+    assert validate_scheduler(scheduler) == []
+    with pytest.raises(ValueError):
+        scheduler.remove_building(queue.buildings[0])
+    with pytest.raises(ValueError):
+        scheduler.remove_external_id(107)
+    with pytest.raises(ValueError):
+        scheduler.remove_position(7)
+
+
+def test_type_id_queue_takes_adapted_objects():
+    queue = BuildingQueue(registry=BUILDING_REGISTRY)
+
+    queue.append(SingleStoreyHome())
+    queue.append_type(BUILDING_REGISTRY["commercial"].id)
+
+    assert list(queue.buildings.type_ids) == [
+        BUILDING_REGISTRY["single_storey"].id,
+        BUILDING_REGISTRY["commercial"].id,
+    ]
+    assert queue.signature_labels == ["SingleStoreyHome", "CommercialBuilding"]
+    assert list(queue.copy().buildings) == list(queue.buildings)
@@ -1,4 +1,6 @@
-from building_scheduler.employee import Employee, EmployeeRole
+import pytest
+
+from building_scheduler.employee import Employee, EmployeeRole, EmployeeTable
 
 
 def test_is_available():
@@ -20,3 +22,43 @@ def test_any_role():
     employee = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Installer Flavian")
 
     assert employee.is_available("Thursday", EmployeeRole.ANY)
+
+def test_days_off_stored_as_bitmask():
+    employee = Employee(EmployeeRole.LABOURER, "Labourer Lyra", ["Monday", "Friday"])
+
+    assert employee.days_off_mask == 0b10001
+    assert employee.days_off == ("Monday", "Friday")
+    assert not employee.is_available("Friday", EmployeeRole.ANY)
+    assert employee.is_available("Tuesday", EmployeeRole.ANY)
+
+def test_days_off_cannot_be_edited_in_place():
+    employee = Employee(EmployeeRole.LABOURER, "Labourer Lyra", ["Monday"])
+
+    with pytest.raises(AttributeError):
+        employee.days_off.append("Friday")
+    employee.days_off = [*employee.days_off, "Friday"]
+    assert employee.days_off == ("Monday", "Friday")
+
+def test_employee_has_no_instance_dict():
+    employee = Employee(EmployeeRole.LABOURER, "Labourer Lyra")
+
+    assert not hasattr(employee, "__dict__")
+
+def test_unknown_day_off_is_rejected():
+    with pytest.raises(ValueError):
+        Employee(EmployeeRole.LABOURER, "Labourer Lyra", ["Someday"])
+
+def test_employee_table_round_trip():
+    table = EmployeeTable.from_rows(
+        [
+            (EmployeeRole.CERTIFIED_INSTALLER, "Installer Flavian", []),
+            (EmployeeRole.PENDING_INSTALLER, "Apprentice Pat", ["Wednesday"]),
+        ]
+    )
+
+    employees = table.to_employees()
+
+    assert len(table) == 2
+    assert [e.name for e in employees] == ["Installer Flavian", "Apprentice Pat"]
+    assert employees[1].role == EmployeeRole.PENDING_INSTALLER
+    assert employees[1].days_off == ("Wednesday",)
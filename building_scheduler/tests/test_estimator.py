@@ -0,0 +1,127 @@
+from itertools import product
+from random import Random
+
+import pytest
+
+from building_scheduler.building import (
+    BUILDING_REGISTRY,
+    CommercialBuilding,
+    SingleStoreyHome,
+    TwoStoreyHome,
+)
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.estimator import ThroughputEstimator
+from building_scheduler.requirements import ALL_ROLES, role_supply
+from building_scheduler.roster import Roster
+
+
+CERTIFIED = EmployeeRole.CERTIFIED_INSTALLER
+PENDING = EmployeeRole.PENDING_INSTALLER
+LABOURER = EmployeeRole.LABOURER
+
+
+@pytest.fixture
+def employees(crew):
+    return crew(
+        certified=3,
+        labourers=3,
+        days_off={"Certified Chelly": ["Friday"], "Labourer Lindsay": ["Monday", "Tuesday"]},
+    )
+
+
+def completed(buildings, employees):
+    scheduler = BuildingScheduler(buildings, Roster(employees))
+    scheduler.generate_weekly_schedule()
+    return len(scheduler.scheduled_buildings)
+
+
+def test_counts_come_from_days_off(employees):
+    estimator = ThroughputEstimator.from_roster(Roster(employees))
+
+    assert estimator.day_counts["Monday"] == {
+        EmployeeRole.CERTIFIED_INSTALLER: 3,
+        EmployeeRole.PENDING_INSTALLER: 2,
+        EmployeeRole.LABOURER: 2,
+    }
+    assert estimator.day_counts["Friday"][EmployeeRole.CERTIFIED_INSTALLER] == 2
+
+
+def test_weekly_bounds_match_full_schedule(employees):
+    estimator = ThroughputEstimator.from_employees(employees)
+
+    assert estimator.bounds() == {"single_storey": 14, "two_storey": 14, "commercial": 2}
+    assert estimator.weekly_bound(SingleStoreyHome) == completed([SingleStoreyHome()] * 20, employees)
+    assert estimator.weekly_bound(TwoStoreyHome) == completed([TwoStoreyHome()] * 20, employees)
+    assert estimator.weekly_bound(CommercialBuilding) == completed([CommercialBuilding()] * 20, employees)
+
+
+def test_mix_lower_bound(employees):
+    estimator = ThroughputEstimator.from_employees(employees)
+
+    assert estimator.mix_lower_bound({"commercial": 1, "single_storey": 2}) == 3
+    assert estimator.mix_lower_bound({"commercial": 5, "two_storey": 5}) == 7
+    assert estimator.mix_lower_bound({}) == 0
+
+
+def test_mix_lower_bound_can_fall_short():
+    estimator = ThroughputEstimator(
+        {
+            "Monday": {CERTIFIED: 6, PENDING: 3, LABOURER: 5},
+            "Tuesday": {CERTIFIED: 4, PENDING: 6, LABOURER: 2},
+        }
+    )
+    mix = {"single_storey": 4, "two_storey": 2, "commercial": 2}
+
+    assert estimator.mix_lower_bound(mix) == 7
+    assert brute_force_mix(list(estimator.day_counts.values()), mix) == 8
+    assert estimator.mix_upper_bound(mix) >= 8
+
+
+def test_multi_day_types_need_every_day_of_the_crew():
+    class ThreeDayHome(SingleStoreyHome):
+        DURATION = 3
+
+    estimator = ThroughputEstimator.from_employees([Employee(CERTIFIED, "Certified Charli")])
+
+    assert estimator.weekly_bound(ThreeDayHome) == 1
+    assert estimator.mix_upper_bound({ThreeDayHome: 4, SingleStoreyHome: 4}) == 4
+    assert estimator.mix_lower_bound({ThreeDayHome: 4, SingleStoreyHome: 4}) == 4
+
+
+def brute_force_mix(day_counts, mix):
+    """
+    Best total over every combination of per-day copy counts.
+    """
+    demands = [BUILDING_REGISTRY[code].requirements.demand for code in mix]
+    supplies = [role_supply(counts) for counts in day_counts]
+
+    def best(day, remaining):
+        if day == len(supplies):
+            return 0
+        result = 0
+        for plan in product(*(range(left + 1) for left in remaining)):
+            if all(
+                sum(copies * demand[mask] for copies, demand in zip(plan, demands)) <= supplies[day][mask]
+                for mask in range(1, ALL_ROLES + 1)
+            ):
+                left = tuple(count - copies for count, copies in zip(remaining, plan))
+                result = max(result, sum(plan) + best(day + 1, left))
+        return result
+
+    return best(0, tuple(mix.values()))
+
+
+def test_mix_bounds_bracket_brute_force():
+    rng = Random(20)
+    for _ in range(200):
+        day_counts = [
+            {role: rng.randint(0, 6) for role in (CERTIFIED, PENDING, LABOURER)}
+            for _ in range(rng.randint(1, 3))
+        ]
+        mix = {code: rng.randint(0, 3) for code in ("single_storey", "two_storey", "commercial")}
+        estimator = ThroughputEstimator(dict(enumerate(day_counts)))
+
+        best = brute_force_mix(day_counts, mix)
+
+        assert estimator.mix_lower_bound(mix) <= best <= estimator.mix_upper_bound(mix), (day_counts, mix)
@@ -0,0 +1,82 @@
+from datetime import date
+
+import pytest
+
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.horizon import Calendar, RollingScheduler
+from building_scheduler.roster import Roster
+
+# A Monday
+START = date(2024, 1, 1)
+
+
+def installer(name, days_off=()):
+    return Employee(EmployeeRole.CERTIFIED_INSTALLER, name, days_off)
+
+
+def test_working_days_skip_weekends_and_holidays():
+    calendar = Calendar(START, weeks=2, holidays=[date(2024, 1, 3)])
+
+    assert calendar.days == [0, 1, 3, 4, 7, 8, 9, 10, 11]
+    assert calendar.day_name(3) == "Thursday"
+    assert calendar.date(7) == date(2024, 1, 8)
+
+
+def test_weekends_can_be_worked():
+    calendar = Calendar(START, workdays=["Saturday", "Sunday"])
+
+    assert calendar.days == [5, 6]
+
+
+def test_unknown_workday():
+    with pytest.raises(ValueError):
+        Calendar(START, workdays=["Caturday"])
+
+
+def test_leave_by_date_range():
+    abi = installer("Installer Abi")
+    calendar = Calendar(START, weeks=2)
+    calendar.add_leave(abi, date(2024, 1, 4), date(2024, 1, 9))
+
+    assert calendar.week(0).leave == {3: {abi}, 4: {abi}}
+    assert calendar.week(1).leave == {7: {abi}, 8: {abi}}
+
+
+def test_roster_on_calendar_week():
+    abi = installer("Installer Abi", ["Monday"])
+    bill = installer("Installer Bill")
+    calendar = Calendar(START, workdays=["Monday", "Tuesday", "Saturday"])
+    calendar.add_leave(bill, date(2024, 1, 2))
+    roster = Roster([abi, bill], calendar=calendar.week(0))
+
+    scheduler = BuildingScheduler([SingleStoreyHome()] * 4, roster)
+    scheduler.generate_weekly_schedule()
+
+    assert list(scheduler.daily_schedules) == [0, 1, 5]
+    assert [len(scheduler.daily_schedules[day]) for day in (0, 1, 5)] == [1, 1, 2]
+    assert roster.is_off(bill, 1) and not roster.is_off(bill, 0)
+
+
+def test_calendar_day_off_is_leave():
+    abi = installer("Installer Abi")
+    roster = Roster([abi], calendar=Calendar(START).week(0))
+
+    roster.set_day_off(abi, 2)
+
+    assert abi.days_off_mask == 0
+    assert roster.free_counts[2][EmployeeRole.CERTIFIED_INSTALLER] == 0
+    assert roster.free_counts[3][EmployeeRole.CERTIFIED_INSTALLER] == 1
+
+
+def test_rolling_scheduler_carries_leftovers():
+    crew = [installer("Installer Abi"), installer("Installer Bill", ["Friday"])]
+    buildings = [SingleStoreyHome()] * 12 + [CommercialBuilding()]
+    rolling = RollingScheduler(buildings, crew, Calendar(START, weeks=2))
+
+    rolling.generate()
+
+    assert list(rolling.completed) == [2, 2, 2, 2, 1, 0, 0, 2, 1, 0, 0, 0, 0, 0]
+    assert [len(schedules) for schedules in rolling.daily_schedules] == list(rolling.completed)
+    assert list(rolling.remaining_buildings) == [buildings[-1]]
@@ -0,0 +1,113 @@
+import io
+
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.employee import EmployeeRole
+from building_scheduler.loaders import (
+    iter_buildings,
+    iter_employees,
+    load_buildings,
+    load_roster,
+    parse_building_type,
+)
+
+
+def test_buildings_from_csv_keep_priority_order():
+    stream = io.StringIO("type\ncommercial\nsingle_storey\ntwo_storey\n")
+
+    got = list(iter_buildings(stream, "csv"))
+
+    assert [type(b) for b in got] == [CommercialBuilding, SingleStoreyHome, TwoStoreyHome]
+
+
+def test_malformed_building_rows_are_reported():
+    stream = io.StringIO('{"type": "commercial"}\n{"type": "castle"}\nnot json\n[1]\n{"type": "single_storey"}\n')
+    errors = []
+
+    got = list(iter_buildings(stream, "jsonl", "buildings.jsonl", errors))
+
+    assert [type(b) for b in got] == [CommercialBuilding, SingleStoreyHome]
+    assert [error.line for error in errors] == [2, 3, 4]
+    assert "castle" in str(errors[0])
+    assert str(errors[0]).startswith("buildings.jsonl:2:")
+
+
+def test_employees_from_csv():
+    stream = io.StringIO(
+        "role,name,days_off\n"
+        "CERTIFIED_INSTALLER,Certified Charli,\n"
+        "labourer,Labourer Liam,Monday;Friday\n"
+    )
+
+    got = list(iter_employees(stream, "csv"))
+
+    assert [e.name for e in got] == ["Certified Charli", "Labourer Liam"]
+    assert got[1].role == EmployeeRole.LABOURER
+    assert got[1].days_off == ("Monday", "Friday")
+
+
+def test_malformed_employee_rows_are_reported():
+    stream = io.StringIO(
+        '{"role": "PENDING_INSTALLER", "name": "Apprentice Agnes", "days_off": ["Tuesday"]}\n'
+        '{"role": "WIZARD", "name": "Merlin"}\n'
+        '{"role": "LABOURER"}\n'
+        '{"role": "LABOURER", "name": "Labourer Lu", "days_off": ["Caturday"]}\n'
+        '{"role": "ANY", "name": "Anyone"}\n'
+    )
+    errors = []
+
+    got = list(iter_employees(stream, "jsonl", errors=errors))
+
+    assert [e.name for e in got] == ["Apprentice Agnes"]
+    assert [error.line for error in errors] == [2, 3, 4, 5]
+
+
+def test_load_files_into_queue_and_roster(tmp_path):
+    buildings_path = tmp_path / "buildings.csv"
+    buildings_path.write_text("type\nsingle_storey\nbungalow\ntwo_storey\n")
+    employees_path = tmp_path / "employees.jsonl"
+    employees_path.write_text(
+        '{"role": "CERTIFIED_INSTALLER", "name": "Certified Charli"}\n'
+        '{"role": "LABOURER", "name": "Labourer Liam", "days_off": ["Monday"]}\n'
+    )
+    errors = []
+
+    queue = load_buildings(str(buildings_path), errors=errors)
+    roster = load_roster(str(employees_path), errors=errors)
+
+    assert len(queue) == 2
+    assert len(errors) == 1
+    assert roster.free_counts["Monday"][EmployeeRole.LABOURER] == 0
+    assert roster.free_counts["Tuesday"][EmployeeRole.LABOURER] == 1
+
+
+def test_load_buildings_keeps_type_ids_and_external_ids(tmp_path):
+    buildings_path = tmp_path / "buildings.jsonl"
+    buildings_path.write_text(
+        '{"type": "commercial", "id": "job-7"}\n{"type": "single_storey"}\n'
+    )
+
+    queue = load_buildings(str(buildings_path))
+
+    assert [type(b) for b in queue] == [CommercialBuilding, SingleStoreyHome]
+    assert queue.external_ids == ["job-7", None]
+    assert queue.position_of_external_id["job-7"] == 0
+
+
+def test_zero_is_an_external_id():
+    assert parse_building_type({"type": "commercial", "id": 0})[1] == 0
+    assert parse_building_type({"type": "commercial", "id": "0"})[1] == "0"
+    assert parse_building_type({"type": "commercial", "id": ""})[1] is None
+    assert parse_building_type({"type": "commercial"})[1] is None
+
+
+def test_unhashable_external_id_is_reported(tmp_path):
+    buildings_path = tmp_path / "buildings.jsonl"
+    buildings_path.write_text(
+        '{"type": "commercial", "id": [1]}\n{"type": "single_storey", "id": 2}\n'
+    )
+    errors = []
+
+    queue = load_buildings(str(buildings_path), errors=errors)
+
+    assert queue.external_ids == [2]
+    assert [error.line for error in errors] == [1]
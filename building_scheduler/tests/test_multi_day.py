@@ -0,0 +1,91 @@
+import pytest
+
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import EmployeeRole
+from building_scheduler.role_count_solver import RoleCountSolver
+from building_scheduler.roster import Roster
+
+
+class Warehouse(CommercialBuilding):
+    DURATION = 3
+
+    def __repr__(self):
+        return "Warehouse"
+
+
+@pytest.fixture
+def employees(crew):
+    return crew(certified=3, days_off={"Certified Charles": ["Wednesday"]})
+
+
+def test_duration_defaults_to_one_day():
+    assert SingleStoreyHome().duration == 1
+    assert Warehouse().duration == 3
+
+
+def test_free_across_days(employees):
+    roster = Roster(employees)
+    roster.schedule_employee("Thursday", EmployeeRole.CERTIFIED_INSTALLER)
+
+    got = roster.free_across(["Tuesday", "Wednesday", "Thursday"], EmployeeRole.CERTIFIED_INSTALLER)
+
+    assert got == [employees[1], employees[0]]
+    assert roster.span_counts(["Monday", "Tuesday"])[EmployeeRole.CERTIFIED_INSTALLER] == 3
+
+
+def test_same_crew_every_day(employees):
+    roster = Roster(employees)
+    scheduler = BuildingScheduler([Warehouse()], roster)
+
+    scheduler.generate_weekly_schedule()
+
+    (building_schedule,) = scheduler.daily_schedules["Monday"]
+    assert building_schedule.days == ("Monday", "Tuesday", "Wednesday")
+    assert "Certified Charles" not in repr(building_schedule)
+    for day in building_schedule.days:
+        assert set(building_schedule.employees) <= roster.scheduled[day]
+    assert roster.scheduled["Thursday"] == set()
+
+
+def test_priority_order_is_kept(employees):
+    buildings = [Warehouse(), SingleStoreyHome(), Warehouse()]
+    scheduler = BuildingScheduler(buildings, Roster(employees))
+
+    scheduler.generate_weekly_schedule()
+
+    assert [s.building for s in scheduler.daily_schedules["Monday"]] == buildings[:2]
+    assert scheduler.daily_schedules["Tuesday"] == []
+    assert [s.building for s in scheduler.daily_schedules["Thursday"]] == []
+    assert list(scheduler.remaining_buildings) == [buildings[2]]
+
+
+def test_install_must_fit_in_the_week(employees):
+    buildings = [CommercialBuilding()] * 3 + [Warehouse()]
+    scheduler = BuildingScheduler(buildings, Roster(employees))
+
+    scheduler.generate_weekly_schedule()
+
+    assert list(scheduler.remaining_buildings) == [buildings[3]]
+
+
+def test_day_off_moves_whole_install(employees):
+    roster = Roster(employees)
+    scheduler = BuildingScheduler([Warehouse()], roster)
+    scheduler.generate_weekly_schedule()
+    booked = scheduler.daily_schedules["Monday"][0].employees[0]
+
+    changed = scheduler.add_day_off(booked, "Tuesday")
+
+    assert changed == ["Monday", "Tuesday", "Wednesday"]
+    assert scheduler.daily_schedules["Monday"] == []
+    (building_schedule,) = scheduler.daily_schedules["Wednesday"]
+    assert building_schedule.days == ("Wednesday", "Thursday", "Friday")
+    assert roster.scheduled["Monday"] == set()
+
+
+def test_role_count_solver_rejects_multi_day(employees):
+    scheduler = BuildingScheduler([Warehouse()], Roster(employees), engine=RoleCountSolver())
+
+    with pytest.raises(ValueError):
+        scheduler.generate_weekly_schedule()
@@ -0,0 +1,130 @@
+from building_scheduler.building import Building, CommercialBuilding, TwoStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import EmployeeRole
+from building_scheduler.requirements import DayDemand, allocate, compile_requirements, fits
+from building_scheduler.roster import Employee, Roster
+
+
+def test_compile_commercial_building():
+    got = CommercialBuilding().requirements
+
+    assert got.fixed == (
+        (EmployeeRole.CERTIFIED_INSTALLER, 2),
+        (EmployeeRole.PENDING_INSTALLER, 2),
+    )
+    assert got.logical_or == ()
+    assert got.any_count == 4
+    assert len(got) == 8
+
+
+def test_compile_logical_or_slot():
+    got = TwoStoreyHome().requirements
+
+    assert got.fixed == ((EmployeeRole.CERTIFIED_INSTALLER, 1),)
+    assert got.logical_or == ((EmployeeRole.LABOURER, EmployeeRole.PENDING_INSTALLER),)
+    assert got.fill_order == (0, 1)
+
+
+def test_requirements_compiled_once_per_class():
+    assert TwoStoreyHome().requirements is TwoStoreyHome().requirements
+
+
+def test_equal_requirement_lists_compile_once():
+    first = compile_requirements([EmployeeRole.LABOURER, EmployeeRole.ANY])
+
+    assert compile_requirements([EmployeeRole.LABOURER, EmployeeRole.ANY]) is first
+    assert compile_requirements((EmployeeRole.LABOURER, EmployeeRole.ANY)) is first
+
+
+def test_fill_order_puts_flexible_slots_last():
+    got = compile_requirements(
+        [EmployeeRole.ANY, (EmployeeRole.LABOURER,), EmployeeRole.PENDING_INSTALLER]
+    )
+
+    assert got.fill_order == (2, 1, 0)
+
+
+def test_custom_building_subclass():
+    class Shed(Building):
+        @property
+        def worker_requirements(self):
+            return [EmployeeRole.LABOURER, EmployeeRole.ANY]
+
+    roster = Roster(
+        {
+            Employee(EmployeeRole.LABOURER, "Labourer Vic"),
+            Employee(EmployeeRole.PENDING_INSTALLER, "Apprentice Wes"),
+        }
+    )
+
+    assert Shed().requirements.any_count == 1
+    assert roster.can_staff("Monday", Shed().requirements) is True
+
+
+def test_requirements_follow_each_instance():
+    class Crew(Building):
+        def __init__(self, size):
+            self.size = size
+
+        @property
+        def worker_requirements(self):
+            return [EmployeeRole.CERTIFIED_INSTALLER] * self.size
+
+    scheduler = BuildingScheduler(
+        [Crew(1), Crew(3)], Roster([Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Vic")])
+    )
+    scheduler.generate_weekly_schedule()
+
+    assert len(Crew(3).requirements) == 3
+    assert [b.size for b in scheduler.scheduled_buildings] == [1]
+    assert [b.size for b in scheduler.remaining_buildings] == [3]
+
+
+CERTIFIED = EmployeeRole.CERTIFIED_INSTALLER
+PENDING = EmployeeRole.PENDING_INSTALLER
+LABOURER = EmployeeRole.LABOURER
+
+
+def counts(certified=0, pending=0, labourer=0):
+    return {CERTIFIED: certified, PENDING: pending, LABOURER: labourer}
+
+
+def test_fits_overlapping_or_slots():
+    requirements = compile_requirements([(PENDING, LABOURER), (PENDING, CERTIFIED)])
+
+    assert fits(requirements, counts(pending=1, labourer=1)) is True
+    assert allocate(requirements, counts(pending=1, labourer=1)) == (LABOURER, PENDING)
+    assert fits(requirements, counts(pending=0, labourer=2)) is False
+
+
+def test_fits_checks_every_role_set():
+    requirements = CommercialBuilding().requirements
+
+    assert fits(requirements, counts(2, 2, 4)) is True
+    assert fits(requirements, counts(1, 3, 4)) is False
+    assert fits(requirements, counts(2, 2, 3)) is False
+
+
+def test_allocate_prefers_least_scarce_role():
+    free = counts(certified=1, labourer=3)
+
+    got = allocate(compile_requirements([EmployeeRole.ANY, EmployeeRole.ANY]), free)
+
+    assert got == (LABOURER, LABOURER)
+    assert free == counts(certified=1, labourer=1)
+
+
+def test_allocate_leaves_free_untouched_when_it_does_not_fit():
+    free = counts(pending=1)
+
+    assert allocate(compile_requirements([CERTIFIED]), free) is None
+    assert free == counts(pending=1)
+
+
+def test_day_demand_takes_buildings_jointly():
+    day = DayDemand(counts(certified=1, pending=2))
+
+    assert day.add(compile_requirements([EmployeeRole.ANY])) is True
+    assert day.add(compile_requirements([PENDING, PENDING])) is True
+    assert day.add(compile_requirements([EmployeeRole.ANY])) is False
+    assert day.allocate() == [(CERTIFIED,), (PENDING, PENDING)]
@@ -0,0 +1,249 @@
+from random import Random
+
+import pytest
+
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.roster import Roster
+from building_scheduler.synthetic import generate_buildings, generate_employees
+from building_scheduler.validation import validate_scheduler
+
+
+def test_sick_employee_is_replaced_from_free_pool():
+    charli = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")
+    chelly = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Chelly")
+    roster = Roster([charli, chelly])
+    scheduler = BuildingScheduler([SingleStoreyHome()], roster)
+    scheduler.generate_weekly_schedule()
+    monday = scheduler.daily_schedules["Monday"][0]
+    booked = monday.employees[0]
+
+    changed = scheduler.add_day_off(booked, "Monday")
+
+    assert changed == ["Monday"]
+    assert scheduler.daily_schedules["Monday"] == [monday]
+    assert monday.employees[0] is not booked
+    assert booked not in roster.scheduled["Monday"]
+    assert roster.is_off(booked, "Monday")
+    assert booked.days_off == ()
+
+
+def test_sick_employee_bumps_building_to_next_day():
+    charli = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")
+    roster = Roster([charli])
+    buildings = [SingleStoreyHome(), SingleStoreyHome(), SingleStoreyHome()]
+    scheduler = BuildingScheduler(buildings, roster)
+    scheduler.generate_weekly_schedule()
+    monday = scheduler.daily_schedules["Monday"]
+    thursday = scheduler.daily_schedules["Thursday"]
+
+    changed = scheduler.add_day_off(charli, "Wednesday")
+
+    assert changed == ["Wednesday", "Thursday"]
+    assert scheduler.daily_schedules["Monday"] is monday
+    assert scheduler.daily_schedules["Wednesday"] == []
+    assert [s.building for s in scheduler.daily_schedules["Thursday"]] == [buildings[2]]
+    assert scheduler.daily_schedules["Thursday"] is thursday
+    assert len(scheduler.remaining_buildings) == 0
+
+
+def test_bumped_building_moves_ahead_of_lower_priority_work():
+    charli = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")
+    roster = Roster([charli])
+    buildings = [SingleStoreyHome() for _ in range(6)]
+    scheduler = BuildingScheduler(buildings, roster)
+    scheduler.generate_weekly_schedule()
+
+    changed = scheduler.add_day_off(charli, "Wednesday")
+
+    assert changed == ["Wednesday", "Thursday", "Friday"]
+    assert [s.building for s in scheduler.daily_schedules["Thursday"]] == [buildings[2]]
+    assert [s.building for s in scheduler.daily_schedules["Friday"]] == [buildings[3]]
+    assert list(scheduler.remaining_buildings) == [buildings[4], buildings[5]]
+    assert validate_scheduler(scheduler) == []
+
+
+def test_refilled_day_takes_work_from_later_days():
+    charli = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")
+    liam = Employee(EmployeeRole.LABOURER, "Labourer Liam", ["Monday", "Tuesday"])
+    buildings = [TwoStoreyHome()] + [SingleStoreyHome() for _ in range(5)]
+    scheduler = BuildingScheduler(buildings, Roster([charli, liam]))
+    scheduler.generate_weekly_schedule()
+    assert [s.building for s in scheduler.daily_schedules["Wednesday"]] == [buildings[0]]
+
+    changed = scheduler.add_day_off(liam, "Wednesday")
+
+    assert changed == ["Wednesday", "Thursday", "Friday"]
+    assert [s.building for s in scheduler.daily_schedules["Wednesday"]] == [buildings[3]]
+    assert [s.building for s in scheduler.daily_schedules["Thursday"]] == [buildings[4]]
+    assert [s.building for s in scheduler.daily_schedules["Friday"]] == [buildings[5]]
+    assert list(scheduler.remaining_buildings) == [buildings[0]]
+    assert validate_scheduler(scheduler) == []
+
+
+def test_sick_day_stays_on_the_roster():
+    charli = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")
+    scheduler = BuildingScheduler([SingleStoreyHome()], Roster([charli]))
+    scheduler.generate_weekly_schedule()
+
+    scheduler.add_day_off(charli, "Monday")
+    other = Roster([charli])
+
+    assert charli.days_off == ()
+    assert not other.is_off(charli, "Monday")
+    assert other.free_counts["Monday"][EmployeeRole.CERTIFIED_INSTALLER] == 1
+
+
+def test_day_off_without_booking_changes_nothing():
+    labourer = Employee(EmployeeRole.LABOURER, "Labourer Liam")
+    roster = Roster([labourer, Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")])
+    scheduler = BuildingScheduler([SingleStoreyHome()], roster)
+    scheduler.generate_weekly_schedule()
+
+    assert scheduler.add_day_off(labourer, "Friday") == []
+    assert roster.free_counts["Friday"][EmployeeRole.LABOURER] == 0
+
+
+def test_returning_employee_staffs_pending_building():
+    charli = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")
+    roster = Roster([charli])
+    buildings = [SingleStoreyHome() for _ in range(5)]
+    scheduler = BuildingScheduler(buildings, roster)
+    scheduler.generate_weekly_schedule()
+    scheduler.add_day_off(charli, "Tuesday")
+    assert len(scheduler.remaining_buildings) == 1
+
+    changed = scheduler.remove_day_off(charli, "Tuesday")
+
+    assert changed == ["Tuesday", "Wednesday", "Thursday", "Friday"]
+    assert [s.building for s in scheduler.daily_schedules["Tuesday"]] == [buildings[1]]
+    assert [s.building for s in scheduler.daily_schedules["Friday"]] == [buildings[4]]
+    assert len(scheduler.remaining_buildings) == 0
+    assert validate_scheduler(scheduler) == []
+
+
+def test_recurring_day_off_is_not_taken_back():
+    charli = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli", ["Tuesday"])
+    roster = Roster([charli])
+    scheduler = BuildingScheduler([SingleStoreyHome() for _ in range(5)], roster)
+    scheduler.generate_weekly_schedule()
+
+    assert scheduler.remove_day_off(charli, "Tuesday") == []
+    assert charli.days_off == ("Tuesday",)
+    assert len(scheduler.remaining_buildings) == 1
+
+
+def test_add_building_uses_spare_capacity():
+    roster = Roster([Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")])
+    scheduler = BuildingScheduler([SingleStoreyHome()], roster)
+    scheduler.generate_weekly_schedule()
+    extra = SingleStoreyHome()
+
+    changed = scheduler.add_building(extra)
+
+    assert changed == ["Tuesday"]
+    assert scheduler.daily_schedules["Tuesday"][0].building is extra
+
+
+def test_urgent_building_bumps_lower_priority_work():
+    roster = Roster(
+        [
+            Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli"),
+            Employee(EmployeeRole.LABOURER, "Labourer Liam", ["Tuesday"]),
+        ]
+    )
+    buildings = [SingleStoreyHome() for _ in range(5)]
+    scheduler = BuildingScheduler(buildings, roster)
+    scheduler.generate_weekly_schedule()
+    urgent = TwoStoreyHome()
+
+    changed = scheduler.add_building(urgent, urgent=True)
+
+    assert changed == ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+    assert [s.building for s in scheduler.daily_schedules["Monday"]] == [urgent]
+    assert [s.building for s in scheduler.daily_schedules["Tuesday"]] == [buildings[0]]
+    assert list(scheduler.remaining_buildings) == [buildings[4]]
+    assert validate_scheduler(scheduler) == []
+
+
+def test_urgent_building_bumps_work_ahead_of_spare_capacity():
+    roster = Roster(
+        [
+            Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli"),
+            Employee(
+                EmployeeRole.CERTIFIED_INSTALLER,
+                "Certified Chelly",
+                ["Tuesday", "Wednesday", "Thursday", "Friday"],
+            ),
+        ]
+    )
+    buildings = [SingleStoreyHome(), SingleStoreyHome()]
+    scheduler = BuildingScheduler(buildings, roster)
+    scheduler.generate_weekly_schedule()
+    urgent = SingleStoreyHome()
+
+    changed = scheduler.add_building(urgent, urgent=True)
+
+    assert changed == ["Monday", "Tuesday"]
+    assert [s.building for s in scheduler.daily_schedules["Monday"]] == [buildings[0], urgent]
+    assert [s.building for s in scheduler.daily_schedules["Tuesday"]] == [buildings[1]]
+    assert validate_scheduler(scheduler) == []
+
+
+def test_urgent_building_that_cannot_fit_stays_queued():
+    roster = Roster([Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")])
+    scheduler = BuildingScheduler([SingleStoreyHome()], roster)
+    scheduler.generate_weekly_schedule()
+    urgent = CommercialBuilding()
+
+    assert scheduler.add_building(urgent, urgent=True) == []
+    assert list(scheduler.remaining_buildings) == [urgent]
+
+
+def test_remove_scheduled_building_frees_crew():
+    roster = Roster([Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")])
+    buildings = [SingleStoreyHome() for _ in range(6)]
+    scheduler = BuildingScheduler(buildings, roster)
+    scheduler.generate_weekly_schedule()
+
+    changed = scheduler.remove_building(buildings[2])
+
+    assert changed == ["Wednesday", "Thursday", "Friday"]
+    assert [s.building for s in scheduler.daily_schedules["Wednesday"]] == [buildings[3]]
+    assert [s.building for s in scheduler.daily_schedules["Friday"]] == [buildings[5]]
+    assert buildings[2] not in scheduler.scheduled_buildings
+    assert len(scheduler.remaining_buildings) == 0
+
+
+def test_remove_pending_building():
+    roster = Roster()
+    building = SingleStoreyHome()
+    scheduler = BuildingScheduler([building], roster)
+    scheduler.generate_weekly_schedule()
+
+    assert scheduler.remove_building(building) == []
+    assert len(scheduler.remaining_buildings) == 0
+    with pytest.raises(ValueError):
+        scheduler.remove_building(SingleStoreyHome())
+
+
+def test_repairs_keep_priority_order():
+    days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+    for seed in range(100):
+        rng = Random(seed)
+        employees = generate_employees(rng.randint(3, 15), seed=seed)
+        scheduler = BuildingScheduler(generate_buildings(rng.randint(5, 40), seed=seed), Roster(employees))
+        scheduler.generate_weekly_schedule()
+        for _ in range(4):
+            repair = rng.randrange(4)
+            if repair == 0:
+                scheduler.add_day_off(rng.choice(employees), rng.choice(days))
+            elif repair == 1:
+                scheduler.remove_day_off(rng.choice(employees), rng.choice(days))
+            elif repair == 2:
+                scheduler.add_building(TwoStoreyHome(), urgent=rng.random() < 0.5)
+            else:
+                scheduler.remove_position(rng.randrange(len(scheduler.queue.buildings)))
+
+            assert validate_scheduler(scheduler) == [], seed
@@ -0,0 +1,117 @@
+import pytest
+
+from building_scheduler.building import Building, CommercialBuilding, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.building_queue import BuildingQueue
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import EmployeeRole
+from building_scheduler.role_count_solver import RoleCountSolver
+from building_scheduler.roster import Roster
+
+
+@pytest.fixture
+def employees(crew):
+    return crew(
+        certified=3,
+        labourers=3,
+        days_off={"Certified Charles": ["Tuesday"], "Labourer Liam": ["Monday"]},
+    )
+
+
+def week_shape(scheduler):
+    return {
+        day: [
+            (type(s.building), sorted(e.role.value for e in s.employees))
+            for s in schedules
+        ]
+        for day, schedules in scheduler.daily_schedules.items()
+    }
+
+
+def test_plan_uses_role_counts_only():
+    queue = BuildingQueue([SingleStoreyHome(), TwoStoreyHome(), SingleStoreyHome()])
+    day_counts = {
+        "Monday": {
+            EmployeeRole.CERTIFIED_INSTALLER: 2,
+            EmployeeRole.PENDING_INSTALLER: 0,
+            EmployeeRole.LABOURER: 1,
+        },
+    }
+
+    plan = RoleCountSolver().plan(queue, day_counts)
+
+    assert plan["Monday"] == [
+        (0, (EmployeeRole.CERTIFIED_INSTALLER,)),
+        (1, (EmployeeRole.CERTIFIED_INSTALLER, EmployeeRole.LABOURER)),
+    ]
+    assert list(queue.positions()) == [2]
+
+
+def test_matches_default_engine(employees):
+    buildings = [
+        CommercialBuilding(),
+        TwoStoreyHome(),
+        SingleStoreyHome(),
+        CommercialBuilding(),
+        TwoStoreyHome(),
+        SingleStoreyHome(),
+        CommercialBuilding(),
+    ]
+    default = BuildingScheduler(buildings, Roster(employees))
+    solver = BuildingScheduler(buildings, Roster(employees), engine=RoleCountSolver())
+
+    default.generate_weekly_schedule()
+    solver.generate_weekly_schedule()
+
+    assert week_shape(solver) == week_shape(default)
+    assert list(solver.remaining_buildings) == list(default.remaining_buildings)
+    assert solver.scheduled_buildings == default.scheduled_buildings
+
+
+def test_binds_employees_to_roster(employees):
+    roster = Roster(employees)
+    scheduler = BuildingScheduler([CommercialBuilding()], roster, engine=RoleCountSolver())
+
+    scheduler.generate_weekly_schedule()
+
+    assert scheduler.daily_schedules["Monday"] == []
+    wednesday = scheduler.daily_schedules["Wednesday"]
+    assert len(wednesday) == 1
+    assert set(wednesday[0].employees) == roster.scheduled["Wednesday"]
+    assert len(roster.scheduled["Wednesday"]) == 8
+
+
+class Shed(Building):
+    @property
+    def worker_requirements(self):
+        return [EmployeeRole.ANY]
+
+
+class Workshop(Building):
+    @property
+    def worker_requirements(self):
+        return [EmployeeRole.PENDING_INSTALLER, EmployeeRole.PENDING_INSTALLER]
+
+
+def test_day_mode_fits_more_buildings():
+    def day_counts():
+        return {
+            "Monday": {
+                EmployeeRole.CERTIFIED_INSTALLER: 1,
+                EmployeeRole.PENDING_INSTALLER: 2,
+                EmployeeRole.LABOURER: 0,
+            },
+        }
+
+    by_building = RoleCountSolver().plan(BuildingQueue([Shed(), Workshop()]), day_counts())
+    by_day = RoleCountSolver(mode="day").plan(BuildingQueue([Shed(), Workshop()]), day_counts())
+
+    assert [position for position, _ in by_building["Monday"]] == [0]
+    assert by_day["Monday"] == [
+        (0, (EmployeeRole.CERTIFIED_INSTALLER,)),
+        (1, (EmployeeRole.PENDING_INSTALLER, EmployeeRole.PENDING_INSTALLER)),
+    ]
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        RoleCountSolver(mode="week")
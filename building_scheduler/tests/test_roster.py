@@ -231,3 +231,79 @@ def test_final_unmet_requirement_fails():
     got = roster.meets_worker_requirements("Tuesday", requirements)
 
     assert got is False
+
+
+def test_scheduling_removes_employee_from_available_pool():
+    installer = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Installer Opal")
+    roster = Roster({installer})
+
+    roster.schedule_employee("Monday", EmployeeRole.CERTIFIED_INSTALLER)
+
+    assert roster.get_available_employees("Monday", EmployeeRole.CERTIFIED_INSTALLER) == set()
+    assert roster.get_available_employees("Tuesday", EmployeeRole.ANY) == {installer}
+
+
+def test_replacing_scheduled_day_rebuilds_available_pool():
+    installer = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Installer Quinn")
+    roster = Roster({installer})
+    roster.schedule_employee("Wednesday")
+
+    roster.scheduled["Wednesday"] = set()
+
+    assert roster.get_available_employees("Wednesday", EmployeeRole.ANY) == {installer}
+
+
+def test_logical_or_schedules_from_either_role():
+    labourer = Employee(EmployeeRole.LABOURER, "Labourer Lorne")
+    roster = Roster({labourer})
+
+    got = roster.schedule_employee(
+        "Friday", (EmployeeRole.PENDING_INSTALLER, EmployeeRole.LABOURER)
+    )
+
+    assert got is labourer
+    assert labourer in roster.scheduled["Friday"]
+
+
+def test_can_staff_fills_fixed_roles_before_any():
+    roster = Roster(
+        {
+            Employee(EmployeeRole.CERTIFIED_INSTALLER, "Installer Rhea"),
+            Employee(EmployeeRole.LABOURER, "Labourer Rory"),
+        }
+    )
+    requirements = [EmployeeRole.ANY, EmployeeRole.CERTIFIED_INSTALLER]
+
+    assert roster.can_staff("Monday", requirements) is True
+
+
+def test_can_staff_does_not_consume_counts():
+    roster = Roster({Employee(EmployeeRole.CERTIFIED_INSTALLER, "Installer Sage")})
+    requirements = [EmployeeRole.CERTIFIED_INSTALLER]
+
+    roster.can_staff("Monday", requirements)
+
+    assert roster.free_counts["Monday"][EmployeeRole.CERTIFIED_INSTALLER] == 1
+
+
+def test_staff_lines_employees_up_with_slots():
+    installer = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Installer Tate")
+    labourer = Employee(EmployeeRole.LABOURER, "Labourer Uma")
+    roster = Roster({installer, labourer})
+    requirements = [EmployeeRole.ANY, EmployeeRole.CERTIFIED_INSTALLER]
+
+    got = roster.staff("Tuesday", requirements)
+
+    assert got == [labourer, installer]
+    assert roster.free_counts["Tuesday"][EmployeeRole.LABOURER] == 0
+
+
+def test_add_employee_updates_pools():
+    roster = Roster()
+    installer = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Installer Vera", ["Monday"])
+
+    roster.add_employee(installer)
+
+    assert roster.get_available_employees("Monday", EmployeeRole.ANY) == set()
+    assert roster.get_available_employees("Tuesday", EmployeeRole.ANY) == {installer}
+    assert roster.free_counts["Tuesday"][EmployeeRole.CERTIFIED_INSTALLER] == 1
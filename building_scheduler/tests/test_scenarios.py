@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.horizon import Calendar
+from building_scheduler.roster import Roster
+from building_scheduler.scenarios import (
+    AddEmployees,
+    DaysOff,
+    Scenario,
+    compare_scenarios,
+    format_table,
+)
+
+
+def backlog():
+    return [CommercialBuilding(), TwoStoreyHome(), SingleStoreyHome(), TwoStoreyHome()] * 3
+
+
+@pytest.fixture
+def employees(crew):
+    return crew(labourers=2)
+
+
+def completed(employees):
+    scheduler = BuildingScheduler(backlog(), Roster(employees))
+    scheduler.generate_weekly_schedule()
+    return len(scheduler.scheduled_buildings)
+
+
+def test_scenarios_match_rebuilt_rosters(employees):
+    scenarios = [
+        Scenario("one more labourer", (AddEmployees(EmployeeRole.LABOURER),)),
+        Scenario(
+            "certified off friday",
+            (DaysOff(EmployeeRole.CERTIFIED_INSTALLER, 2, ("Friday",)),),
+        ),
+    ]
+
+    results = compare_scenarios(backlog(), Roster(employees), scenarios, max_workers=1)
+
+    more = employees + [Employee(EmployeeRole.LABOURER, "Labourer Logan")]
+    friday = [
+        Employee(e.role, e.name, ["Friday"] if e.role is EmployeeRole.CERTIFIED_INSTALLER else [])
+        for e in employees
+    ]
+    assert [result.name for result in results] == ["base"] + [s.name for s in scenarios]
+    assert [result.buildings_completed for result in results] == [
+        completed(employees),
+        completed(more),
+        completed(friday),
+    ]
+    assert all(r.buildings_completed + r.buildings_remaining == 12 for r in results)
+
+
+def test_idle_employee_days(employees):
+    results = compare_scenarios([], Roster(employees), [Scenario("none")], include_base=False)
+
+    assert results[0].idle_employee_days == 30
+
+
+def test_parallel_results_keep_scenario_order(employees):
+    scenarios = [
+        Scenario(f"+{count} labourers", (AddEmployees(EmployeeRole.LABOURER, count),))
+        for count in range(6)
+    ]
+
+    serial = compare_scenarios(backlog(), Roster(employees), scenarios, max_workers=1)
+    with ThreadPoolExecutor(3) as executor:
+        parallel = compare_scenarios(
+            backlog(), Roster(employees), scenarios, max_workers=3, executor=executor
+        )
+
+    assert parallel == serial
+
+
+def test_format_table(employees):
+    results = compare_scenarios(backlog(), Roster(employees), [])
+
+    lines = format_table(results).splitlines()
+
+    assert lines[0].split()[0] == "scenario"
+    assert lines[1].startswith("base")
+
+
+def test_days_off_defaults_to_the_roster_days(employees):
+    # Integer day indices, starting on a Monday
+    week = Calendar(date(2024, 1, 1)).week(0)
+    scenarios = [Scenario("no labourers", (DaysOff(EmployeeRole.LABOURER, 2),))]
+
+    results = compare_scenarios(
+        backlog(), Roster(employees, calendar=week), scenarios, max_workers=1
+    )
+
+    no_labourers = [e for e in employees if e.role is not EmployeeRole.LABOURER]
+    assert results[1].buildings_completed == completed(no_labourers)
+    assert results[1].idle_employee_days == results[0].idle_employee_days - 2 * len(week.days)
+
+
+def test_multi_day_installs_are_rejected(employees):
+    class Warehouse(CommercialBuilding):
+        DURATION = 3
+
+    with pytest.raises(ValueError, match="multi-day"):
+        compare_scenarios([Warehouse()], Roster(employees), [], max_workers=1)
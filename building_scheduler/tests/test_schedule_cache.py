@@ -0,0 +1,100 @@
+import pytest
+
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.roster import Roster
+from building_scheduler.schedule_cache import ScheduleCache, shape_key
+
+
+def tenant(prefix: str, labourer_day_off: str = "Monday"):
+    buildings = [TwoStoreyHome(), SingleStoreyHome(), CommercialBuilding(), TwoStoreyHome()]
+    employees = [
+        Employee(EmployeeRole.CERTIFIED_INSTALLER, f"{prefix} Certified 1"),
+        Employee(EmployeeRole.CERTIFIED_INSTALLER, f"{prefix} Certified 2"),
+        Employee(EmployeeRole.LABOURER, f"{prefix} Labourer", [labourer_day_off]),
+    ]
+    return BuildingScheduler(buildings, Roster(employees))
+
+
+def names(scheduler):
+    return {
+        day: [(str(s.building), [e.name for e in s.employees]) for s in schedules]
+        for day, schedules in scheduler.daily_schedules.items()
+    }
+
+
+def test_identical_shapes_share_a_key():
+    assert shape_key(tenant("Acme")) == shape_key(tenant("Bolt"))
+    assert shape_key(tenant("Acme")) != shape_key(tenant("Acme", "Tuesday"))
+
+
+def test_cache_hit_binds_tenant_employees():
+    cache = ScheduleCache()
+    first = tenant("Acme")
+    second = tenant("Bolt")
+    first.engine = cache
+    second.engine = cache
+
+    first.generate_weekly_schedule()
+    second.generate_weekly_schedule()
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+    monday = second.daily_schedules["Monday"]
+    assert [e.name for s in monday for e in s.employees] == [
+        e.name.replace("Acme", "Bolt")
+        for s in first.daily_schedules["Monday"]
+        for e in s.employees
+    ]
+    assert list(second.remaining_buildings) == [second.buildings[2]]
+
+
+def test_cached_schedule_matches_default_engine():
+    cache = ScheduleCache()
+    warm = tenant("Warm")
+    warm.engine = cache
+    warm.generate_weekly_schedule()
+    cached = tenant("Acme")
+    cached.engine = cache
+    default = tenant("Acme")
+
+    cached.generate_weekly_schedule()
+    default.generate_weekly_schedule()
+
+    assert cache.hits == 1
+    assert {
+        day: [str(s.building) for s in schedules]
+        for day, schedules in cached.daily_schedules.items()
+    } == {
+        day: [str(s.building) for s in schedules]
+        for day, schedules in default.daily_schedules.items()
+    }
+
+
+def test_lru_eviction():
+    cache = ScheduleCache(maxsize=2)
+    cache.put("a", ())
+    cache.put("b", ())
+    cache.get("a")
+    cache.put("c", ())
+
+    assert cache.get("b") is None
+    assert cache.get("a") == ()
+    assert cache.evictions == 1
+
+
+def test_fifo_eviction():
+    cache = ScheduleCache(maxsize=2, policy="fifo")
+    cache.put("a", ())
+    cache.put("b", ())
+    cache.get("a")
+    cache.put("c", ())
+
+    assert cache.get("a") is None
+    assert len(cache) == 2
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        ScheduleCache(policy="random")
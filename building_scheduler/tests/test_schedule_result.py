@@ -0,0 +1,68 @@
+import pytest
+
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.roster import Roster
+from building_scheduler.schedule_result import ScheduleResult
+from building_scheduler.serializers import iter_assignment_records
+
+
+def buildings():
+    return [CommercialBuilding(), TwoStoreyHome(), SingleStoreyHome(), TwoStoreyHome()]
+
+
+@pytest.fixture
+def both(crew):
+    employees = crew(days_off={"Certified Chelly": ["Monday"]})
+    queue = buildings()
+    default = BuildingScheduler(queue, Roster(employees))
+    default.generate_weekly_schedule()
+    result = ScheduleResult.from_scheduler(BuildingScheduler(queue, Roster(employees)))
+    return default, result
+
+
+def test_daily_schedules_view_matches_scheduler(both):
+    default, result = both
+
+    assert repr(result.daily_schedules) == repr(default.daily_schedules)
+    assert list(result.daily_schedules) == list(default.daily_schedules)
+
+
+def test_day_placements_index_each_day(both):
+    _, result = both
+
+    for day_id, placements in enumerate(result.day_placements):
+        assert all(result.day[result.placement_start[placement]] == day_id for placement in placements)
+    assert sorted(placement for placements in result.day_placements for placement in placements) == list(
+        range(len(result.placement_start))
+    )
+
+
+def test_columns_line_up(both):
+    default, result = both
+
+    records = list(iter_assignment_records(result.iter_schedules()))
+
+    assert len(result) == len(records) == 13
+    assert records == list(
+        iter_assignment_records(
+            (day, schedule)
+            for day, schedules in default.daily_schedules.items()
+            for schedule in schedules
+        )
+    )
+    assert [result.employee_name(row) for row in range(len(result))] == [
+        record["employee"] for record in records
+    ]
+    assert list(result.slot) == [record["slot"] for record in records]
+
+
+def test_columns_export_without_copying(both):
+    _, result = both
+
+    columns = result.columns()
+    result.employee[0] = 7
+
+    assert set(columns) == {"day", "building", "slot", "employee"}
+    assert columns["employee"][0] == 7
+    assert columns["day"].format == result.day.typecode
@@ -148,3 +148,42 @@ def test_schedule_by_building_without_met_requirements():
 
     assert len(schedule) == 0
 
+
+
+class CountingRoster(Roster):
+    def __init__(self, employees):
+        super().__init__(employees)
+        self.feasibility_checks = 0
+
+    def can_staff(self, day, required_workers):
+        self.feasibility_checks += 1
+        return super().can_staff(day, required_workers)
+
+
+def test_rejected_building_type_is_checked_once_per_day():
+    roster = CountingRoster(
+        {Employee(EmployeeRole.CERTIFIED_INSTALLER, "Installer Ian")}
+    )
+    buildings = [CommercialBuilding() for _ in range(20)] + [SingleStoreyHome()]
+    scheduler = BuildingScheduler(buildings, roster)
+
+    schedule = scheduler.generate_daily_schedule("Monday")
+
+    assert [type(s.building) for s in schedule] == [SingleStoreyHome]
+    assert roster.feasibility_checks == 1
+
+
+def test_daily_schedule_stops_when_nothing_left_fits():
+    roster = CountingRoster(
+        {Employee(EmployeeRole.CERTIFIED_INSTALLER, "Installer Ian")}
+    )
+    buildings = [SingleStoreyHome(), TwoStoreyHome()] + [
+        SingleStoreyHome() for _ in range(20)
+    ]
+    scheduler = BuildingScheduler(buildings, roster)
+
+    schedule = scheduler.generate_daily_schedule("Monday")
+
+    assert len(schedule) == 1
+    assert roster.feasibility_checks == 2
+    assert len(scheduler.remaining_buildings) == 21
@@ -137,3 +137,37 @@ def test_most_complex_building_pushes_work_later_in_week():
     assert SingleStoreyHome in [type(s.building) for s in tuesday]
     assert TwoStoreyHome in [type(s.building) for s in tuesday]
 
+
+
+def test_streaming_weekly_schedule_yields_in_day_order():
+    roster = Roster(
+        {
+            Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli", ["Monday"]),
+        }
+    )
+    buildings = [SingleStoreyHome(), SingleStoreyHome()]
+    scheduler = BuildingScheduler(buildings, roster)
+
+    stream = scheduler.iter_weekly_schedule()
+    first_day, first = next(stream)
+
+    assert first_day == "Tuesday"
+    assert first.building is buildings[0]
+    assert first.position == 0
+    assert [day for day, _ in stream] == ["Wednesday"]
+    assert scheduler.daily_schedules["Tuesday"] == []
+    assert scheduler.scheduled_buildings == []
+    assert not scheduler._placements and not scheduler._bookings
+
+
+def test_streaming_can_track_placements_for_repairs():
+    charli = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli")
+    buildings = [SingleStoreyHome(), SingleStoreyHome()]
+    scheduler = BuildingScheduler(buildings, Roster([charli]), track_placements=True)
+
+    for day, building_schedule in scheduler.iter_weekly_schedule():
+        scheduler.daily_schedules[day].append(building_schedule)
+
+    assert scheduler.scheduled_buildings == buildings
+    assert scheduler.add_day_off(charli, "Monday") == ["Monday", "Tuesday", "Wednesday"]
+    assert [s.building for s in scheduler.daily_schedules["Wednesday"]] == [buildings[1]]
@@ -0,0 +1,121 @@
+import pytest
+
+from building_scheduler.building import SingleStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.roster import Roster
+from building_scheduler.selection import HeapSelection, LeastBooked, RoundRobin
+
+
+def installers():
+    return [
+        Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli"),
+        Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Chelly"),
+        Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charles"),
+    ]
+
+
+def booked_names(roster):
+    return {day: sorted(e.name for e in scheduled) for day, scheduled in roster.scheduled.items()}
+
+
+def test_least_booked_spreads_the_week():
+    roster = Roster(installers(), selection=LeastBooked())
+    scheduler = BuildingScheduler([SingleStoreyHome()] * 5, roster)
+
+    scheduler.generate_weekly_schedule()
+
+    names = [s.employees[0].name for day in scheduler.daily_schedules.values() for s in day]
+    assert names == [
+        "Certified Charli",
+        "Certified Chelly",
+        "Certified Charles",
+        "Certified Charli",
+        "Certified Chelly",
+    ]
+
+
+def test_least_booked_counts_released_bookings():
+    employees = installers()
+    roster = Roster(employees, selection=LeastBooked())
+    roster.schedule_employee("Monday")
+    roster.schedule_employee("Tuesday")
+
+    roster.release("Monday", employees[0])
+
+    assert roster.schedule_employee("Wednesday") is employees[0]
+
+
+def test_round_robin_cycles_within_role():
+    employees = installers()
+    roster = Roster(employees, selection=RoundRobin())
+
+    got = [roster.schedule_employee("Monday") for _ in range(3)]
+    got.append(roster.schedule_employee("Tuesday"))
+
+    assert got == employees + [employees[0]]
+
+
+class TwoDayHome(SingleStoreyHome):
+    DURATION = 2
+
+
+def test_least_booked_orders_multi_day_crews():
+    employees = installers()
+    roster = Roster(employees, selection=LeastBooked())
+    scheduler = BuildingScheduler([TwoDayHome() for _ in range(5)], roster)
+
+    scheduler.generate_weekly_schedule()
+
+    assert [s.employees for s in scheduler.daily_schedules["Monday"]] == [[e] for e in employees]
+    assert [s.employees for s in scheduler.daily_schedules["Wednesday"]] == [
+        [employees[0]],
+        [employees[1]],
+    ]
+
+
+def test_round_robin_counts_multi_day_bookings():
+    employees = installers()
+    roster = Roster(employees, selection=RoundRobin())
+
+    crew = roster.staff_span(["Monday", "Tuesday"], [EmployeeRole.CERTIFIED_INSTALLER])
+
+    assert crew == [employees[0]]
+    assert roster.schedule_employee("Wednesday") is employees[1]
+
+
+def test_selection_skips_days_off_and_new_employees():
+    employees = installers()
+    roster = Roster(employees, selection=RoundRobin())
+    roster.set_day_off(employees[0], "Monday")
+    late = Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Cleo")
+    roster.add_employee(late)
+
+    got = [roster.schedule_employee("Monday") for _ in range(3)]
+
+    assert got == [employees[1], employees[2], late]
+
+
+def test_selection_is_deterministic():
+    def run():
+        roster = Roster(installers(), selection=LeastBooked())
+        BuildingScheduler([SingleStoreyHome()] * 7, roster).generate_weekly_schedule()
+        return booked_names(roster)
+
+    assert run() == run()
+
+
+def test_policy_serves_one_roster():
+    selection = LeastBooked()
+    Roster(installers(), selection=selection)
+
+    with pytest.raises(ValueError):
+        Roster(installers(), selection=selection)
+
+
+def test_policy_without_a_key_cannot_be_built():
+    class Unkeyed(HeapSelection):
+        pass
+
+    with pytest.raises(TypeError):
+        Unkeyed()
@@ -0,0 +1,58 @@
+import io
+import json
+
+from building_scheduler.building import SingleStoreyHome, TwoStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.roster import Roster
+from building_scheduler.serializers import (
+    iter_assignment_records,
+    iter_remaining_records,
+    write_jsonl,
+)
+
+
+def test_streamed_schedule_as_json_lines():
+    roster = Roster(
+        {
+            Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli"),
+            Employee(EmployeeRole.LABOURER, "Labourer Liam"),
+        }
+    )
+    scheduler = BuildingScheduler([TwoStoreyHome(), SingleStoreyHome()], roster)
+    output = io.StringIO()
+
+    written = write_jsonl(iter_assignment_records(scheduler.iter_weekly_schedule()), output)
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert written == 3
+    assert lines[0] == {
+        "day": "Monday",
+        "building_index": 0,
+        "building": "Two Storey Home",
+        "slot": 0,
+        "role": "CERTIFIED_INSTALLER",
+        "employee": "Certified Charli",
+    }
+    assert lines[1]["employee"] == "Labourer Liam"
+    assert lines[2]["day"] == "Tuesday"
+    assert lines[2]["building_index"] == 1
+
+
+def test_remaining_buildings_records():
+    roster = Roster(set())
+    scheduler = BuildingScheduler([SingleStoreyHome()], roster)
+    scheduler.generate_weekly_schedule()
+
+    records = list(iter_remaining_records(scheduler.remaining_buildings))
+
+    assert records == [
+        {
+            "day": None,
+            "building_index": 0,
+            "building": "Single Storey Home",
+            "slot": None,
+            "role": None,
+            "employee": None,
+        }
+    ]
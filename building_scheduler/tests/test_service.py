@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import building_scheduler.service as service_module
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.service import ScheduleClient, SchedulingService
+
+
+CREW = [
+    Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli"),
+    Employee(EmployeeRole.LABOURER, "Labourer Liam", ["Monday"]),
+]
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_schedule_over_tcp():
+    async def scenario():
+        async with SchedulingService(executor=ThreadPoolExecutor(2)) as service:
+            async with ScheduleClient(port=service.port) as client:
+                return await client.schedule(["two_storey", "commercial"], CREW)
+
+    response = run(scenario())
+
+    assert response["id"] == 1
+    assert [record["day"] for record in response["schedule"]] == ["Tuesday", "Tuesday"]
+    assert response["remaining"][0]["building"] == "Commercial Building"
+
+
+def test_schedule_over_unix_socket(tmp_path):
+    path = str(tmp_path / "scheduler.sock")
+
+    async def scenario():
+        async with SchedulingService(path=path, executor=ThreadPoolExecutor(1)):
+            async with ScheduleClient(path=path) as client:
+                return await client.schedule(["single_storey"], CREW)
+
+    response = run(scenario())
+
+    assert response["schedule"][0]["employee"] == "Certified Charli"
+
+
+def test_bad_requests_get_errors():
+    async def scenario():
+        async with SchedulingService(executor=ThreadPoolExecutor(1)) as service:
+            async with ScheduleClient(port=service.port) as client:
+                bad_type = await client.schedule(["castle"], CREW)
+                client._writer.write(b"not json\n")
+                bad_json = await client._reader.readline()
+                return bad_type, bad_json
+
+    bad_type, bad_json = run(scenario())
+
+    assert "castle" in bad_type["error"]
+    assert b"Bad request" in bad_json
+
+
+def test_identical_requests_are_coalesced(monkeypatch):
+    release = threading.Event()
+    real_run_job = service_module.run_job
+
+    def slow_run_job(payload):
+        release.wait(5)
+        return real_run_job(payload)
+
+    monkeypatch.setattr(service_module, "run_job", slow_run_job)
+
+    async def scenario():
+        async with SchedulingService(executor=ThreadPoolExecutor(2)) as service:
+            clients = [ScheduleClient(port=service.port) for _ in range(3)]
+            for client in clients:
+                await client.connect()
+            requests = [
+                asyncio.create_task(client.schedule(["single_storey"], CREW))
+                for client in clients
+            ]
+            while service.computations + service.coalesced < 3:
+                await asyncio.sleep(0.01)
+            release.set()
+            responses = await asyncio.gather(*requests)
+            for client in clients:
+                await client.close()
+            return service, responses
+
+    service, responses = run(scenario())
+
+    assert service.computations == 1
+    assert service.coalesced == 2
+    assert all(response["schedule"] == responses[0]["schedule"] for response in responses)
+
+
+def test_full_queue_applies_backpressure(monkeypatch):
+    release = threading.Event()
+    real_run_job = service_module.run_job
+
+    def slow_run_job(payload):
+        release.wait(5)
+        return real_run_job(payload)
+
+    monkeypatch.setattr(service_module, "run_job", slow_run_job)
+
+    async def scenario():
+        service = SchedulingService(max_queue=1, workers=1, executor=ThreadPoolExecutor(1))
+        async with service:
+            clients = [ScheduleClient(port=service.port) for _ in range(3)]
+            for client in clients:
+                await client.connect()
+            requests = [
+                asyncio.create_task(client.schedule([code], CREW))
+                for client, code in zip(clients, ["single_storey", "two_storey", "commercial"])
+            ]
+            while service.computations < 3:
+                await asyncio.sleep(0.01)
+            # One job running, one queued, the third client is held back
+            queued = service._jobs.qsize()
+            release.set()
+            responses = await asyncio.gather(*requests)
+            for client in clients:
+                await client.close()
+            return queued, responses
+
+    queued, responses = run(scenario())
+
+    assert queued == 1
+    assert all("schedule" in response for response in responses)
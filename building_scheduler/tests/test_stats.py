@@ -0,0 +1,75 @@
+from building_scheduler.building import (
+    BuildingRegistry,
+    CommercialBuilding,
+    SingleStoreyHome,
+    TwoStoreyHome,
+)
+from building_scheduler.building_queue import BuildingQueue
+from building_scheduler.building_scheduler import BuildingScheduler
+from building_scheduler.employee import Employee, EmployeeRole
+from building_scheduler.roster import Roster
+from building_scheduler.stats import SchedulerStats
+
+
+def run_week(stats):
+    roster = Roster(
+        [
+            Employee(EmployeeRole.CERTIFIED_INSTALLER, "Certified Charli"),
+            Employee(EmployeeRole.LABOURER, "Labourer Liam", ["Monday"]),
+        ],
+        stats=stats,
+    )
+    buildings = [TwoStoreyHome(), CommercialBuilding(), SingleStoreyHome()]
+    scheduler = BuildingScheduler(buildings, roster, stats=stats)
+    scheduler.generate_weekly_schedule()
+    return scheduler
+
+
+def test_stats_after_weekly_run():
+    stats = SchedulerStats()
+
+    run_week(stats)
+
+    assert stats.employees_scanned >= 2 * 5
+    assert stats.availability_checks > 0
+    assert stats.rejections["CommercialBuilding"] == 5
+    assert stats.rejections["TwoStoreyHome"] == 1
+    assert stats.slots_filled["Monday"] == {"CERTIFIED_INSTALLER": 1}
+    assert stats.slots_filled["Tuesday"] == {"CERTIFIED_INSTALLER": 1, "LABOURER": 1}
+    assert set(stats.day_seconds) == {"Monday", "Tuesday", "Wednesday", "Thursday", "Friday"}
+    assert stats.as_dict()["rejections"] == stats.rejections
+
+
+def test_event_hook():
+    events = []
+    stats = SchedulerStats(on_event=lambda event, fields: events.append((event, fields)))
+
+    run_week(stats)
+
+    assert events[0] == ("day_started", {"day": "Monday"})
+    assert ("building_scheduled", {"day": "Monday", "position": 2}) in events
+    assert ("building_scheduled", {"day": "Tuesday", "position": 0}) in events
+    assert events[-1] == ("day_finished", {"day": "Friday"})
+
+
+def test_rejections_are_labelled_by_signature():
+    registry = BuildingRegistry()
+    registry.adapt(SingleStoreyHome)
+    bungalow = registry.register(
+        "bungalow", SingleStoreyHome().worker_requirements, name="Bungalow"
+    )
+    queue = BuildingQueue(registry=registry)
+    queue.append(SingleStoreyHome())
+    queue.append_type(bungalow.id)
+    stats = SchedulerStats()
+
+    BuildingScheduler(queue, Roster(), stats=stats).generate_weekly_schedule()
+
+    assert stats.rejections == {"SingleStoreyHome / Bungalow": 5}
+
+
+def test_stats_disabled_by_default():
+    scheduler = run_week(None)
+
+    assert scheduler.stats is None
+    assert scheduler.roster.stats is None
@@ -0,0 +1,32 @@
+from building_scheduler.building import CommercialBuilding
+from building_scheduler.employee import EmployeeRole
+from building_scheduler.synthetic import generate_buildings, generate_employees
+
+
+def test_generators_are_seeded():
+    first = generate_employees(50, seed=7)
+    second = generate_employees(50, seed=7)
+
+    assert [(e.role, e.name, e.days_off) for e in first] == [
+        (e.role, e.name, e.days_off) for e in second
+    ]
+    assert [type(b) for b in generate_buildings(50, seed=3)] == [
+        type(b) for b in generate_buildings(50, seed=3)
+    ]
+
+
+def test_role_and_building_mix():
+    employees = generate_employees(
+        20, role_mix={EmployeeRole.LABOURER: 1}, days_off_density=0
+    )
+    buildings = generate_buildings(20, building_mix={"commercial": 1})
+
+    assert {e.role for e in employees} == {EmployeeRole.LABOURER}
+    assert all(e.days_off == () for e in employees)
+    assert {type(b) for b in buildings} == {CommercialBuilding}
+
+
+def test_days_off_density():
+    employees = generate_employees(20, days_off_density=1)
+
+    assert all(len(e.days_off) == 5 for e in employees)
@@ -0,0 +1,112 @@
+import pytest
+
+from building_scheduler.building import CommercialBuilding, SingleStoreyHome, TwoStoreyHome
+from building_scheduler.building_scheduler import BuildingScheduler, DailyBuildingSchedule
+from building_scheduler.employee import EmployeeRole
+from building_scheduler.roster import Roster
+from building_scheduler.validation import (
+    DAY_OFF,
+    DOUBLE_BOOKED,
+    OUT_OF_ORDER,
+    WRONG_CREW_SIZE,
+    WRONG_ROLE,
+    validate_schedule,
+    validate_scheduler,
+)
+
+
+@pytest.fixture
+def employees(crew):
+    return crew(days_off={"Certified Chelly": ["Monday"], "Labourer Lindsay": ["Tuesday"]})
+
+
+def empty_week():
+    return {day: [] for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]}
+
+
+def test_generated_schedule_is_valid(employees):
+    buildings = [CommercialBuilding(), TwoStoreyHome(), SingleStoreyHome(), TwoStoreyHome()] * 3
+    scheduler = BuildingScheduler(buildings, Roster(employees))
+
+    scheduler.generate_weekly_schedule()
+
+    assert validate_scheduler(scheduler) == []
+
+
+def test_reports_double_booking_and_days_off(employees):
+    charli, chelly = employees[:2]
+    buildings = [SingleStoreyHome(), SingleStoreyHome()]
+    week = empty_week()
+    week["Monday"] = [
+        DailyBuildingSchedule(buildings[0], [charli], 0),
+        DailyBuildingSchedule(buildings[1], [charli], 1),
+    ]
+    week["Monday"].append(DailyBuildingSchedule(buildings[1], [chelly], 1))
+
+    got = validate_schedule(week, buildings)
+
+    assert [(v.kind, v.day, v.building_index, v.slot, v.employee) for v in got] == [
+        (DOUBLE_BOOKED, "Monday", 1, 0, "Certified Charli"),
+        (DAY_OFF, "Monday", 1, 0, "Certified Chelly"),
+    ]
+
+
+def test_reports_wrong_roles_and_crew_size(employees):
+    buildings = [TwoStoreyHome(), SingleStoreyHome()]
+    week = empty_week()
+    week["Wednesday"] = [
+        DailyBuildingSchedule(buildings[0], [employees[0], employees[1]], 0),
+        DailyBuildingSchedule(buildings[1], [], 1),
+    ]
+
+    got = validate_schedule(week, buildings)
+
+    assert [(v.kind, v.building_index, v.slot) for v in got] == [
+        (WRONG_ROLE, 0, 1),
+        (WRONG_CREW_SIZE, 1, None),
+    ]
+
+
+def test_reports_priority_order(employees):
+    buildings = [SingleStoreyHome(), TwoStoreyHome(), SingleStoreyHome(), SingleStoreyHome()]
+    week = empty_week()
+    week["Monday"] = [DailyBuildingSchedule(buildings[2], [employees[0]], 2)]
+    week["Tuesday"] = [DailyBuildingSchedule(buildings[3], [employees[0]], 3)]
+    week["Wednesday"] = [DailyBuildingSchedule(buildings[0], [employees[0]], 0)]
+
+    got = validate_schedule(week, buildings)
+
+    assert [(v.kind, v.day, v.building_index) for v in got] == [
+        (OUT_OF_ORDER, "Wednesday", 0),
+    ]
+
+
+def test_checks_worker_requirements_not_the_compiled_cache(employees):
+    class Misreported(SingleStoreyHome):
+        @property
+        def requirements(self):
+            return SingleStoreyHome().requirements
+
+        @property
+        def worker_requirements(self):
+            return (EmployeeRole.CERTIFIED_INSTALLER,) * 3
+
+    charli = employees[0]
+    buildings = [Misreported()]
+    week = empty_week()
+    week["Monday"] = [DailyBuildingSchedule(buildings[0], [charli], 0)]
+
+    got = validate_schedule(week, buildings)
+
+    assert [(v.kind, v.building_index) for v in got] == [(WRONG_CREW_SIZE, 0)]
+
+
+def test_removed_buildings_are_not_out_of_order(employees):
+    buildings = [SingleStoreyHome() for _ in range(3)]
+    scheduler = BuildingScheduler(buildings, Roster(employees[:1]))
+    scheduler.generate_weekly_schedule()
+
+    scheduler.remove_position(0)
+
+    assert scheduler.queue.is_removed(0)
+    assert validate_scheduler(scheduler) == []
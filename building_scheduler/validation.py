@@ -0,0 +1,152 @@
+""" Schedule Validation
+
+An independent check of a finished schedule, fast enough to run inline on
+large outputs before they are published.
+"""
+
+from array import array
+from typing import NamedTuple, Optional
+
+from building_scheduler.building_queue import BuildingQueue
+from building_scheduler.requirements import ROLE_BITS, compile_requirements
+
+DOUBLE_BOOKED = "double_booked"
+DAY_OFF = "day_off"
+WRONG_ROLE = "wrong_role"
+WRONG_CREW_SIZE = "wrong_crew_size"
+OUT_OF_ORDER = "out_of_order"
+
+
+class Violation(NamedTuple):
+    """
+    One problem found in a schedule.  `slot` and `employee` are None for
+    problems with a whole building.
+    """
+
+    kind: str
+    day: object
+    building_index: Optional[int]
+    slot: Optional[int]
+    employee: Optional[str]
+    message: str
+
+
+def validate_schedule(daily_schedules, buildings, roster=None) -> list[Violation]:
+    """
+    Check `daily_schedules` (day -> list of DailyBuildingSchedule, in day
+    order) against the priority-ordered `buildings`, a list or the
+    `BuildingQueue` it was scheduled from.
+
+    Reports every one of:
+
+    - an employee booked twice on one day
+    - an employee working on a day off (the roster's leave counts when
+      `roster` is given)
+    - a slot filled by a role it does not accept, or a crew of the wrong size
+    - a building left unscheduled, or scheduled on a later day, while a later
+      building with the same requirements and duration was scheduled;
+      buildings removed from a `BuildingQueue` are not expected on it
+
+    Requirements are compiled from each building's `worker_requirements`
+    rather than read from the `requirements` the scheduler used, once per
+    distinct list of slots.  One pass over the assignments, plus one over the buildings for priority
+    order.
+    """
+    if isinstance(buildings, BuildingQueue):
+        building_list = buildings.buildings
+        lowest_first = buildings.reversed_priority_order()
+        removed = buildings._removed
+    else:
+        building_list = list(buildings)
+        lowest_first = reversed(range(len(building_list)))
+        removed = bytes(len(building_list))
+    is_off = roster.is_off if roster is not None else _is_day_off
+    day_index = {day: index for index, day in enumerate(daily_schedules)}
+    # Position -> index of the day it starts on, -1 when not scheduled
+    placed_on = array("l", [-1]) * len(building_list)
+    booked = set()
+    violations = []
+
+    for day, building_schedules in daily_schedules.items():
+        for building_schedule in building_schedules:
+            position = building_schedule.position
+            if position is not None:
+                placed_on[position] = day_index[day]
+            requirements = compile_requirements(building_schedule.building.worker_requirements)
+            slot_masks = requirements.slot_masks
+            employees = building_schedule.employees
+            if len(employees) != len(slot_masks):
+                violations.append(
+                    Violation(
+                        WRONG_CREW_SIZE, day, position, None, None,
+                        f"{len(employees)} employees for {len(slot_masks)} slots",
+                    )
+                )
+            for slot, employee in enumerate(employees):
+                if slot < len(slot_masks) and not ROLE_BITS.get(employee.role, 0) & slot_masks[slot]:
+                    violations.append(
+                        Violation(
+                            WRONG_ROLE, day, position, slot, employee.name,
+                            f"{employee.role.name} cannot fill {requirements.slots[slot]}",
+                        )
+                    )
+                for booked_day in building_schedule.days or (day,):
+                    key = (booked_day, employee)
+                    if key in booked:
+                        violations.append(
+                            Violation(
+                                DOUBLE_BOOKED, booked_day, position, slot, employee.name,
+                                f"{employee.name} is booked more than once on {booked_day}",
+                            )
+                        )
+                    booked.add(key)
+                    if is_off(employee, booked_day):
+                        violations.append(
+                            Violation(
+                                DAY_OFF, booked_day, position, slot, employee.name,
+                                f"{employee.name} is off on {booked_day}",
+                            )
+                        )
+
+    violations.extend(
+        _priority_violations(building_list, lowest_first, removed, placed_on, list(daily_schedules))
+    )
+    return violations
+
+
+def validate_scheduler(scheduler) -> list[Violation]:
+    return validate_schedule(scheduler.daily_schedules, scheduler.queue, scheduler.roster)
+
+
+def _is_day_off(employee, day) -> bool:
+    return employee.is_day_off(day)
+
+
+def _priority_violations(
+    buildings: list, lowest_first, removed, placed_on, days: list
+) -> list[Violation]:
+    """
+    Walk buildings from lowest to highest priority, keeping the earliest day
+    any lower-priority building of each signature was scheduled on.  Removed
+    positions are skipped.
+    """
+    earliest_later = {}
+    violations = []
+    for position in lowest_first:
+        if removed[position]:
+            continue
+        building = buildings[position]
+        signature = (compile_requirements(building.worker_requirements), building.duration)
+        day = placed_on[position]
+        later = earliest_later.get(signature)
+        if later is not None and (day == -1 or day > later):
+            where = "unscheduled" if day == -1 else f"scheduled on {days[day]}"
+            violations.append(
+                Violation(
+                    OUT_OF_ORDER, None if day == -1 else days[day], position, None, None,
+                    f"{building} is {where} but a later one was scheduled on {days[later]}",
+                )
+            )
+        if day != -1 and (later is None or day < later):
+            earliest_later[signature] = day
+    return violations
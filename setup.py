@@ -10,5 +10,8 @@ setup(
     install_requires=[
         "pytest"
     ],
+    extras_require={
+        "numpy": ["numpy"],
+    },
     python_requires='>=3.8',
 )